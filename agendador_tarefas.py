@@ -0,0 +1,65 @@
+# ============================================================================
+# AGENDADOR DE TAREFAS COM DEPENDÊNCIAS
+# ============================================================================
+# Arquivo: agendador_tarefas.py
+# Descrição: Executa tarefas num pool limitado de threads. Quando uma tarefa
+#            termina, seu callback roda na thread principal e pode agendar as
+#            tarefas que dependiam dela. Entre as tarefas prontas, as de maior
+#            prioridade saem primeiro, para que as etapas finais de um lote
+#            não fiquem presas atrás de etapas iniciais de outros lotes.
+# ============================================================================
+
+import heapq
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+class AgendadorTarefas:
+    """
+    Uso:
+        agendador = AgendadorTarefas(max_workers=8)
+        agendador.agendar(funcao, arg1, prioridade=0, ao_concluir=callback)
+        agendador.executar()
+
+    `ao_concluir(resultado)` roda na thread que chamou executar(), então pode
+    alterar estado compartilhado e agendar novas tarefas sem locks.
+    Menor `prioridade` sai primeiro; empates seguem a ordem de agendamento.
+    Se a tarefa levantar exceção, `ao_falhar(exc)` é chamado; sem `ao_falhar`,
+    a exceção é propagada por executar().
+    """
+
+    def __init__(self, max_workers, nome="tarefa"):
+        self.max_workers = max(1, max_workers)
+        self.nome = nome
+        self._prontas = []
+        self._sequencia = itertools.count()
+        self.concluidas = 0
+
+    def agendar(self, funcao, *args, prioridade=0, ao_concluir=None, ao_falhar=None):
+        heapq.heappush(self._prontas, (prioridade, next(self._sequencia), funcao, args, ao_concluir, ao_falhar))
+
+    def executar(self):
+        """Roda até não haver tarefas prontas nem em andamento. Retorna o tempo total (s)."""
+        inicio = time.perf_counter()
+        em_andamento = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.nome) as executor:
+            while self._prontas or em_andamento:
+                # Só mantém no pool o que ele pode executar agora: o resto espera
+                # no heap, onde tarefas mais prioritárias ainda podem passar na frente
+                while self._prontas and len(em_andamento) < self.max_workers:
+                    _, _, funcao, args, ao_concluir, ao_falhar = heapq.heappop(self._prontas)
+                    em_andamento[executor.submit(funcao, *args)] = (ao_concluir, ao_falhar)
+
+                feitas, _ = wait(em_andamento, return_when=FIRST_COMPLETED)
+                for futuro in feitas:
+                    ao_concluir, ao_falhar = em_andamento.pop(futuro)
+                    self.concluidas += 1
+                    erro = futuro.exception()
+                    if erro is not None and ao_falhar is not None:
+                        ao_falhar(erro)
+                    elif erro is not None:
+                        raise erro
+                    elif ao_concluir is not None:
+                        ao_concluir(futuro.result())
+        return time.perf_counter() - inicio
@@ -1,13 +1,73 @@
-from sklearn.cluster import DBSCAN
-from sentence_transformers import SentenceTransformer
-import pandas as pd
+# ============================================================================
+# AGRUPAMENTO LOCAL DE NOTÍCIAS POR EMBEDDINGS
+# ============================================================================
+# Arquivo: agrupamento.py
+# Descrição: Agrupa textos por similaridade de cosseno entre embeddings de um
+#            modelo sentence-transformers (servico_embeddings.py, carregado uma
+#            vez e com cache em disco). As dependências de ML são opcionais
+#            (requirements-ml.txt) e só são importadas no primeiro uso: sem
+#            elas, as funções de pré-agrupamento retornam None e o chamador
+#            usa o DeepSeek.
+# ============================================================================
+
+import importlib.util
+
+import numpy as np
+
+from config import limiar_similaridade_agrupamento, limiar_confianca_agrupamento
+from servico_embeddings import obter_servico_embeddings, EMBEDDINGS_DISPONIVEIS as MODELO_DISPONIVEL
+
+# Modelo de embeddings e scikit-learn (DBSCAN) instalados; nenhum dos dois é importado aqui
+EMBEDDINGS_DISPONIVEIS = MODELO_DISPONIVEL and importlib.util.find_spec("sklearn") is not None
+
+
+def calcular_embeddings(textos):
+    """Embeddings normalizados (norma 1), um por texto, ou None sem o modelo"""
+    if not EMBEDDINGS_DISPONIVEIS:
+        return None
+    return obter_servico_embeddings().encode(textos)
 
-def agrupar_noticias_por_similaridade(df, campo_texto='Conteudo', eps=0.5, min_samples=2):
-    modelo = SentenceTransformer('paraphrase-MiniLM-L6-v2')
 
+def pre_agrupar_por_embeddings(textos, limiar=limiar_similaridade_agrupamento,
+                               limiar_confianca=limiar_confianca_agrupamento):
+    """
+    Monta grupos candidatos: textos com similaridade de cosseno >= `limiar` ficam no
+    mesmo grupo (DBSCAN com min_samples=1, ou seja, componentes conexos do grafo).
+
+    Um grupo é ambíguo quando algum par de textos dele tem similaridade abaixo de
+    `limiar_confianca` — típico de grupos formados por encadeamento, que devem ser
+    confirmados ou divididos por quem chamou.
+
+    Returns:
+        (rótulos por texto, começando em 0; conjunto de rótulos ambíguos),
+        ou None se o modelo de embeddings não estiver disponível
+    """
+    textos = list(textos)
+    if not textos:
+        return [], set()
+    embeddings = calcular_embeddings(textos)
+    if embeddings is None:
+        return None
+
+    from sklearn.cluster import DBSCAN
+    rotulos = DBSCAN(eps=1 - limiar, min_samples=1, metric="cosine").fit(embeddings).labels_
+    similaridades = embeddings @ embeddings.T
+
+    ambiguos = set()
+    for rotulo in np.unique(rotulos):
+        membros = np.flatnonzero(rotulos == rotulo)
+        if len(membros) > 1 and similaridades[np.ix_(membros, membros)].min() < limiar_confianca:
+            ambiguos.add(int(rotulo))
+    return rotulos.tolist(), ambiguos
+
+
+def agrupar_noticias_por_similaridade(df, campo_texto='Conteudo', eps=0.5, min_samples=2):
     textos = df[campo_texto].fillna("").tolist()
-    embeddings = modelo.encode(textos)
+    embeddings = calcular_embeddings(textos)
+    if embeddings is None:
+        raise ImportError("sentence-transformers não instalado (pip install -r requirements-ml.txt)")
 
+    from sklearn.cluster import DBSCAN
     clustering = DBSCAN(eps=eps, min_samples=min_samples, metric='cosine').fit(embeddings)
     df['Cluster'] = clustering.labels_
     return df
@@ -0,0 +1,128 @@
+# ============================================================================
+# ARMAZENAMENTO DOS ARQUIVOS INTERMEDIÁRIOS DO PIPELINE (PARQUET / ARROW)
+# ============================================================================
+# Arquivo: armazenamento_etapas.py
+# Descrição: Salva e carrega os DataFrames entre etapas usando os nomes de
+#            arquivo do config.py. Por padrão grava Parquet (ou Arrow IPC) no
+#            lugar do .xlsx; o Excel só é gerado quando pedido, para inspeção.
+#            Uso avulso para exportar etapas já salvas para Excel:
+#                python armazenamento_etapas.py dados/api/Favoritos_Marcas.xlsx
+# ============================================================================
+
+import os
+import sys
+
+import pandas as pd
+
+from config import formato_etapas, exportar_excel_etapas, mmap_etapas
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pyarrow.feather as feather
+    PYARROW_DISPONIVEL = True
+except ImportError:
+    PYARROW_DISPONIVEL = False
+    print("⚠️ pyarrow não instalado. Etapas intermediárias serão salvas em Excel.")
+
+EXTENSOES = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+def caminho_etapa(arq, formato=formato_etapas):
+    """Caminho do arquivo da etapa no formato configurado (troca a extensão .xlsx)"""
+    if formato == "excel" or not PYARROW_DISPONIVEL:
+        return arq
+    return os.path.splitext(arq)[0] + EXTENSOES[formato]
+
+
+def _para_tabela_arrow(df):
+    """
+    Converte o DataFrame em tabela Arrow. Colunas object com tipos misturados
+    (ex.: int e str, listas) viram texto, pois o Arrow exige um tipo por coluna.
+    Nulos são preservados.
+    """
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        pass
+
+    ajustado = df.copy()
+    for coluna in ajustado.columns:
+        if ajustado[coluna].dtype != object:
+            continue
+        if pd.api.types.infer_dtype(ajustado[coluna], skipna=True) in ("string", "empty", "boolean"):
+            continue
+        serie = ajustado[coluna]
+        ajustado[coluna] = serie.where(serie.isna(), serie.astype(str))
+    return pa.Table.from_pandas(ajustado, preserve_index=False)
+
+
+def salvar_etapa(df, arq, exportar_excel=None, formato=formato_etapas):
+    """
+    Salva o DataFrame de uma etapa.
+
+    Args:
+        df: DataFrame da etapa
+        arq: nome do arquivo no config.py (ex.: arq_api_original)
+        exportar_excel: também gera o .xlsx (padrão: config.exportar_excel_etapas)
+        formato: "parquet", "arrow" ou "excel"
+
+    Returns:
+        caminho do arquivo gravado
+    """
+    if exportar_excel is None:
+        exportar_excel = exportar_excel_etapas
+
+    destino = caminho_etapa(arq, formato)
+    os.makedirs(os.path.dirname(destino) or ".", exist_ok=True)
+
+    if destino == arq:
+        df.to_excel(arq, index=False)
+        return arq
+
+    tabela = _para_tabela_arrow(df)
+    if formato == "arrow":
+        # Arrow IPC sem compressão: pode ser lido via memory-map sem cópia
+        feather.write_feather(tabela, destino, compression="uncompressed")
+    else:
+        pq.write_table(tabela, destino)
+
+    if exportar_excel:
+        df.to_excel(arq, index=False)
+    return destino
+
+
+def carregar_etapa(arq, formato=formato_etapas, memory_map=mmap_etapas):
+    """
+    Carrega o DataFrame de uma etapa salvo com salvar_etapa.
+    Se o arquivo no formato configurado não existir, lê o .xlsx (execuções antigas).
+    """
+    origem = caminho_etapa(arq, formato)
+    if origem == arq or not os.path.exists(origem):
+        return pd.read_excel(arq)
+
+    if formato == "arrow":
+        if memory_map:
+            with pa.memory_map(origem, 'r') as fonte:
+                tabela = pa.ipc.open_file(fonte).read_all()
+        else:
+            tabela = feather.read_table(origem, memory_map=False)
+    else:
+        tabela = pq.read_table(origem, memory_map=memory_map)
+    return tabela.to_pandas()
+
+
+def exportar_etapa_excel(arq, formato=formato_etapas):
+    """Gera o .xlsx de uma etapa já salva, para inspeção manual"""
+    df = carregar_etapa(arq, formato)
+    df.to_excel(arq, index=False)
+    print(f"📄 Exportado: {arq} ({len(df)} linhas)")
+    return arq
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python armazenamento_etapas.py <arquivo.xlsx do config.py> [...]")
+        sys.exit(1)
+    for arquivo in sys.argv[1:]:
+        exportar_etapa_excel(arquivo)
@@ -0,0 +1,134 @@
+# ============================================================================
+# CACHE PERSISTENTE DE RESPOSTAS DO LLM (SQLITE)
+# ============================================================================
+# Arquivo: cache_llm.py
+# Descrição: Guarda em disco as respostas da DeepSeek, indexadas pelo hash de
+#            (model, messages, temperature, max_tokens). Só chamadas
+#            determinísticas (temperature 0) são atendidas pelo cache.
+#            Entradas expiram por TTL e as menos usadas são descartadas quando
+#            o cache passa do tamanho máximo.
+# ============================================================================
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from config import arq_cache_llm, cache_llm_ttl_horas, cache_llm_max_entradas
+
+# A cada quantas gravações a limpeza (TTL + tamanho) é executada
+INTERVALO_LIMPEZA = 200
+
+
+def chave_cache(payload):
+    """Hash do que determina a resposta: modelo, mensagens, temperatura e max_tokens"""
+    base = {
+        "model": payload.get("model"),
+        "messages": payload.get("messages"),
+        "temperature": payload.get("temperature"),
+        "max_tokens": payload.get("max_tokens"),
+    }
+    return hashlib.sha256(json.dumps(base, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def cacheavel(payload):
+    """Só respostas determinísticas podem ser reaproveitadas (sem temperatura a API usa 1)"""
+    return payload.get("temperature", 1) == 0
+
+
+class CacheLLM:
+    """Cache SQLite thread-safe de respostas do chat completions"""
+
+    def __init__(self, arquivo=arq_cache_llm, ttl_horas=cache_llm_ttl_horas, max_entradas=cache_llm_max_entradas):
+        self.arquivo = arquivo
+        self.ttl_segundos = ttl_horas * 3600
+        self.max_entradas = max_entradas
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.gravacoes = 0
+        self.removidas = 0
+
+        os.makedirs(os.path.dirname(arquivo) or ".", exist_ok=True)
+        self._conexao = sqlite3.connect(arquivo, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("""
+            CREATE TABLE IF NOT EXISTS respostas (
+                chave TEXT PRIMARY KEY,
+                resposta TEXT NOT NULL,
+                criado_em REAL NOT NULL,
+                acessado_em REAL NOT NULL
+            )
+        """)
+        self._conexao.execute("CREATE INDEX IF NOT EXISTS idx_acessado_em ON respostas (acessado_em)")
+        self._conexao.commit()
+        self.limpar()
+
+    def obter(self, payload):
+        """Resposta guardada para o payload, ou None (também None para chamadas não determinísticas)"""
+        if not cacheavel(payload):
+            return None
+        chave = chave_cache(payload)
+        agora = time.time()
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT resposta, criado_em FROM respostas WHERE chave = ?", (chave,)
+            ).fetchone()
+            if linha is None or agora - linha[1] > self.ttl_segundos:
+                self.misses += 1
+                return None
+            self._conexao.execute("UPDATE respostas SET acessado_em = ? WHERE chave = ?", (agora, chave))
+            self._conexao.commit()
+            self.hits += 1
+        return json.loads(linha[0])
+
+    def gravar(self, payload, resposta):
+        if not cacheavel(payload):
+            return
+        agora = time.time()
+        with self._lock:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO respostas (chave, resposta, criado_em, acessado_em) VALUES (?, ?, ?, ?)",
+                (chave_cache(payload), json.dumps(resposta, ensure_ascii=False), agora, agora)
+            )
+            self._conexao.commit()
+            self.gravacoes += 1
+            limpar = self.gravacoes % INTERVALO_LIMPEZA == 0
+        if limpar:
+            self.limpar()
+
+    def limpar(self):
+        """Remove entradas expiradas e, acima do tamanho máximo, as acessadas há mais tempo"""
+        with self._lock:
+            limite = time.time() - self.ttl_segundos
+            removidas = self._conexao.execute("DELETE FROM respostas WHERE criado_em < ?", (limite,)).rowcount
+            total = self._conexao.execute("SELECT COUNT(*) FROM respostas").fetchone()[0]
+            excesso = total - self.max_entradas
+            if excesso > 0:
+                removidas += self._conexao.execute(
+                    "DELETE FROM respostas WHERE chave IN "
+                    "(SELECT chave FROM respostas ORDER BY acessado_em ASC LIMIT ?)", (excesso,)
+                ).rowcount
+            self._conexao.commit()
+            self.removidas += removidas
+
+    def estatisticas(self):
+        with self._lock:
+            total = self._conexao.execute("SELECT COUNT(*) FROM respostas").fetchone()[0]
+        consultas = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "taxa_acerto": round(self.hits / consultas, 3) if consultas else 0.0,
+            "gravacoes": self.gravacoes,
+            "removidas": self.removidas,
+            "entradas": total,
+        }
+
+    def imprimir_estatisticas(self):
+        e = self.estatisticas()
+        print(f"🗄️ Cache LLM: {e['hits']} hit(s), {e['misses']} miss(es) "
+              f"(acerto {e['taxa_acerto']:.0%}), {e['gravacoes']} gravação(ões), "
+              f"{e['removidas']} removida(s), {e['entradas']} entrada(s) em disco")
@@ -0,0 +1,229 @@
+# ============================================================================
+# CLIENTE COMPARTILHADO DA API DEEPSEEK
+# ============================================================================
+# Arquivo: cliente_deepseek.py
+# Descrição: Sessão HTTP com conexões persistentes (keep-alive), limite de
+#            requisições simultâneas e controle de taxa (token bucket) para a
+#            cota da DeepSeek. A taxa é adaptativa (AIMD): cai pela metade a
+#            cada 429/503, respeitando o Retry-After para todas as threads, e
+#            volta a subir aos poucos a cada resposta bem-sucedida. Permite
+#            disparar várias chamadas em paralelo recebendo os resultados na
+#            mesma ordem da entrada. Chamadas com temperature 0 passam pelo
+#            cache persistente (cache_llm.py).
+# ============================================================================
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import DEEPSEEK_API_URL, deepseek_max_concorrencia, deepseek_requisicoes_por_segundo, \
+    deepseek_rajada, deepseek_timeout, cache_llm_ativo, deepseek_taxa_minima, deepseek_incremento_taxa, \
+    deepseek_fator_reducao_taxa, deepseek_max_tentativas_limite, deepseek_espera_limite
+from cache_llm import CacheLLM
+
+
+class BaldeTokens:
+    """Token bucket: libera até `taxa` requisições por segundo, com rajadas de até `capacidade`"""
+
+    def __init__(self, taxa, capacidade):
+        self.taxa = float(taxa)
+        self.capacidade = float(capacidade)
+        self.tokens = float(capacidade)
+        self.ultimo = time.monotonic()
+        self._lock = threading.Lock()
+
+    def adquirir(self):
+        while True:
+            with self._lock:
+                agora = time.monotonic()
+                self.tokens = min(self.capacidade, self.tokens + (agora - self.ultimo) * self.taxa)
+                self.ultimo = agora
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                espera = (1 - self.tokens) / self.taxa
+            time.sleep(espera)
+
+
+# Respostas que indicam cota/sobrecarga: a requisição é repetida após esperar
+STATUS_LIMITE = (429, 503)
+
+
+def segundos_retry_after(valor):
+    """Segundos pedidos pelo cabeçalho Retry-After (número ou data HTTP), ou None"""
+    if not valor:
+        return None
+    try:
+        return max(0.0, float(valor))
+    except ValueError:
+        pass
+    try:
+        data = parsedate_to_datetime(valor)
+    except (TypeError, ValueError):
+        return None
+    if data.tzinfo is None:
+        data = data.replace(tzinfo=timezone.utc)
+    return max(0.0, (data - datetime.now(timezone.utc)).total_seconds())
+
+
+class ControleTaxaAdaptativo(BaldeTokens):
+    """
+    Token bucket com taxa ajustada pelas respostas da API (AIMD):
+    cada sucesso soma `incremento` à taxa (até `taxa_maxima`); cada 429/503
+    multiplica a taxa por `fator_reducao` (até `taxa_minima`) e suspende
+    todas as requisições até o fim da espera pedida.
+    """
+
+    def __init__(self, taxa_maxima, capacidade, taxa_minima=deepseek_taxa_minima,
+                 incremento=deepseek_incremento_taxa, fator_reducao=deepseek_fator_reducao_taxa):
+        super().__init__(taxa_maxima, capacidade)
+        self.taxa_maxima = float(taxa_maxima)
+        self.taxa_minima = min(float(taxa_minima), self.taxa_maxima)
+        self.incremento = float(incremento)
+        self.fator_reducao = float(fator_reducao)
+        self.pausado_ate = 0.0
+        self.limites_recebidos = 0
+
+    def adquirir(self):
+        while True:
+            with self._lock:
+                espera = self.pausado_ate - time.monotonic()
+            if espera <= 0:
+                break
+            time.sleep(espera)
+        super().adquirir()
+
+    def registrar_sucesso(self):
+        with self._lock:
+            self.taxa = min(self.taxa_maxima, self.taxa + self.incremento)
+
+    def registrar_limite(self, espera):
+        """Reduz a taxa e pausa todas as threads por `espera` segundos"""
+        with self._lock:
+            self.limites_recebidos += 1
+            self.taxa = max(self.taxa_minima, self.taxa * self.fator_reducao)
+            # Sem rajada acumulada na retomada: o balde recomeça vazio
+            self.tokens = 0.0
+            self.pausado_ate = max(self.pausado_ate, time.monotonic() + espera)
+            self.ultimo = max(self.ultimo, self.pausado_ate)
+            return self.taxa
+
+
+class ClienteDeepSeek:
+    """
+    Cliente thread-safe da DeepSeek.
+
+    Args:
+        api_key: chave da API
+        max_concorrencia: máximo de requisições em andamento ao mesmo tempo
+        requisicoes_por_segundo: taxa máxima do token bucket (a taxa real se adapta aos 429)
+        rajada: quantas requisições podem sair de uma vez antes de a taxa valer
+        timeout: timeout padrão de cada requisição (segundos)
+        url: endpoint de chat completions
+        cache: CacheLLM usado nas chamadas determinísticas (None desliga)
+    """
+
+    def __init__(self, api_key, max_concorrencia=deepseek_max_concorrencia,
+                 requisicoes_por_segundo=deepseek_requisicoes_por_segundo,
+                 rajada=deepseek_rajada, timeout=deepseek_timeout, url=DEEPSEEK_API_URL, cache=None):
+        self.max_concorrencia = max_concorrencia
+        self.timeout = timeout
+        self.url = url
+        self.cache = cache
+        self.sessao = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=1, pool_maxsize=max_concorrencia)
+        self.sessao.mount("https://", adaptador)
+        self.sessao.mount("http://", adaptador)
+        self.sessao.headers.update({
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}"
+        })
+        self._semaforo = threading.BoundedSemaphore(max_concorrencia)
+        self._balde = ControleTaxaAdaptativo(requisicoes_por_segundo, rajada)
+
+    def chat(self, data, timeout=None):
+        """
+        Envia um payload de chat completions e devolve o JSON da resposta.
+        Respostas 429/503 são repetidas aqui mesmo (até deepseek_max_tentativas_limite
+        vezes), depois de esperar o Retry-After ou um backoff exponencial.
+        Demais erros HTTP são levantados (raise_for_status) para o chamador tratar.
+        """
+        if self.cache is not None:
+            resposta = self.cache.obter(data)
+            if resposta is not None:
+                return resposta
+
+        for tentativa in range(deepseek_max_tentativas_limite + 1):
+            with self._semaforo:
+                self._balde.adquirir()
+                response = self.sessao.post(self.url, json=data, timeout=timeout or self.timeout)
+            if response.status_code not in STATUS_LIMITE or tentativa == deepseek_max_tentativas_limite:
+                break
+            espera = segundos_retry_after(response.headers.get("Retry-After"))
+            if espera is None:
+                espera = deepseek_espera_limite * 2 ** tentativa
+            taxa = self._balde.registrar_limite(espera)
+            print(f"🚦 DeepSeek respondeu {response.status_code}: aguardando {espera:.1f}s "
+                  f"(taxa reduzida para {taxa:.2f} req/s)")
+            # A espera acontece no próximo adquirir(), fora do semáforo
+
+        response.raise_for_status()
+        resposta = response.json()
+        self._balde.registrar_sucesso()
+
+        if self.cache is not None:
+            self.cache.gravar(data, resposta)
+        return resposta
+
+    def conteudo(self, data, timeout=None):
+        """Texto da primeira escolha da resposta, sem espaços nas pontas"""
+        return self.chat(data, timeout)["choices"][0]["message"]["content"].strip()
+
+    def mapear(self, funcao, itens, max_workers=None):
+        """
+        Aplica `funcao` a cada item em paralelo e devolve os resultados na ordem dos itens.
+        O número real de requisições simultâneas continua limitado pelo semáforo do cliente.
+        """
+        itens = list(itens)
+        if not itens:
+            return []
+        workers = max(1, min(max_workers or self.max_concorrencia, len(itens)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="deepseek") as executor:
+            return list(executor.map(funcao, itens))
+
+
+_clientes = {}
+_cache = None
+_lock_clientes = threading.Lock()
+
+
+def obter_cache_llm():
+    """Cache de respostas compartilhado por todos os clientes, ou None se desligado"""
+    global _cache
+    if not cache_llm_ativo:
+        return None
+    with _lock_clientes:
+        if _cache is None:
+            _cache = CacheLLM()
+        return _cache
+
+
+def obter_cliente_deepseek(api_key, url=DEEPSEEK_API_URL):
+    """Cliente compartilhado por chave de API (mesmo pool de conexões e mesma cota)"""
+    cache = obter_cache_llm()
+    with _lock_clientes:
+        cliente = _clientes.get((api_key, url))
+        if cliente is None:
+            cliente = ClienteDeepSeek(api_key, url=url, cache=cache)
+            _clientes[(api_key, url)] = cliente
+        return cliente
+
+
+def imprimir_estatisticas_cache():
+    if _cache is not None:
+        _cache.imprimir_estatisticas()
@@ -7,12 +7,84 @@ load_dotenv()
 # DeepSeek config
 DEEPSEEK_API_URL = "https://api.deepseek.com/v1/chat/completions"
 #DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
+# Cliente compartilhado (cliente_deepseek.py): requisições simultâneas, taxa média e rajada
+deepseek_max_concorrencia = 8
+deepseek_requisicoes_por_segundo = 5
+deepseek_rajada = 10
+deepseek_timeout = 60
+# Taxa adaptativa (AIMD): cada 429/503 multiplica a taxa pelo fator de redução; cada sucesso soma o incremento
+deepseek_taxa_minima = 0.5
+deepseek_incremento_taxa = 0.1
+deepseek_fator_reducao_taxa = 0.5
+# Repetições de uma requisição limitada (429/503) e espera-base quando não vem Retry-After (dobra a cada repetição)
+deepseek_max_tentativas_limite = 5
+deepseek_espera_limite = 2
+# Cache persistente de respostas (só chamadas com temperature 0)
+cache_llm_ativo = True
+arq_cache_llm = "dados/api/cache_llm.sqlite"
+cache_llm_ttl_horas = 72
+cache_llm_max_entradas = 20000
+# Resumos de setor: prompts disparados em paralelo pelo cliente compartilhado (False = um por vez)
+resumos_setor_concorrentes = True
+# Reclassificação POLÍTICA -> JUSTIÇA (caso Bolsonaro): só chama o DeepSeek se a notícia citar o
+# ex-presidente e algum termo judicial; as demais continuam POLÍTICA sem chamada
+prefiltro_bolsonaro_ativo = True
+# Na mesma chamada da reclassificação, pede também o resumo de 90 palavras (JSON), evitando
+# reenviar o texto inteiro na etapa de resumos. A chamada combinada usa temperatura 0 para manter a
+# classificação determinística e cacheável; em troca, o resumo dessas notícias sai com temperatura 0
+# (e não 0.7 como na etapa de resumos). Use False para manter a temperatura original do resumo
+reclassificacao_com_resumo = True
+# Sanitização de datas dos resumos (sanitizador_datas.py): imprime cada alteração quando True
+log_sanitizacao_datas = False
+# Relevância de marcas: várias notícias (cada uma com todas as suas marcas) por prompt, respeitando o limite de caracteres
+relevancia_em_lote = True
+max_itens_lote_relevancia = 20
+# Agrupamento dos resumos de uma marca: pré-agrupamento local por embeddings (requirements-ml.txt).
+# O DeepSeek só confirma ou divide os grupos ambíguos, com no máximo max_resumos_prompt_agrupamento por prompt
+agrupamento_embeddings_ativo = True
+# Serviço de embeddings (servico_embeddings.py): backend "torch", "onnx" ou "onnx-int8" (requer optimum[onnxruntime])
+modelo_embeddings = "paraphrase-MiniLM-L6-v2"
+backend_embeddings = "torch"
+tamanho_lote_embeddings = 64
+cache_embeddings_ativo = True
+arq_cache_embeddings = "dados/api/cache_embeddings.sqlite"
+limiar_similaridade_agrupamento = 0.6
+limiar_confianca_agrupamento = 0.8
+max_resumos_prompt_agrupamento = 30
 
 # Pastas
 pasta_api = "dados/api"
 pasta_marca_setor = "dados/marca_setor"
 pasta_output = "output"
 
+# Arquivos de configuração das APIs de clipping (Boxnet) por categoria
+api_configs_marca = "dados/config/api_marca_configs.json"
+api_configs_setor = "dados/config/api_setor_configs.json"
+api_configs_editorial = "dados/config/api_editorial_configs.json"
+api_configs_SPECIALS = "dados/config/api_SPECIALS_configs.json"
+# Máximo de consultas simultâneas às APIs de clipping (todas as categorias juntas)
+max_consultas_simultaneas_api = 8
+# Decodifica as respostas das APIs em streaming, direto para colunas (menos memória)
+ingestao_streaming = True
+# Ingestão incremental: registro de (Id, Canais) já processados, com hash do conteúdo
+ingestao_incremental = True
+arq_ids_processados = os.path.join(pasta_api, "ids_processados.json")
+dias_retencao_ids_processados = 2
+# Quase-duplicatas (mesma matéria em vários veículos): MinHash + LSH sobre Titulo + Conteudo.
+# As cópias seguem no pipeline com o IdRepresentante; o DeepSeek só é chamado para o representante
+deteccao_quase_duplicatas = True
+limiar_quase_duplicatas = 0.8
+minhash_permutacoes = 128
+lsh_bandas = 16
+tamanho_shingle = 5
+
+# Arquivos intermediários entre etapas: "parquet", "arrow" (IPC, lido via memory-map) ou "excel".
+# Os nomes abaixo (arq_*) continuam .xlsx; a extensão é trocada conforme o formato.
+formato_etapas = "parquet"
+# Gera também o .xlsx de cada etapa (para inspeção manual)
+exportar_excel_etapas = False
+mmap_etapas = True
+
 # Arquivo de Favoritos gerado pela API - ORIGINAL
 favoritos_marca = "Favoritos_Marcas.xlsx"
 arq_api_original = os.path.join(pasta_api, favoritos_marca)
@@ -53,6 +125,10 @@ arq_api_editorial = os.path.join(pasta_api, favoritos_small_editorial)
 favoritos_small_SPECIALS = "Favoritos_SPECIALS_small.xlsx"
 arq_api_SPECIALS = os.path.join(pasta_api, favoritos_small_SPECIALS)
 
+# ShortURLs por notícia (gerado no resumo de marcas)
+shorturls_por_id = "shorturls_por_id.xlsx"
+arq_shorturls = os.path.join(pasta_api, shorturls_por_id)
+
 # Arquivo TXT de saída com os resumos
 resumos = "resumos_marcas.txt"
 arq_resumos = os.path.join(pasta_marca_setor, resumos)
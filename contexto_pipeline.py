@@ -0,0 +1,68 @@
+# ============================================================================
+# CONTEXTO DO PIPELINE (DATAFRAMES EM MEMÓRIA ENTRE ETAPAS)
+# ============================================================================
+# Arquivo: contexto_pipeline.py
+# Descrição: Carrega os DataFrames de uma etapa para a próxima sem reler do
+#            disco. A gravação em disco (checkpoint) roda em segundo plano,
+#            numa thread dedicada, e não bloqueia o processamento.
+# ============================================================================
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from armazenamento_etapas import salvar_etapa, carregar_etapa
+
+
+class ContextoPipeline:
+    """
+    Guarda os DataFrames de cada etapa, indexados pelos nomes de arquivo do config.py
+    (arq_api_original, arq_results, ...), e agenda o checkpoint em disco de cada um.
+    """
+
+    def __init__(self, checkpoint_em_disco=True):
+        self.frames = {}
+        self.checkpoint_em_disco = checkpoint_em_disco
+        # Uma única thread: os checkpoints são gravados na ordem em que foram registrados
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint") if checkpoint_em_disco else None
+        self._checkpoints = []
+
+    def registrar(self, arq, df):
+        """
+        Guarda uma cópia do DataFrame da etapa e agenda a gravação em disco.
+        A cópia é o estado da etapa no momento do registro: alterações posteriores
+        em df (pelas etapas seguintes) não afetam obter() nem o checkpoint.
+        """
+        instantaneo = df.copy()
+        self.frames[arq] = instantaneo
+        if self._executor is not None:
+            # Mesma cópia: ninguém fora do contexto tem referência a ela
+            futuro = self._executor.submit(salvar_etapa, instantaneo, arq)
+            self._checkpoints.append((arq, futuro))
+        return df
+
+    def obter(self, arq):
+        """
+        Cópia do DataFrame da etapa; se não estiver em memória, lê o último checkpoint em disco.
+        Devolve cópia para que quem altera o resultado não mude o estado guardado (nem o que
+        ainda está sendo gravado em segundo plano).
+        """
+        if arq not in self.frames:
+            self.frames[arq] = carregar_etapa(arq)
+        return self.frames[arq].copy()
+
+    def aguardar_checkpoints(self):
+        """Espera todas as gravações pendentes terminarem e informa as que falharam"""
+        if self._executor is None:
+            return
+        inicio = time.perf_counter()
+        falhas = 0
+        for arq, futuro in self._checkpoints:
+            try:
+                futuro.result()
+            except Exception as e:
+                falhas += 1
+                print(f"⚠️ Falha no checkpoint de {arq}: {e}")
+        self._checkpoints = []
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        print(f"💾 Checkpoints em disco concluídos (espera final: {time.perf_counter() - inicio:.2f}s, falhas: {falhas})")
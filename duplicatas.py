@@ -0,0 +1,131 @@
+# ============================================================================
+# DETECÇÃO DE QUASE-DUPLICATAS (MINHASH + LSH)
+# ============================================================================
+# Arquivo: duplicatas.py
+# Descrição: A mesma matéria de agência aparece em vários veículos com pequenas
+#            diferenças (título, assinatura, rodapé). Cada notícia vira uma
+#            assinatura MinHash dos shingles de palavras de Titulo + Conteudo;
+#            o LSH por bandas encontra os pares candidatos, confirmados pela
+#            similaridade de Jaccard estimada. Cada grupo de cópias recebe o Id
+#            do primeiro registro como IdRepresentante. Nenhuma linha é
+#            removida: quem chama decide o que pagar uma vez só por matéria.
+# ============================================================================
+
+import re
+import time
+import zlib
+
+import numpy as np
+
+from config import deteccao_quase_duplicatas, limiar_quase_duplicatas, minhash_permutacoes, lsh_bandas, \
+    tamanho_shingle
+
+# Primo maior que 2**32: (a * x + b) % PRIMO com a, b, x < 2**32 cabe em uint64 sem estouro
+PRIMO = np.uint64(4294967311)
+_PALAVRAS = re.compile(r"\w+")
+
+
+def _parametros_hash(num_perm, semente=1):
+    gerador = np.random.default_rng(semente)
+    a = gerador.integers(1, 2 ** 32, size=num_perm, dtype=np.uint64)
+    b = gerador.integers(0, 2 ** 32, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def hashes_shingles(texto, k=tamanho_shingle):
+    """Hashes (crc32) dos shingles de k palavras do texto, sem repetição"""
+    palavras = _PALAVRAS.findall(str(texto).lower())
+    if not palavras:
+        return np.zeros(0, dtype=np.uint64)
+    if len(palavras) <= k:
+        shingles = {" ".join(palavras)}
+    else:
+        shingles = {" ".join(palavras[i:i + k]) for i in range(len(palavras) - k + 1)}
+    return np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+
+def assinaturas_minhash(textos, num_perm=minhash_permutacoes, k=tamanho_shingle):
+    """
+    Matriz (textos x num_perm) de assinaturas MinHash.
+    Textos sem palavras ficam com a linha toda em PRIMO (não coincidem com nada).
+    """
+    a, b = _parametros_hash(num_perm)
+    assinaturas = np.full((len(textos), num_perm), PRIMO, dtype=np.uint64)
+    for i, texto in enumerate(textos):
+        h = hashes_shingles(texto, k)
+        if len(h):
+            assinaturas[i] = ((a[:, None] * h[None, :] + b[:, None]) % PRIMO).min(axis=1)
+    return assinaturas
+
+
+def agrupar_quase_duplicatas(textos, limiar=limiar_quase_duplicatas, num_perm=minhash_permutacoes,
+                             bandas=lsh_bandas, k=tamanho_shingle):
+    """
+    Posição do representante (primeira cópia, na ordem de entrada) de cada texto.
+    Textos sem quase-duplicatas são representantes de si mesmos.
+    """
+    textos = list(textos)
+    n = len(textos)
+    pais = np.arange(n)
+    if n < 2:
+        return pais
+
+    assinaturas = assinaturas_minhash(textos, num_perm, k)
+    vazios = (assinaturas == PRIMO).all(axis=1)
+    linhas = num_perm // bandas
+
+    def raiz(i):
+        while pais[i] != i:
+            pais[i] = pais[pais[i]]
+            i = pais[i]
+        return i
+
+    # Pares candidatos: textos que coincidem em todas as linhas de pelo menos uma banda
+    for banda in range(bandas):
+        baldes = {}
+        fatia = assinaturas[:, banda * linhas:(banda + 1) * linhas]
+        for i in np.flatnonzero(~vazios):
+            baldes.setdefault(fatia[i].tobytes(), []).append(i)
+        for membros in baldes.values():
+            for pos, j in enumerate(membros):
+                for i in membros[:pos]:
+                    ri, rj = raiz(i), raiz(j)
+                    if ri == rj:
+                        continue
+                    # Confirmação pela similaridade de Jaccard estimada (fração de minhashes iguais)
+                    if (assinaturas[i] == assinaturas[j]).mean() >= limiar:
+                        pais[max(ri, rj)] = min(ri, rj)
+
+    return np.array([raiz(i) for i in range(n)])
+
+
+def marcar_quase_duplicatas(df, campo_id='Id', campos_texto=('Titulo', 'Conteudo')):
+    """
+    Adiciona a coluna IdRepresentante: o Id da primeira cópia da mesma matéria.
+    Com a detecção desligada, cada notícia representa a si mesma.
+    """
+    df = df.copy()
+    if not deteccao_quase_duplicatas or df.empty:
+        df['IdRepresentante'] = df[campo_id]
+        return df
+
+    inicio = time.perf_counter()
+    textos = df[list(campos_texto)].fillna('').astype(str).agg(' '.join, axis=1).tolist()
+    representantes = agrupar_quase_duplicatas(textos)
+    df['IdRepresentante'] = df[campo_id].to_numpy()[representantes]
+
+    copias = int((representantes != np.arange(len(df))).sum())
+    materias = len(np.unique(representantes[representantes != np.arange(len(df))]))
+    print(f"🧬 Quase-duplicatas: {copias} cópia(s) de {materias} matéria(s) em {len(df)} notícias "
+          f"({time.perf_counter() - inicio:.2f}s)")
+    return df
+
+
+def chave_materia(df):
+    """Coluna que identifica a matéria: IdRepresentante se presente, senão o próprio Id"""
+    return df['IdRepresentante'] if 'IdRepresentante' in df.columns else df['Id']
+
+
+def ids_por_materia(df, campo='Id'):
+    """Valores de campo (Ids, por padrão) de todas as cópias de cada matéria, separados por vírgula, alinhados às linhas de df"""
+    return df[campo].astype(str).groupby(chave_materia(df)).transform(lambda ids: ','.join(dict.fromkeys(ids)))
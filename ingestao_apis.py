@@ -0,0 +1,333 @@
+# ============================================================================
+# INGESTÃO CONCORRENTE DAS APIs DE CLIPPING (BOXNET)
+# ============================================================================
+# Arquivo: ingestao_apis.py
+# Descrição: Consulta em paralelo todas as configurações de API de MARCAS,
+#            SETOR, EDITORIAIS e SPECIALS, mantendo retry/backoff por endpoint
+#            e registrando a latência de cada consulta. As respostas são
+#            decodificadas em streaming direto para colunas do DataFrame.
+# ============================================================================
+
+import codecs
+import json
+import time
+import requests
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+from config import max_consultas_simultaneas_api, ingestao_streaming
+
+# Tamanho de cada bloco lido da resposta HTTP no modo streaming
+TAMANHO_BLOCO_STREAMING = 64 * 1024
+
+# Colunas usadas pelas etapas de limpeza; vêm primeiro no DataFrame e
+# existem mesmo quando a API não as retorna
+COLUNAS_PRINCIPAIS = ['Id', 'Titulo', 'Conteudo', 'Canais', 'IdVeiculo', 'DataVeiculacao']
+
+
+def carregar_configs(caminho_json):
+    with open(caminho_json, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# ============================================================================
+# DECODIFICAÇÃO EM STREAMING (lista JSON -> colunas)
+# ============================================================================
+
+def _montar_dataframe(colunas, total):
+    """Monta o DataFrame a partir das listas por coluna, com tipos definidos"""
+    for nome in COLUNAS_PRINCIPAIS:
+        colunas.setdefault(nome, [None] * total)
+
+    ordem = COLUNAS_PRINCIPAIS + [c for c in colunas if c not in COLUNAS_PRINCIPAIS]
+    df = pd.DataFrame({nome: colunas.pop(nome) for nome in ordem})
+
+    # Ids numéricos viram inteiros (nulos preservados); texto fica como object
+    for nome in ('Id', 'IdVeiculo'):
+        numeros = pd.to_numeric(df[nome], errors='coerce')
+        if numeros.notna().sum() == df[nome].notna().sum():
+            df[nome] = numeros.astype('int64') if numeros.notna().all() else numeros.astype('Int64')
+    return df
+
+
+def decodificar_resposta_streaming(response, transformar_registro=None, tamanho_bloco=TAMANHO_BLOCO_STREAMING):
+    """
+    Lê a resposta HTTP em blocos e decodifica a lista JSON registro a registro,
+    acumulando cada campo direto na sua coluna. Não cria a lista intermediária
+    de dicionários: só um registro decodificado existe por vez.
+
+    Args:
+        response: resposta do requests aberta com stream=True
+        transformar_registro: função opcional aplicada a cada registro
+        tamanho_bloco: bytes lidos por vez
+
+    Returns:
+        DataFrame com as colunas da API (COLUNAS_PRINCIPAIS primeiro)
+    """
+    decodificador_json = json.JSONDecoder()
+    decodificador_utf8 = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    blocos = response.iter_content(chunk_size=tamanho_bloco)
+
+    colunas = {}
+    total = 0
+    buffer = ""
+    pos = 0
+    fim_stream = False
+    inicio_lista = False
+
+    def ler_mais():
+        nonlocal buffer, pos, fim_stream
+        bloco = next(blocos, None)
+        if bloco is None:
+            buffer = buffer[pos:] + decodificador_utf8.decode(b"", final=True)
+            fim_stream = True
+        else:
+            buffer = buffer[pos:] + decodificador_utf8.decode(bloco)
+        pos = 0
+
+    while True:
+        # Pular espaços e separadores entre registros
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(buffer):
+            if fim_stream:
+                raise ValueError("Resposta JSON terminou antes do fim da lista")
+            ler_mais()
+            continue
+
+        if not inicio_lista:
+            if buffer[pos] != '[':
+                # Resposta não é uma lista: decodifica inteira (formato inesperado)
+                while not fim_stream:
+                    ler_mais()
+                dados = json.loads(buffer[pos:])
+                if transformar_registro is not None and isinstance(dados, list):
+                    dados = [transformar_registro(r) for r in dados]
+                return pd.DataFrame(dados)
+            inicio_lista = True
+            pos += 1
+            continue
+
+        if buffer[pos] == ']':
+            break
+
+        try:
+            registro, pos = decodificador_json.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if fim_stream:
+                raise
+            ler_mais()  # registro incompleto: ler o próximo bloco e tentar de novo
+            continue
+
+        if transformar_registro is not None:
+            try:
+                registro = transformar_registro(registro)
+            except Exception as e:
+                print(f"  ⚠️ Erro ao transformar registro: {str(e)[:100]}. Usando registro original.")
+
+        for nome, valor in registro.items():
+            coluna = colunas.get(nome)
+            if coluna is None:
+                coluna = colunas[nome] = [None] * total
+            coluna.append(valor)
+        total += 1
+        for coluna in colunas.values():
+            if len(coluna) < total:
+                coluna.append(None)
+
+    return _montar_dataframe(colunas, total)
+
+
+# ============================================================================
+# CONSULTA DE UM ENDPOINT (com retry e timeouts progressivos)
+# ============================================================================
+
+def consultar_endpoint(config, rotulo="", max_tentativas=3, timeout_base=30, transformar_registro=None,
+                       streaming=ingestao_streaming):
+    """
+    Consulta um único endpoint com retry automático e timeouts progressivos.
+
+    Args:
+        config: dicionário com "url" e "data" da API
+        rotulo: identificação usada nos logs (ex: "MARCAS 1/2")
+        max_tentativas: número máximo de tentativas
+        timeout_base: timeout da primeira tentativa (segundos)
+        transformar_registro: função opcional aplicada a cada registro retornado
+        streaming: decodifica a resposta em blocos direto para colunas
+
+    Returns:
+        (DataFrame ou None, dicionário com métricas da consulta)
+    """
+    url = config.get("url")
+    data = config.get("data")
+    prefixo = f"[{rotulo}] " if rotulo else ""
+
+    metricas = {
+        "Endpoint": rotulo,
+        "Url": url,
+        "Status": "falha",
+        "Tentativas": 0,
+        "Registros": 0,
+        "LatenciaSegundos": 0.0,
+    }
+    inicio = time.perf_counter()
+
+    for tentativa in range(1, max_tentativas + 1):
+        metricas["Tentativas"] = tentativa
+        # Timeout progressivo: 30s, 60s, 90s
+        timeout_atual = timeout_base + (tentativa - 1) * 30
+        try:
+            print(f"  {prefixo}Tentativa {tentativa}/{max_tentativas} (timeout: {timeout_atual}s)")
+            response = requests.post(url, json=data, timeout=timeout_atual, stream=streaming)
+
+            if response.status_code == 200:
+                if streaming:
+                    with response:
+                        df_api = decodificar_resposta_streaming(response, transformar_registro)
+                else:
+                    dados = response.json()
+                    if transformar_registro is not None:
+                        try:
+                            dados = [transformar_registro(r) for r in dados]
+                        except Exception as e:
+                            print(f"  {prefixo}⚠️ Erro ao transformar registros: {str(e)[:100]}. Usando dados originais.")
+                    df_api = pd.DataFrame(dados)
+                metricas["Status"] = "ok"
+                metricas["Registros"] = len(df_api)
+                metricas["LatenciaSegundos"] = round(time.perf_counter() - inicio, 2)
+                print(f"  {prefixo}✅ Sucesso: {len(df_api)} registros em {metricas['LatenciaSegundos']:.2f}s")
+                return df_api, metricas
+
+            response.close()
+            if response.status_code in [429, 500, 502, 503, 504]:
+                # Códigos que justificam retry
+                print(f"  {prefixo}⚠️ Status {response.status_code} - Tentativa {tentativa}")
+                if tentativa < max_tentativas:
+                    espera = 5 + (tentativa * 2)  # 7s, 9s, 11s
+                    print(f"  {prefixo}⏳ Aguardando {espera}s...")
+                    time.sleep(espera)
+            else:
+                # Outros códigos de erro - não faz retry
+                print(f"  {prefixo}❌ Erro {response.status_code} para URL: {url}")
+                metricas["Status"] = f"http {response.status_code}"
+                break
+
+        except requests.exceptions.Timeout:
+            print(f"  {prefixo}⏱️ Timeout após {timeout_atual}s na tentativa {tentativa}")
+            if tentativa < max_tentativas:
+                espera = 10 * tentativa  # 10s, 20s, 30s
+                print(f"  {prefixo}⏳ Aguardando {espera}s antes da próxima tentativa...")
+                time.sleep(espera)
+
+        except requests.exceptions.ConnectionError as e:
+            print(f"  {prefixo}🔌 Erro de conexão na tentativa {tentativa}: {str(e)[:100]}...")
+            if tentativa < max_tentativas:
+                espera = 15 * tentativa  # 15s, 30s, 45s
+                print(f"  {prefixo}⏳ Aguardando {espera}s antes da próxima tentativa...")
+                time.sleep(espera)
+
+        except requests.exceptions.RequestException as e:
+            print(f"  {prefixo}❌ Erro de requisição na tentativa {tentativa}: {str(e)[:100]}...")
+            if tentativa < max_tentativas:
+                time.sleep(5 * tentativa)
+
+        except Exception as e:
+            print(f"  {prefixo}❌ Erro inesperado na tentativa {tentativa}: {str(e)[:100]}...")
+            if tentativa < max_tentativas:
+                time.sleep(3 * tentativa)
+
+    metricas["LatenciaSegundos"] = round(time.perf_counter() - inicio, 2)
+    print(f"  {prefixo}❌ FALHA: {metricas['Tentativas']} tentativa(s) sem sucesso para {url}")
+    return None, metricas
+
+
+# ============================================================================
+# CONSULTA CONCORRENTE DE VÁRIAS CATEGORIAS
+# ============================================================================
+
+def consultar_categorias(configs_por_categoria, max_tentativas=3, timeout_base=30,
+                         max_workers=max_consultas_simultaneas_api, transformar_registro=None):
+    """
+    Consulta ao mesmo tempo todos os endpoints de todas as categorias.
+
+    Args:
+        configs_por_categoria: dicionário {categoria: lista de configs}
+        max_workers: limite de consultas simultâneas
+
+    Returns:
+        (dicionário {categoria: DataFrame consolidado}, DataFrame de latências por endpoint)
+    """
+    tarefas = []
+    for categoria, configs in configs_por_categoria.items():
+        for i, config in enumerate(configs or []):
+            tarefas.append((categoria, f"{categoria} {i+1}/{len(configs)}", config))
+
+    print(f"🌐 Consultando {len(tarefas)} endpoint(s) de {len(configs_por_categoria)} categoria(s) "
+          f"com até {max_workers} consulta(s) simultânea(s)...")
+    inicio = time.perf_counter()
+
+    resultados = []
+    if tarefas:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tarefas)))) as executor:
+            futuros = [
+                executor.submit(consultar_endpoint, config, rotulo, max_tentativas, timeout_base, transformar_registro)
+                for _, rotulo, config in tarefas
+            ]
+            # Coleta na ordem das configs para manter a mesma ordem de concatenação de antes
+            resultados = [f.result() for f in futuros]
+
+    dfs_por_categoria = {}
+    linhas_latencia = []
+    for categoria in configs_por_categoria:
+        lista_df = []
+        for (cat, _, _), (df_api, metricas) in zip(tarefas, resultados):
+            if cat != categoria:
+                continue
+            linhas_latencia.append({"Categoria": categoria, **metricas})
+            if df_api is not None:
+                lista_df.append(df_api)
+
+        if lista_df:
+            resultado = pd.concat(lista_df, ignore_index=True)
+            print(f"📊 {categoria}: {len(resultado)} registros de {len(lista_df)} API(s) bem-sucedida(s)")
+        else:
+            resultado = pd.DataFrame()
+            print(f"⚠️ {categoria}: nenhuma API retornou dados válidos")
+        dfs_por_categoria[categoria] = resultado
+
+    df_latencias = pd.DataFrame(
+        linhas_latencia,
+        columns=["Categoria", "Endpoint", "Url", "Status", "Tentativas", "Registros", "LatenciaSegundos"]
+    )
+    print(f"⏱️ Ingestão concluída em {time.perf_counter() - inicio:.2f}s")
+    return dfs_por_categoria, df_latencias
+
+
+def consultar_apis(configs, max_tentativas=3, timeout_base=30, max_workers=max_consultas_simultaneas_api,
+                   transformar_registro=None):
+    """
+    Consulta uma lista de configs de API (uma categoria) em paralelo.
+    Mantém a assinatura antiga: retorna um único DataFrame consolidado.
+    """
+    dfs, df_latencias = consultar_categorias(
+        {"API": configs},
+        max_tentativas=max_tentativas,
+        timeout_base=timeout_base,
+        max_workers=max_workers,
+        transformar_registro=transformar_registro
+    )
+    imprimir_latencias(df_latencias)
+    return dfs["API"]
+
+
+def imprimir_latencias(df_latencias):
+    """Exibe a latência de cada endpoint consultado"""
+    if df_latencias is None or df_latencias.empty:
+        return
+    print("\n" + "=" * 80)
+    print("⏱️ LATÊNCIA POR ENDPOINT")
+    print("=" * 80)
+    for _, linha in df_latencias.iterrows():
+        print(f"   {linha['Endpoint']:18} {linha['Status']:10} {linha['Registros']:6} registros "
+              f"{linha['LatenciaSegundos']:7.2f}s ({linha['Tentativas']} tentativa(s))")
+    print("=" * 80 + "\n")
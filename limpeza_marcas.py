@@ -1,8 +1,9 @@
 import pandas as pd
+import numpy as np
 import os
 import json
-import re
 from config import w_marcas
+from duplicatas import marcar_quase_duplicatas
 
 def limpar_marcas(final_df):
     # Remover duplicatas de IdVeiculo + Titulo
@@ -46,42 +47,35 @@ def limpar_marcas(final_df):
     final_df['Canais'] = final_df['Canais'].fillna('').astype(str)
     final_df['Canais'] = final_df['Canais'].str.replace(r'\bHolding\b', 'J&F', regex=True)
 
-    # Limpeza e ajustes nos Canais
-
-    def clean_canais(canais, w_marcas):
-        """
-        Remove colchetes e aspas, mantém apenas marcas em w_marcas,
-        e remove vírgulas e espaços extras.
-        """
-        # 1. Converter para string se não for
-        if not isinstance(canais, str):
-            canais = str(canais)  # Converte para string
-
-        # 2. Remover colchetes e aspas
-        canais = re.sub(r"[\[\]']", "", canais)
-
-        # 3. Manter apenas marcas em w_marcas
-        marcas_validas = [marca for marca in canais.split(",") if marca.strip() in w_marcas]
-
-        # 4. Remover vírgulas e espaços extras
-        marcas_limpas = [marca.strip() for marca in marcas_validas]
-
-        return ",".join(marcas_limpas)
-
-    # Aplicando a função ao DataFrame
-    final_df['Canais'] = final_df['Canais'].apply(lambda x: clean_canais(x, w_marcas))
-
-    # Replicar registros com vários Canais
-
-    # 1. Seleciona apenas as colunas de interesse
-    final_df_small = final_df[['Id', 'Titulo', 'Conteudo', 'IdVeiculo', 'Canais']].copy()
-
-    # 2. Explode os canais em listas
-    final_df_small['Canais'] = final_df_small['Canais'].str.split(',')
-
-    # 3. Replica as linhas
-    final_df_small = final_df_small.explode('Canais').copy()
-
-    # 4. Limpa espaços extras
-    final_df_small['Canais'] = final_df_small['Canais'].str.strip()
+    # Limpeza e ajustes nos Canais (coluna inteira de uma vez):
+    # remove colchetes e aspas, separa as marcas, tira espaços extras e mantém
+    # apenas as que estão em w_marcas (busca num set), na ordem original.
+    # O resultado já é uma linha por (registro, marca), com o índice do registro.
+    marcas_por_registro = (
+        final_df['Canais'].str.replace(r"[\[\]']", "", regex=True)
+        .str.split(',').explode().str.strip()
+    )
+    marcas_por_registro = marcas_por_registro[marcas_por_registro.isin(set(w_marcas))]
+
+    # Canais do registro: marcas válidas separadas por vírgula ('' se nenhuma).
+    # A soma agrupada concatena as strings em Cython (bem mais rápido que agg(','.join))
+    final_df['Canais'] = (
+        (',' + marcas_por_registro).groupby(level=0, sort=False).sum().str[1:]
+        .reindex(final_df.index, fill_value='')
+    )
+
+    # Mesma matéria em vários veículos: as cópias recebem o IdRepresentante da primeira,
+    # para que relevância e resumos sejam pagos uma vez por matéria (todos os Ids continuam)
+    final_df = marcar_quase_duplicatas(final_df)
+
+    # Replicar registros com vários Canais: uma linha por marca válida;
+    # registros sem nenhuma marca válida ficam com uma linha de Canais ''
+    sem_marca = final_df.index.difference(marcas_por_registro.index)
+    canais_explodidos = pd.concat([marcas_por_registro, pd.Series('', index=sem_marca, dtype=object)])
+    # Ordem dos registros em final_df (ordenação estável mantém a ordem das marcas de cada registro)
+    ordem = np.argsort(final_df.index.get_indexer(canais_explodidos.index), kind='stable')
+    canais_explodidos = canais_explodidos.iloc[ordem]
+
+    final_df_small = final_df.loc[canais_explodidos.index, ['Id', 'Titulo', 'Conteudo', 'IdVeiculo', 'Canais', 'IdRepresentante']].copy()
+    final_df_small['Canais'] = canais_explodidos.to_numpy()
     return final_df, final_df_small
\ No newline at end of file
@@ -3,6 +3,34 @@
 import pandas as pd
 import re
 from config import marcas_a_ignorar
+from duplicatas import marcar_quase_duplicatas, ids_por_materia
+
+# Títulos a ignorar (registros cujo Titulo começa com estes termos, em minúsculas)
+TITULOS_A_IGNORAR = tuple(t.lower() for t in [
+    "Alice Ferraz", "Curtas", "Editorial", "Expediente", "horóscopo",
+    "mensagens", "MIRIAM LEITÃO", "MÔNICA BERGAMO", "multitela", "Obituário",
+    "Outro canal", "Painel", "Play", "sesc", "cartas de leitores", "coluna de broadcast",
+    "coluna do estadão", "frase do dia"])
+
+# Seções a ignorar (em minúsculas)
+SECOES_A_IGNORAR = [s.strip().lower() for s in [
+    "esportes", "folha corrida", "rio", "saúde", "opinião", "na web",
+    "classificados", "cultura", "ilustrada"]]
+
+# Qualquer uma das marcas_a_ignorar, com boundary words (comparação em minúsculas)
+PADRAO_MARCAS_A_IGNORAR = re.compile(r'\b(?:' + '|'.join(re.escape(marca.lower()) for marca in marcas_a_ignorar) + r')\b')
+
+# Caracteres não permitidos em XML: U+0000 a U+0008, U+000B, U+000C, U+000E a U+001F
+CARACTERES_ILEGAIS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def remover_caracteres_ilegais(serie):
+    """Remove os caracteres ilegais dos valores texto da coluna (os demais ficam como estão)"""
+    eh_texto = serie.map(lambda valor: isinstance(valor, str))
+    if not eh_texto.any():
+        return serie
+    return serie.where(~eh_texto, serie[eh_texto].str.replace(CARACTERES_ILEGAIS, '', regex=True))
+
 
 def limpar_setor(final_df_setor):
     # --- Added code to remove duplicates based on IdVeiculo + Titulo + DataVeiculacao ---
@@ -17,127 +45,66 @@ def limpar_setor(final_df_setor):
     final_df_setor = final_df_setor.drop_duplicates(subset=['IdVeiculo', 'Titulo'], keep='first').reset_index(drop=True)
     # --- End of added code ---
 
-    # Variável com os títulos a ignorar
-    titulos_a_ignorar = ["Alice Ferraz", "Curtas", "Editorial", "Expediente", "horóscopo", \
-                        "mensagens", "MIRIAM LEITÃO", "MÔNICA BERGAMO", "multitela", "Obituário", \
-                        "Outro canal", "Painel", "Play", "sesc", "cartas de leitores", "coluna de broadcast", \
-                        "coluna do estadão", "frase do dia"]
-
     # Converter a coluna 'Titulo' para string e preencher NaNs com vazio para evitar erros
     final_df_setor['Titulo'] = final_df_setor['Titulo'].astype(str).fillna('')
 
-    # Filtrar registros cujo Titulo começa com os termos a ignorar (comparação em minúsculas)
-    # Criar uma máscara booleana para as linhas a serem mantidas
-    mask = ~final_df_setor['Titulo'].str.lower().str.startswith(tuple(t.lower() for t in titulos_a_ignorar))
-
-    # Aplicar a máscara para remover as linhas indesejadas
-    final_df_setor = final_df_setor[mask].copy()
-
-    # --- Added code to remove illegal characters ---
-    # Function to remove illegal characters
-    def remove_illegal_chars(text):
-        if isinstance(text, str):
-            # Remove characters not allowed in XML (and thus often in Excel)
-            # This regex removes characters in the range U+0000 to U+0008, U+000B, U+000C, U+000E to U+001F
-            illegal_chars = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
-            return illegal_chars.sub('', text)
-        return text
-
-    # Apply the function to the 'Conteudo' column
-    final_df_setor['Conteudo'] = final_df_setor['Conteudo'].apply(remove_illegal_chars)
-    # --- End of added code ---
-
-    #final_df_setor.to_excel(arq_api_original_setor_inter, index=False)
-
-    #print("Arquivo Excel salvo como ", arq_api_original_setor)
+    # Remover caracteres não permitidos em XML (e, portanto, no Excel) do Conteudo
+    final_df_setor['Conteudo'] = remover_caracteres_ilegais(final_df_setor['Conteudo'])
 
     # ↓↓↓↓↓↓↓↓↓↓ INÍCIO DO TRECHO PARA DESPREZAR REGISTROS DO ARQUIVO DE SETOR ↓↓↓↓↓↓↓↓↓↓↓↓↓↓
 
-    # Assuming final_df_setor and w_marcas are already defined in your environment
-
-    # 1. Eliminar registros com Secao indesejada (em minúsculas)
-    secoes_a_ignorar = ["esportes", "folha corrida", "rio", "saúde", "opinião", "na web", \
-                        "classificados", "cultura", "ilustrada"]
-
-    # Create a list of the lowercased and stripped versions of the sections to ignore
-    secoes_a_ignorar_cleaned = [s.strip().lower() for s in secoes_a_ignorar]
-
-    # Clean the 'Secao' column by stripping whitespace and converting to lowercase
-    final_df_setor['Secao_cleaned'] = final_df_setor['Secao'].astype(str).str.strip().str.lower()
-
-    # Now apply the filter using the cleaned column and the cleaned list of sections to ignore
-    final_df_setor_filtered = final_df_setor[
-        ~final_df_setor['Secao_cleaned'].isin(secoes_a_ignorar_cleaned)
-    ].copy()
-
-    # You can drop the temporary 'Secao_cleaned' column if you don't need it later
-    final_df_setor_filtered = final_df_setor_filtered.drop(columns=['Secao_cleaned'])
-
-    # 2. Eliminar registros cujo campo CanaisCommodities atenda às novas condições
-    # Condição para CanaisCommodities conter "Obituários"
-    condition_contains_obituarios = final_df_setor_filtered['CanaisCommodities'].astype(str).str.lower().str.contains('obituários', na=False)
-
-    # Combinar as condições de exclusão: (contém Obituários)
-    mask_exclude_canais = condition_contains_obituarios
-
-    # Filtrar o DataFrame para manter as linhas que NÃO atendem às condições de exclusão
-    final_df_setor_filtered = final_df_setor_filtered[~mask_exclude_canais].copy()
-
-    # 3. Eliminar registros cujo campo Conteudo contiver qualquer um dos termos constantes da variável marcas_a_ignorar (comparar em minúsculas)
-    # Criar um padrão regex para buscar qualquer uma das palavras em marcas_a_ignorar, com boundary words
-    marcas_a_ignorar_lower = [marca.lower() for marca in marcas_a_ignorar]
-    pattern_marcas_a_ignorar = r'\b(' + '|'.join(re.escape(marca) for marca in marcas_a_ignorar_lower) + r')\b'
-
-    # --- Modified this line to use the already cleaned 'Conteudo' column ---
-    final_df_setor_filtered = final_df_setor_filtered[
-        ~final_df_setor_filtered['Conteudo'].str.lower().str.contains(pattern_marcas_a_ignorar, na=False)
-    ].copy()
-    # --- End of modification ---
-
-    # 4. Eliminar registros onde no campo Conteudo tenha, numa mesma linha,
-    # que comece com "leia mais" ou "leia também", e em outro lugar qualquer
-    # da mesma linha, contiver qualquer um dos termos constantes da variável marcas_a_ignorar (comparar em minúsculas)
-
-    # Primeiro, lidar com valores NaN na coluna 'Conteudo'
+    # Textos em minúsculas calculados uma única vez e reaproveitados por todas as regras
+    titulo_lower = final_df_setor['Titulo'].str.lower()
+    conteudo_lower = final_df_setor['Conteudo'].str.lower()
+    menciona_marca_a_ignorar = conteudo_lower.str.contains(PADRAO_MARCAS_A_IGNORAR, na=False)
+
+    # Regras de exclusão, na ordem em que são contabilizadas
+    regras_exclusao = {
+        # Titulo começa com os termos a ignorar
+        "Título a ignorar": titulo_lower.str.startswith(TITULOS_A_IGNORAR),
+        # Secao indesejada
+        "Seção a ignorar": final_df_setor['Secao'].astype(str).str.strip().str.lower().isin(SECOES_A_IGNORAR),
+        # CanaisCommodities contém "Obituários"
+        "CanaisCommodities com Obituários": final_df_setor['CanaisCommodities'].astype(str).str.lower()
+            .str.contains('obituários', regex=False, na=False),
+        # Conteudo começa com "leia mais" ou "leia também" e cita marca a ignorar. Vem antes da regra
+        # geral de marca a ignorar, que a contém: depois dela, esta contagem seria sempre zero
+        "'Leia mais' com marca a ignorar": conteudo_lower.fillna('').str.strip()
+            .str.startswith(("leia mais", "leia também")) & menciona_marca_a_ignorar,
+        # Conteudo contém qualquer um dos termos de marcas_a_ignorar (com boundary words)
+        "Conteúdo cita marca a ignorar": menciona_marca_a_ignorar,
+    }
+
+    removidas = pd.Series(False, index=final_df_setor.index)
+    removidas_por_regra = {}
+    for regra, mascara in regras_exclusao.items():
+        mascara = mascara.fillna(False).astype(bool)
+        removidas_por_regra[regra] = int((mascara & ~removidas).sum())
+        removidas |= mascara
+
+    final_df_setor_filtered = final_df_setor[~removidas].copy()
     final_df_setor_filtered['Conteudo'] = final_df_setor_filtered['Conteudo'].fillna('')
 
-    # Função para verificar a condição combinada em cada linha
-    def check_leia_mais_and_marcas_a_ignorar(content, marcas_a_ignorar):
-        content_lower = content.lower()
-        starts_with_leia = content_lower.strip().startswith("leia mais") or content_lower.strip().startswith("leia também")
-
-        # Check if any of the marcas_a_ignorar are present in the lowercased content
-        marca_present = any(re.search(r'\b' + re.escape(marca.lower()) + r'\b', content_lower) for marca in marcas_a_ignorar)
-
-        return starts_with_leia and marca_present
-
-    # Aplicar a função para criar uma máscara booleana
-    # --- Modified this line to use the already cleaned 'Conteudo' column ---
-    mask_leia_mais_and_marcas_a_ignorar = final_df_setor_filtered['Conteudo'].apply(
-        lambda x: check_leia_mais_and_marcas_a_ignorar(x, marcas_a_ignorar)
-    )
-    # --- End of modification ---
-
-    # Filtrar o DataFrame para remover as linhas que correspondem à condição
-    final_df_setor_filtered = final_df_setor_filtered[~mask_leia_mais_and_marcas_a_ignorar].copy()
-
-    # O DataFrame 'final_df_setor_filtered' agora contém os dados após todas as filtragens.
-
-
     print(f"Número de registros antes da filtragem: {len(final_df_setor)}")
+    for regra, quantidade in removidas_por_regra.items():
+        print(f"   ↳ {regra}: {quantidade} removido(s)")
     print(f"Número de registros após a filtragem: {len(final_df_setor_filtered)}")
 
-    # Você pode renomeá-lo para final_df_setor se quiser substituir o original.
-    final_df_setor = final_df_setor_filtered.copy()
+    final_df_setor = final_df_setor_filtered
 
     # ↑↑↑↑↑↑↑↑↑↑ FINAL DO TRECHO PARA DESPREZAR REGISTROS DO ARQUIVO DE SETOR ↑↑↑↑↑↑↑↑↑↑↑↑↑↑
 
-    # Grava o DataFrame final em um arquivo Excel
-
-    #final_df_setor.to_excel(arq_api_original_setor, index=False)
+    # Mesma matéria em vários veículos: só o representante segue para pontuação e resumo;
+    # IdsCopias guarda os Ids de todas as cópias (citadas no relatório) e IdsVeiculosCopias os
+    # veículos delas (bônus de veículo prioritário). Todas continuam em final_df_setor
+    final_df_setor = marcar_quase_duplicatas(final_df_setor)
+    final_df_setor['IdsCopias'] = ids_por_materia(final_df_setor)
+    final_df_setor['IdsVeiculosCopias'] = ids_por_materia(final_df_setor, campo='IdVeiculo')
 
     # Criar o DataFrame 'final_df_small' após a filtragem
-    final_df_setor_small = final_df_setor[['Id', 'Titulo', 'Conteudo', 'IdVeiculo']].copy()
+    representantes = final_df_setor['Id'] == final_df_setor['IdRepresentante']
+    final_df_setor_small = final_df_setor.loc[representantes, ['Id', 'Titulo', 'Conteudo', 'IdVeiculo', 'IdsCopias',
+                                                               'IdsVeiculosCopias']].copy()
 
     return final_df_setor, final_df_setor_small
 
@@ -12,8 +12,6 @@ env_path = os.path.join(base_dir, ".env")
 load_dotenv(env_path)
 
 import pandas as pd
-import json
-import requests
 import time
 from cronometro import obter_timestamp_brasilia, calcular_tempo_decorrido
 from temporizador import aguardar_data_futura
@@ -27,127 +25,34 @@ from prompts_setor import gerar_prompts_setor
 from resumos_setor import gerar_resumos_setor
 from relatorio_preliminar import gerar_versao_preliminar
 from relatorio_ajustado_final import gerar_versao_ajustada
+from ingestao_apis import carregar_configs, consultar_categorias, imprimir_latencias
+from armazenamento_etapas import carregar_etapa
+from contexto_pipeline import ContextoPipeline
+from cliente_deepseek import imprimir_estatisticas_cache
+from config import api_configs_marca, api_configs_setor, api_configs_editorial, api_configs_SPECIALS, arq_shorturls
 from config import arq_api_original, arq_api, arq_api_irrelevantes, arq_results, arq_results_irrelevantes, arq_api_original_setor, arq_api_setor, arq_prompts_setor, \
     arq_results_setor, arq_api_original_editorial, arq_api_editorial, arq_api_original_SPECIALS, arq_api_SPECIALS, arq_resumo_final
 
-def abrir_arquivos_gerados():
-    final_df = pd.read_excel(arq_api_original)
-    final_df_small = pd.read_excel(arq_api)
-    final_df_small_irrelevantes = pd.read_excel(arq_api_irrelevantes)
-    df_resumos_marcas = pd.read_excel(arq_results)
-    df_resumos_marcas_irrelevantes = pd.read_excel(arq_results_irrelevantes)
-    final_df_setor = pd.read_excel(arq_api_original_setor)
-    final_df_small_setor = pd.read_excel(arq_api_setor)
-    df_resumos_setor = pd.read_excel(arq_results_setor)
-    final_df_editoriais = pd.read_excel(arq_api_original_editorial)
-    final_df_small_editoriais = pd.read_excel(arq_api_editorial)
-    final_df_specials = pd.read_excel(arq_api_original_SPECIALS)
-    final_df_small_specials = pd.read_excel(arq_api_SPECIALS)
+def abrir_arquivos_gerados(contexto=None):
+    """Frames das etapas: da memória (contexto do pipeline) ou, sem contexto, do disco"""
+    obter = contexto.obter if contexto is not None else carregar_etapa
+    final_df = obter(arq_api_original)
+    final_df_small = obter(arq_api)
+    final_df_small_irrelevantes = obter(arq_api_irrelevantes)
+    df_resumos_marcas = obter(arq_results)
+    df_resumos_marcas_irrelevantes = obter(arq_results_irrelevantes)
+    final_df_setor = obter(arq_api_original_setor)
+    final_df_small_setor = obter(arq_api_setor)
+    df_resumos_setor = obter(arq_results_setor)
+    final_df_editoriais = obter(arq_api_original_editorial)
+    final_df_small_editoriais = obter(arq_api_editorial)
+    final_df_specials = obter(arq_api_original_SPECIALS)
+    final_df_small_specials = obter(arq_api_SPECIALS)
     return (final_df, final_df_small, final_df_small_irrelevantes, df_resumos_marcas, df_resumos_marcas_irrelevantes,
         final_df_setor, final_df_small_setor, df_resumos_setor, final_df_editoriais, final_df_small_editoriais,
         final_df_specials, final_df_small_specials)
 
 
-def carregar_configs(caminho_json):
-    with open(caminho_json, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-import requests
-import time
-import pandas as pd
-
-def consultar_apis(configs, max_tentativas=3, timeout_base=30):
-    """
-    Consulta APIs com retry automático e timeouts progressivos
-    Versão simplificada sem dependências extras
-    
-    Args:
-        configs: Lista de configurações das APIs
-        max_tentativas: Número máximo de tentativas por API
-        timeout_base: Timeout base em segundos
-    """
-    lista_df = []
-    
-    for i, config in enumerate(configs):
-        url = config.get("url")
-        data = config.get("data")
-        print(f"Consultando API {i+1}/{len(configs)}: {url}")
-        
-        sucesso = False
-        
-        for tentativa in range(1, max_tentativas + 1):
-            try:
-                # Timeout progressivo: 30s, 60s, 90s
-                timeout_atual = timeout_base + (tentativa - 1) * 30
-                
-                print(f"  Tentativa {tentativa}/{max_tentativas} (timeout: {timeout_atual}s)")
-                
-                response = requests.post(
-                    url, 
-                    json=data, 
-                    timeout=timeout_atual
-                )
-                
-                if response.status_code == 200:
-                    dados = response.json()
-                    df_api = pd.DataFrame(dados)
-                    lista_df.append(df_api)
-                    print(f"  ✅ Sucesso: {len(df_api)} registros")
-                    sucesso = True
-                    break
-                    
-                elif response.status_code in [429, 500, 502, 503, 504]:
-                    # Códigos que justificam retry
-                    print(f"  ⚠️ Status {response.status_code} - Tentativa {tentativa}")
-                    if tentativa < max_tentativas:
-                        espera = 5 + (tentativa * 2)  # 7s, 9s, 11s
-                        print(f"  ⏳ Aguardando {espera}s...")
-                        time.sleep(espera)
-                else:
-                    # Outros códigos de erro - não faz retry
-                    print(f"  ❌ Erro {response.status_code} para URL: {url}")
-                    break
-                    
-            except requests.exceptions.Timeout:
-                print(f"  ⏱️ Timeout após {timeout_atual}s na tentativa {tentativa}")
-                if tentativa < max_tentativas:
-                    espera = 10 * tentativa  # 10s, 20s, 30s
-                    print(f"  ⏳ Aguardando {espera}s antes da próxima tentativa...")
-                    time.sleep(espera)
-                    
-            except requests.exceptions.ConnectionError as e:
-                erro_str = str(e)[:100]
-                print(f"  🔌 Erro de conexão na tentativa {tentativa}: {erro_str}...")
-                if tentativa < max_tentativas:
-                    espera = 15 * tentativa  # 15s, 30s, 45s
-                    print(f"  ⏳ Aguardando {espera}s antes da próxima tentativa...")
-                    time.sleep(espera)
-                    
-            except requests.exceptions.RequestException as e:
-                erro_str = str(e)[:100]
-                print(f"  ❌ Erro de requisição na tentativa {tentativa}: {erro_str}...")
-                if tentativa < max_tentativas:
-                    time.sleep(5 * tentativa)
-                    
-            except Exception as e:
-                erro_str = str(e)[:100]
-                print(f"  ❌ Erro inesperado na tentativa {tentativa}: {erro_str}...")
-                if tentativa < max_tentativas:
-                    time.sleep(3 * tentativa)
-        
-        if not sucesso:
-            print(f"  ❌ FALHA: Todas as {max_tentativas} tentativas falharam para {url}")
-            print(f"  ⚠️ Continuando com as próximas APIs...")
-    
-    if lista_df:
-        resultado = pd.concat(lista_df, ignore_index=True)
-        print(f"\n📊 Total consolidado: {len(resultado)} registros de {len(lista_df)} APIs bem-sucedidas")
-        return resultado
-    else:
-        print(f"\n⚠️ Nenhuma API retornou dados válidos")
-        return pd.DataFrame()
-
-
 def main():
     # 1. Aguarda a data e hora futura fornecida pelo operador
     print('↓' * 94)
@@ -171,10 +76,19 @@ def main():
     ts = obter_timestamp_brasilia()
     print("Timestamp atual:", ts)
 
-    # 2. Chamada de API de MARCAS
-    caminho_json = "dados/config/api_marca_configs.json"
-    configs = carregar_configs(caminho_json)
-    marcas_df = consultar_apis(configs)
+    # DataFrames passam de uma etapa para a outra em memória; o disco é só checkpoint em segundo plano
+    contexto = ContextoPipeline()
+
+    # 2. Chamada das APIs de MARCAS, SETOR, EDITORIAIS e SPECIALS (todas em paralelo)
+    configs_por_categoria = {
+        'MARCAS': carregar_configs(api_configs_marca),
+        'SETOR': carregar_configs(api_configs_setor),
+        'EDITORIAIS': carregar_configs(api_configs_editorial),
+        'SPECIALS': carregar_configs(api_configs_SPECIALS),
+    }
+    dfs_api, df_latencias = consultar_categorias(configs_por_categoria)
+    imprimir_latencias(df_latencias)
+    marcas_df = dfs_api['MARCAS']
 
     if marcas_df.empty:
         print("⚠️ ATENÇÃO: Nenhum registro retornado pelas APIs de MARCAS!")
@@ -190,7 +104,7 @@ def main():
         print(f"✅ {len(marcas_df)} registros obtidos para MARCAS")
         final_df, final_df_small_bruto = limpar_marcas(marcas_df)
 
-    final_df.to_excel(arq_api_original, index=False)
+    contexto.registrar(arq_api_original, final_df)
 
     # 3. Avaliação de RELEVÂNCIA
 
@@ -214,8 +128,8 @@ def main():
     print(f"📊 final_df_small_irrelevantes tem {len(final_df_small_irrelevantes)} registros")
 
 
-    final_df_small.to_excel(arq_api, index=False)
-    final_df_small_irrelevantes.to_excel(arq_api_irrelevantes, index=False)
+    contexto.registrar(arq_api, final_df_small)
+    contexto.registrar(arq_api_irrelevantes, final_df_small_irrelevantes)
 
     # 4.A Agrupa MARCAS por SIMILARIDADE e gera RESUMOS pelo DeepSeek - Notícias Relevantes
     if final_df_small.empty:
@@ -228,7 +142,7 @@ def main():
 
     print(f"📊 df_resumos_marcas resultante tem {len(df_resumos_marcas)} registros")
 
-    df_resumos_marcas.to_excel(arq_results, index=False)
+    contexto.registrar(arq_results, df_resumos_marcas)
 
     # 4.B Agrupa MARCAS por SIMILARIDADE e gera RESUMOS pelo DeepSeek - Notícias Irrelevantes
     if final_df_small_irrelevantes.empty:
@@ -240,17 +154,15 @@ def main():
         df_resumos_marcas_irrelevantes = agrupar_noticias_por_similaridade(final_df_small_irrelevantes)
 
     if df_resumos_marcas_irrelevantes is not None and not df_resumos_marcas_irrelevantes.empty:
-        df_resumos_marcas_irrelevantes.to_excel(arq_results_irrelevantes, index=False)
+        contexto.registrar(arq_results_irrelevantes, df_resumos_marcas_irrelevantes)
     else:
         print("⚠️ Nenhuma notícia irrelevante encontrada. Gerando arquivo vazio com cabeçalho.")
         colunas = ["Marca", "GrupoID", "QtdNoticias", "Ids", "Resumo"]
-        pd.DataFrame(columns=colunas).to_excel(arq_results_irrelevantes, index=False)
+        contexto.registrar(arq_results_irrelevantes, pd.DataFrame(columns=colunas))
 
 
     # 5. Chamada de API de SETOR
-    caminho_json = "dados/config/api_setor_configs.json"
-    configs = carregar_configs(caminho_json)
-    setor_df = consultar_apis(configs)
+    setor_df = dfs_api['SETOR']  # já consultado no passo 2
 
     if setor_df.empty:
         print("⚠️ ATENÇÃO: Nenhum registro retornado pelas APIs de SETOR!")
@@ -266,27 +178,25 @@ def main():
         print(f"✅ {len(setor_df)} registros obtidos para SETOR")
         final_df_setor, final_df_small_setor = limpar_setor(setor_df)
 
-    final_df_setor.to_excel(arq_api_original_setor, index=False)
-    final_df_small_setor.to_excel(arq_api_setor, index=False)
+    contexto.registrar(arq_api_original_setor, final_df_setor)
+    contexto.registrar(arq_api_setor, final_df_small_setor)
 
     # 6. Agrupa notícias de SETOR por SIMILARIDADE e gera PROMPTS para resumos
     if final_df_small_setor.empty:
         df_prompts_setor = pd.DataFrame(columns=['Id', 'Tipo', 'Prompt', 'Tema', 'RelevanceScore', 'IdVeiculo'])
     else:
         df_prompts_setor = gerar_prompts_setor(final_df_small_setor)
-    df_prompts_setor.to_excel(arq_prompts_setor, index=False)
+    contexto.registrar(arq_prompts_setor, df_prompts_setor)
 
     # 7. Processa RESUMOS de notícias de SETOR
     if df_prompts_setor.empty:
         df_resumos_setor = pd.DataFrame(columns=['Tema', 'Id', 'Resumo'])
     else:
         df_resumos_setor = gerar_resumos_setor(df_prompts_setor)
-    df_resumos_setor.to_excel(arq_results_setor, index=False)
+    contexto.registrar(arq_results_setor, df_resumos_setor)
 
     # 8. Chamada de API de EDITORIAIS
-    caminho_json = "dados/config/api_editorial_configs.json"
-    configs = carregar_configs(caminho_json)
-    editoriais_df = consultar_apis(configs)
+    editoriais_df = dfs_api['EDITORIAIS']  # já consultado no passo 2
 
     if editoriais_df.empty:
         print("⚠️ ATENÇÃO: Nenhum registro retornado pelas APIs de EDITORIAIS!")
@@ -302,13 +212,11 @@ def main():
         print(f"✅ {len(editoriais_df)} registros obtidos para EDITORIAIS")
         final_df_editoriais, final_df_small_editoriais = limpar_editoriais(editoriais_df)
 
-    final_df_editoriais.to_excel(arq_api_original_editorial, index=False)
-    final_df_small_editoriais.to_excel(arq_api_editorial, index=False)
+    contexto.registrar(arq_api_original_editorial, final_df_editoriais)
+    contexto.registrar(arq_api_editorial, final_df_small_editoriais)
 
     # 9. Chamada de API de SPECIALS
-    caminho_json = "dados/config/api_SPECIALS_configs.json"
-    configs = carregar_configs(caminho_json)
-    specials_df = consultar_apis(configs)
+    specials_df = dfs_api['SPECIALS']  # já consultado no passo 2
 
     if specials_df.empty:
         print("⚠️ ATENÇÃO: Nenhum registro retornado pelas APIs de SPECIALS!")
@@ -324,17 +232,17 @@ def main():
         print(f"✅ {len(specials_df)} registros obtidos para SPECIALS")
         final_df_specials, final_df_small_specials = limpar_specials(specials_df)
 
-    final_df_specials.to_excel(arq_api_original_SPECIALS, index=False)
-    final_df_small_specials.to_excel(arq_api_SPECIALS, index=False)
+    contexto.registrar(arq_api_original_SPECIALS, final_df_specials)
+    contexto.registrar(arq_api_SPECIALS, final_df_small_specials)
 
     # 10. Geração do RELATÓRIO DE DESTAQUES
-    # Carrega os dados necessários para o relatório
+    # Dados necessários para o relatório: já estão em memória no contexto do pipeline
     (final_df, final_df_small, final_df_small_irrelevantes, df_resumos_marcas, df_resumos_marcas_irrelevantes,
     final_df_setor, final_df_small_setor, df_resumos_setor, final_df_editoriais, final_df_small_editoriais,
-    final_df_specials, final_df_small_specials) = abrir_arquivos_gerados()
+    final_df_specials, final_df_small_specials) = abrir_arquivos_gerados(contexto)
 
     # Ajustes de tipos de campos
-    df_short = pd.read_excel('dados/api/shorturls_por_id.xlsx')
+    df_short = carregar_etapa(arq_shorturls)
     final_df_small['Id'] = final_df_small['Id'].astype(int)
     df_short['Id'] = df_short['Id'].astype(int)
     final_df_small = final_df_small.merge(df_short, on=['Id', 'Canais'], how='left')
@@ -345,6 +253,10 @@ def main():
     PASTA_ID_DRIVE = "1BdPoC3HZ7rIVd_0cgEVl4xGIjimVXTmq"  # Se quiser upload automático
     gerar_versao_ajustada(arq_resumo_final, pasta_id_drive=PASTA_ID_DRIVE)    
 
+    # Garante que os checkpoints em disco terminaram antes de encerrar
+    contexto.aguardar_checkpoints()
+    imprimir_estatisticas_cache()
+
     # Calcular o tempo decorrido desde aquele timestamp
     resultado = calcular_tempo_decorrido(ts)
     print(f"Tempo decorrido: {resultado['segundos']:.2f} segundos")
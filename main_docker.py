@@ -12,8 +12,6 @@ env_path = os.path.join(base_dir, ".env")
 load_dotenv(env_path)
 
 import pandas as pd
-import json
-import requests
 import time
 from cronometro import obter_timestamp_brasilia, calcular_tempo_decorrido
 from temporizador import aguardar_data_futura
@@ -27,50 +25,34 @@ from prompts_setor import gerar_prompts_setor
 from resumos_setor import gerar_resumos_setor
 from relatorio_preliminar_segmentado import gerar_versao_preliminar
 from relatorio_ajustado_final import gerar_versao_ajustada
+from ingestao_apis import carregar_configs, consultar_categorias, imprimir_latencias
+from armazenamento_etapas import carregar_etapa
+from contexto_pipeline import ContextoPipeline
+from cliente_deepseek import imprimir_estatisticas_cache
+from config import api_configs_marca, api_configs_setor, api_configs_editorial, api_configs_SPECIALS, arq_shorturls
 from config import arq_api_original, arq_api, arq_api_irrelevantes, arq_results, arq_results_irrelevantes, arq_api_original_setor, arq_api_setor, arq_prompts_setor, \
     arq_results_setor, arq_api_original_editorial, arq_api_editorial, arq_api_original_SPECIALS, arq_api_SPECIALS, arq_resumo_final, arq_api_original_raw
 
-def abrir_arquivos_gerados():
-    final_df = pd.read_excel(arq_api_original)
-    final_df_small = pd.read_excel(arq_api)
-    final_df_small_irrelevantes = pd.read_excel(arq_api_irrelevantes)
-    df_resumos_marcas = pd.read_excel(arq_results)
-    df_resumos_marcas_irrelevantes = pd.read_excel(arq_results_irrelevantes)
-    final_df_setor = pd.read_excel(arq_api_original_setor)
-    final_df_small_setor = pd.read_excel(arq_api_setor)
-    df_resumos_setor = pd.read_excel(arq_results_setor)
-    final_df_editoriais = pd.read_excel(arq_api_original_editorial)
-    final_df_small_editoriais = pd.read_excel(arq_api_editorial)
-    final_df_specials = pd.read_excel(arq_api_original_SPECIALS)
-    final_df_small_specials = pd.read_excel(arq_api_SPECIALS)
+def abrir_arquivos_gerados(contexto=None):
+    """Frames das etapas: da memória (contexto do pipeline) ou, sem contexto, do disco"""
+    obter = contexto.obter if contexto is not None else carregar_etapa
+    final_df = obter(arq_api_original)
+    final_df_small = obter(arq_api)
+    final_df_small_irrelevantes = obter(arq_api_irrelevantes)
+    df_resumos_marcas = obter(arq_results)
+    df_resumos_marcas_irrelevantes = obter(arq_results_irrelevantes)
+    final_df_setor = obter(arq_api_original_setor)
+    final_df_small_setor = obter(arq_api_setor)
+    df_resumos_setor = obter(arq_results_setor)
+    final_df_editoriais = obter(arq_api_original_editorial)
+    final_df_small_editoriais = obter(arq_api_editorial)
+    final_df_specials = obter(arq_api_original_SPECIALS)
+    final_df_small_specials = obter(arq_api_SPECIALS)
     return (final_df, final_df_small, final_df_small_irrelevantes, df_resumos_marcas, df_resumos_marcas_irrelevantes,
         final_df_setor, final_df_small_setor, df_resumos_setor, final_df_editoriais, final_df_small_editoriais,
         final_df_specials, final_df_small_specials)
 
 
-def carregar_configs(caminho_json):
-    with open(caminho_json, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def consultar_apis(configs, max_tentativas=5):
-    lista_df = []
-    for config in configs:
-        url = config.get("url")
-        data = config.get("data")
-        print(f"Consultando API: {url}")
-        try:
-            response = requests.post(url, json=data, timeout=30)
-            if response.status_code == 200:
-                dados = response.json()
-                df_api = pd.DataFrame(dados)
-                lista_df.append(df_api)
-                print(f"✔️ Sucesso: {len(df_api)} registros")
-            else:
-                print(f"❌ Erro {response.status_code} para URL: {url}")
-        except Exception as e:
-            print(f"❌ Exceção ao consultar {url}: {str(e)}")
-    return pd.concat(lista_df, ignore_index=True) if lista_df else pd.DataFrame()
-
 def main():
     # 1. Aguarda a data e hora futura fornecida pelo operador
     #print('↓' * 94)
@@ -94,46 +76,53 @@ def main():
     ts = obter_timestamp_brasilia()
     print("Timestamp atual:", ts)
 
-    # 2. Chamada de API de MARCAS
-    caminho_json = "dados/config/api_marca_configs.json"
-    configs = carregar_configs(caminho_json)
-    marcas_df = consultar_apis(configs)
+    # DataFrames passam de uma etapa para a outra em memória; o disco é só checkpoint em segundo plano
+    contexto = ContextoPipeline()
+
+    # 2. Chamada das APIs de MARCAS, SETOR, EDITORIAIS e SPECIALS (todas em paralelo)
+    configs_por_categoria = {
+        'MARCAS': carregar_configs(api_configs_marca),
+        'SETOR': carregar_configs(api_configs_setor),
+        'EDITORIAIS': carregar_configs(api_configs_editorial),
+        'SPECIALS': carregar_configs(api_configs_SPECIALS),
+    }
+    dfs_api, df_latencias = consultar_categorias(configs_por_categoria)
+    imprimir_latencias(df_latencias)
+    marcas_df = dfs_api['MARCAS']
     # Save raw API output for audit / replay
     try:
-        marcas_df.to_excel(arq_api_original_raw, index=False)
+        contexto.registrar(arq_api_original_raw, marcas_df)
         print(f"Saved raw marcas API output: {arq_api_original_raw} ({len(marcas_df)} records)")
     except Exception as e:
         print(f"Warning: could not save raw marcas file: {e}")
 
     final_df, final_df_small_bruto = limpar_marcas(marcas_df)
-    final_df.to_excel(arq_api_original, index=False)
+    contexto.registrar(arq_api_original, final_df)
 
     # 3. Avaliação de RELEVÂNCIA
     final_df_small, final_df_small_irrelevantes = avaliar_relevancia(final_df_small_bruto)
-    final_df_small.to_excel(arq_api, index=False)
-    final_df_small_irrelevantes.to_excel(arq_api_irrelevantes, index=False)
+    contexto.registrar(arq_api, final_df_small)
+    contexto.registrar(arq_api_irrelevantes, final_df_small_irrelevantes)
 
     # 4.A Agrupa MARCAS por SIMILARIDADE e gera RESUMOS pelo DeepSeek - Notícias Relevantes
     df_resumos_marcas = agrupar_noticias_por_similaridade(final_df_small)
-    df_resumos_marcas.to_excel(arq_results, index=False)
+    contexto.registrar(arq_results, df_resumos_marcas)
 
     # 4.B Agrupa MARCAS por SIMILARIDADE e gera RESUMOS pelo DeepSeek - Notícias Irrelevantes
     df_resumos_marcas_irrelevantes = agrupar_noticias_por_similaridade(final_df_small_irrelevantes)
-    #df_resumos_marcas_irrelevantes.to_excel(arq_results_irrelevantes, index=False)
+    #salvar_etapa(df_resumos_marcas_irrelevantes, arq_results_irrelevantes)
     #df_resumos_marcas_irrelevantes = agrupar_noticias_por_similaridade(final_df_small_irrelevantes)
 
     if df_resumos_marcas_irrelevantes is not None and not df_resumos_marcas_irrelevantes.empty:
-        df_resumos_marcas_irrelevantes.to_excel(arq_results_irrelevantes, index=False)
+        contexto.registrar(arq_results_irrelevantes, df_resumos_marcas_irrelevantes)
     else:
         print("⚠️ Nenhuma notícia irrelevante encontrada. Gerando arquivo vazio com cabeçalho.")
         colunas = ["Marca", "GrupoID", "QtdNoticias", "Ids", "Resumo"]
-        pd.DataFrame(columns=colunas).to_excel(arq_results_irrelevantes, index=False)
+        contexto.registrar(arq_results_irrelevantes, pd.DataFrame(columns=colunas))
 
 
     # 5. Chamada de API de SETOR
-    caminho_json = "dados/config/api_setor_configs.json"
-    configs = carregar_configs(caminho_json)
-    setor_df = consultar_apis(configs)
+    setor_df = dfs_api['SETOR']  # já consultado no passo 2
 
     # Salvar arquivo raw de SETOR antes da limpeza (sanitizando caracteres inválidos)
     from config import arq_api_original_setor_raw
@@ -156,47 +145,43 @@ def main():
             if setor_df_safe[col].dtype == object:
                 setor_df_safe[col] = setor_df_safe[col].apply(_sanitize_value_for_excel)
 
-        setor_df_safe.to_excel(arq_api_original_setor_raw, index=False)
+        contexto.registrar(arq_api_original_setor_raw, setor_df_safe)
         print(f"Saved raw setor API output: {arq_api_original_setor_raw} ({len(setor_df)} records)")
     except Exception as e:
         print(f"Warning: could not save raw setor file: {e}")
 
     final_df_setor, final_df_small_setor = limpar_setor(setor_df)
-    final_df_setor.to_excel(arq_api_original_setor, index=False)
-    final_df_small_setor.to_excel(arq_api_setor, index=False)
+    contexto.registrar(arq_api_original_setor, final_df_setor)
+    contexto.registrar(arq_api_setor, final_df_small_setor)
 
     # 6. Agrupa notícias de SETOR por SIMILARIDADE e gera PROMPTS para resumos
     df_prompts_setor = gerar_prompts_setor(final_df_small_setor)
-    df_prompts_setor.to_excel(arq_prompts_setor, index=False)
+    contexto.registrar(arq_prompts_setor, df_prompts_setor)
 
     # 7. Processa RESUMOS de notícias de SETOR
     df_resumos_setor = gerar_resumos_setor(df_prompts_setor)
-    df_resumos_setor.to_excel(arq_results_setor, index=False)
+    contexto.registrar(arq_results_setor, df_resumos_setor)
 
     # 8. Chamada de API de EDITORIAIS
-    caminho_json = "dados/config/api_editorial_configs.json"
-    configs = carregar_configs(caminho_json)
-    editoriais_df = consultar_apis(configs)
+    editoriais_df = dfs_api['EDITORIAIS']  # já consultado no passo 2
     final_df_editoriais, final_df_small_editoriais = limpar_editoriais(editoriais_df)
-    final_df_editoriais.to_excel(arq_api_original_editorial, index=False)
-    final_df_small_editoriais.to_excel(arq_api_editorial, index=False)
+    contexto.registrar(arq_api_original_editorial, final_df_editoriais)
+    contexto.registrar(arq_api_editorial, final_df_small_editoriais)
 
     # 9. Chamada de API de SPECIALS
-    caminho_json = "dados/config/api_SPECIALS_configs.json"
-    configs = carregar_configs(caminho_json)
-    specials_df = consultar_apis(configs)
+    specials_df = dfs_api['SPECIALS']  # já consultado no passo 2
     final_df_specials, final_df_small_specials = limpar_specials(specials_df)
-    final_df_specials.to_excel(arq_api_original_SPECIALS, index=False)
-    final_df_small_specials.to_excel(arq_api_SPECIALS, index=False)
+    contexto.registrar(arq_api_original_SPECIALS, final_df_specials)
+    contexto.registrar(arq_api_SPECIALS, final_df_small_specials)
 
     # 10. Geração do RELATÓRIO DE DESTAQUES
-    # Carrega os dados necessários para o relatório
+    # Dados necessários para o relatório: já estão em memória no contexto do pipeline
     (final_df, final_df_small, final_df_small_irrelevantes, df_resumos_marcas, df_resumos_marcas_irrelevantes,
     final_df_setor, final_df_small_setor, df_resumos_setor, final_df_editoriais, final_df_small_editoriais,
-    final_df_specials, final_df_small_specials) = abrir_arquivos_gerados()
+    final_df_specials, final_df_small_specials) = abrir_arquivos_gerados(contexto)
 
     # Ajustes de tipos de campos
-    df_short = pd.read_excel('dados/api/shorturls_por_id.xlsx')
+    df_short = carregar_etapa(arq_shorturls)
     final_df_small['Id'] = final_df_small['Id'].astype(int)
     df_short['Id'] = df_short['Id'].astype(int)
     final_df_small = final_df_small.merge(df_short, on=['Id', 'Canais'], how='left')
@@ -208,6 +193,10 @@ def main():
     gerar_versao_ajustada(arq_resumo_final, pasta_id_drive=PASTA_ID_DRIVE)    
     #gerar_versao_ajustada(arq_resumo_final)
 
+    # Garante que os checkpoints em disco terminaram antes de encerrar
+    contexto.aguardar_checkpoints()
+    imprimir_estatisticas_cache()
+
     # Calcular o tempo decorrido desde aquele timestamp
     resultado = calcular_tempo_decorrido(ts)
     print(f"Tempo decorrido: {resultado['segundos']:.2f} segundos")
@@ -13,9 +13,6 @@ env_path = os.path.join(base_dir, ".env")
 load_dotenv(env_path)
 
 import pandas as pd
-import json
-import requests
-import time
 import fcntl
 import datetime
 from cronometro import obter_timestamp_brasilia, calcular_tempo_decorrido
@@ -30,6 +27,9 @@ from prompts_setor import gerar_prompts_setor
 from resumos_setor import gerar_resumos_setor
 from relatorio_preliminar_segmentado import gerar_versao_preliminar
 from relatorio_ajustado_final import gerar_versao_ajustada
+from ingestao_apis import carregar_configs, consultar_categorias, imprimir_latencias
+from armazenamento_etapas import salvar_etapa, carregar_etapa
+from config import api_configs_marca, api_configs_setor, api_configs_editorial, api_configs_SPECIALS, arq_shorturls
 from config import arq_api_original, arq_api, arq_api_irrelevantes, arq_results, arq_results_irrelevantes, arq_api_original_setor, arq_api_setor, arq_prompts_setor, \
     arq_results_setor, arq_api_original_editorial, arq_api_editorial, arq_api_original_SPECIALS, arq_api_SPECIALS, arq_resumo_final
 from config import arq_api_original_raw
@@ -173,127 +173,22 @@ def selecionar_opcao():
     return False
 
 def abrir_arquivos_gerados():
-    final_df = pd.read_excel(arq_api_original)
-    final_df_small = pd.read_excel(arq_api)
-    final_df_small_irrelevantes = pd.read_excel(arq_api_irrelevantes)
-    df_resumos_marcas = pd.read_excel(arq_results)
-    df_resumos_marcas_irrelevantes = pd.read_excel(arq_results_irrelevantes)
-    final_df_setor = pd.read_excel(arq_api_original_setor)
-    final_df_small_setor = pd.read_excel(arq_api_setor)
-    df_resumos_setor = pd.read_excel(arq_results_setor)
-    final_df_editoriais = pd.read_excel(arq_api_original_editorial)
-    final_df_small_editoriais = pd.read_excel(arq_api_editorial)
-    final_df_specials = pd.read_excel(arq_api_original_SPECIALS)
-    final_df_small_specials = pd.read_excel(arq_api_SPECIALS)
+    final_df = carregar_etapa(arq_api_original)
+    final_df_small = carregar_etapa(arq_api)
+    final_df_small_irrelevantes = carregar_etapa(arq_api_irrelevantes)
+    df_resumos_marcas = carregar_etapa(arq_results)
+    df_resumos_marcas_irrelevantes = carregar_etapa(arq_results_irrelevantes)
+    final_df_setor = carregar_etapa(arq_api_original_setor)
+    final_df_small_setor = carregar_etapa(arq_api_setor)
+    df_resumos_setor = carregar_etapa(arq_results_setor)
+    final_df_editoriais = carregar_etapa(arq_api_original_editorial)
+    final_df_small_editoriais = carregar_etapa(arq_api_editorial)
+    final_df_specials = carregar_etapa(arq_api_original_SPECIALS)
+    final_df_small_specials = carregar_etapa(arq_api_SPECIALS)
     return (final_df, final_df_small, final_df_small_irrelevantes, df_resumos_marcas, df_resumos_marcas_irrelevantes,
         final_df_setor, final_df_small_setor, df_resumos_setor, final_df_editoriais, final_df_small_editoriais,
         final_df_specials, final_df_small_specials)
 
-def carregar_configs(caminho_json):
-    with open(caminho_json, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def consultar_apis(configs, max_tentativas=3, timeout_base=30):
-    """
-    Consulta APIs com retry automático e timeouts progressivos
-    Versão simplificada sem dependências extras
-    
-    Args:
-        configs: Lista de configurações das APIs
-        max_tentativas: Número máximo de tentativas por API
-        timeout_base: Timeout base em segundos
-    """
-    lista_df = []
-    
-    for i, config in enumerate(configs):
-        url = config.get("url")
-        data = config.get("data")
-        st.info(f"Consultando API {i+1}/{len(configs)}: {url}")
-        
-        sucesso = False
-        
-        for tentativa in range(1, max_tentativas + 1):
-            try:
-                # Timeout progressivo: 30s, 60s, 90s
-                timeout_atual = timeout_base + (tentativa - 1) * 30
-                
-                st.write(f"  Tentativa {tentativa}/{max_tentativas} (timeout: {timeout_atual}s)")
-                
-                response = requests.post(
-                    url, 
-                    json=data, 
-                    timeout=timeout_atual
-                )
-                
-                if response.status_code == 200:
-                    dados = response.json()
-                    
-                    # Limpar surrogates de todos os registros
-                    try:
-                        dados_limpos = [limpar_registro(r) for r in dados]
-                        st.info(f"  🧹 Limpeza de surrogates aplicada em {len(dados_limpos)} registros")
-                    except Exception as e:
-                        st.warning(f"  ⚠️ Erro na limpeza: {str(e)}. Usando dados originais.")
-                        dados_limpos = dados
-                    
-                    # Criar DataFrame com dados limpos
-                    df_api = pd.DataFrame(dados_limpos)
-                    lista_df.append(df_api)
-                    st.success(f"  ✅ Sucesso: {len(df_api)} registros")
-                    sucesso = True
-                    break
-                    
-                elif response.status_code in [429, 500, 502, 503, 504]:
-                    # Códigos que justificam retry
-                    st.warning(f"  ⚠️ Status {response.status_code} - Tentativa {tentativa}")
-                    if tentativa < max_tentativas:
-                        espera = 5 + (tentativa * 2)  # 7s, 9s, 11s
-                        st.write(f"  ⏳ Aguardando {espera}s...")
-                        time.sleep(espera)
-                else:
-                    # Outros códigos de erro - não faz retry
-                    st.error(f"  ❌ Erro {response.status_code} para URL: {url}")
-                    break
-                    
-            except requests.exceptions.Timeout:
-                st.warning(f"  ⏱️ Timeout após {timeout_atual}s na tentativa {tentativa}")
-                if tentativa < max_tentativas:
-                    espera = 10 * tentativa  # 10s, 20s, 30s
-                    st.write(f"  ⏳ Aguardando {espera}s antes da próxima tentativa...")
-                    time.sleep(espera)
-                    
-            except requests.exceptions.ConnectionError as e:
-                erro_str = str(e)[:100]
-                st.warning(f"  🔌 Erro de conexão na tentativa {tentativa}: {erro_str}...")
-                if tentativa < max_tentativas:
-                    espera = 15 * tentativa  # 15s, 30s, 45s
-                    st.write(f"  ⏳ Aguardando {espera}s antes da próxima tentativa...")
-                    time.sleep(espera)
-                    
-            except requests.exceptions.RequestException as e:
-                erro_str = str(e)[:100]
-                st.error(f"  ❌ Erro de requisição na tentativa {tentativa}: {erro_str}...")
-                if tentativa < max_tentativas:
-                    time.sleep(5 * tentativa)
-                    
-            except Exception as e:
-                erro_str = str(e)[:100]
-                st.error(f"  ❌ Erro inesperado na tentativa {tentativa}: {erro_str}...")
-                if tentativa < max_tentativas:
-                    time.sleep(3 * tentativa)
-        
-        if not sucesso:
-            st.error(f"  ❌ FALHA: Todas as {max_tentativas} tentativas falharam para {url}")
-            st.warning(f"  ⚠️ Continuando com as próximas APIs...")
-    
-    if lista_df:
-        resultado = pd.concat(lista_df, ignore_index=True)
-        st.success(f"\n📊 Total consolidado: {len(resultado)} registros de {len(lista_df)} APIs bem-sucedidas")
-        return resultado
-    else:
-        st.warning(f"\n⚠️ Nenhuma API retornou dados válidos")
-        return pd.DataFrame()
-
 def processar_relatorio():
     """Função principal de processamento baseada na opção selecionada"""
     lock = None
@@ -364,20 +259,57 @@ def processar_relatorio():
             total_steps += 3  # 5, 6, 7
         total_steps += 4  # 8, 9, 10, 11 (sempre executados)
         
+        # ===== CONSULTA DAS APIs (TODAS AS CATEGORIAS EM PARALELO) =====
+        status_text.text("Consultando APIs de clipping...")
+        configs_por_categoria = {}
+        if executar_marcas:
+            configs_por_categoria['MARCAS'] = carregar_configs(api_configs_marca)
+        if executar_setor:
+            # Determinar o arquivo de configuração baseado na opção selecionada
+            if codigo_veiculo:
+                # Para opções específicas de veículos, usar arquivo dedicado
+                caminho_json = f"dados/config/api_setor_{codigo_veiculo}_configs.json"
+                st.info(f"🎯 Usando configuração específica para veículo {codigo_veiculo}: {caminho_json}")
+            else:
+                # Para "Somente Setor" ou "Relatório Completo", usar arquivo geral
+                caminho_json = api_configs_setor
+                st.info(f"📁 Usando configuração geral de setor: {caminho_json}")
+            
+            # Carregar configurações do arquivo apropriado
+            try:
+                configs_por_categoria['SETOR'] = carregar_configs(caminho_json)
+                st.success(f"✅ Carregadas {len(configs_por_categoria['SETOR'])} configurações de {caminho_json}")
+            except FileNotFoundError:
+                st.error(f"❌ Arquivo de configuração não encontrado: {caminho_json}")
+                configs_por_categoria['SETOR'] = []
+            except Exception as e:
+                st.error(f"❌ Erro ao carregar configurações de {caminho_json}: {str(e)}")
+                configs_por_categoria['SETOR'] = []
+        configs_por_categoria['EDITORIAIS'] = carregar_configs(api_configs_editorial)
+        configs_por_categoria['SPECIALS'] = carregar_configs(api_configs_SPECIALS)
+
+        # As consultas rodam em threads; os logs detalhados vão para o console
+        # e a latência por endpoint é exibida aqui, ao final.
+        dfs_api, df_latencias = consultar_categorias(configs_por_categoria, transformar_registro=limpar_registro)
+        imprimir_latencias(df_latencias)
+        st.info("⏱️ Latência por endpoint das APIs de clipping:")
+        st.dataframe(df_latencias, use_container_width=True)
+        falhas = df_latencias[df_latencias['Status'] != 'ok']
+        if not falhas.empty:
+            st.warning(f"⚠️ {len(falhas)} endpoint(s) sem sucesso: {', '.join(falhas['Endpoint'])}")
+        
         # ===== PROCESSAMENTO DE MARCAS =====
         if executar_marcas:
             status_text.text("Iniciando processamento das APIs de MARCAS...")
             current_step += 1
             progress_bar.progress(int((current_step / total_steps) * 90))
             
-            # 2. Chamada de API de MARCAS
-            caminho_json = "dados/config/api_marca_configs.json"
-            configs = carregar_configs(caminho_json)
-            marcas_df = consultar_apis(configs)
+            # 2. Chamada de API de MARCAS (já consultada em paralelo acima)
+            marcas_df = dfs_api['MARCAS']
 
             # Save raw API output for MARCAS (always save the raw payload before any cleaning)
             try:
-                marcas_df.to_excel(arq_api_original_raw, index=False)
+                salvar_etapa(marcas_df, arq_api_original_raw)
                 st.info(f"💾 Favoritos (raw) de MARCAS salvos: {arq_api_original_raw} ({len(marcas_df)} registros)")
             except Exception as e:
                 st.warning(f"⚠️ Não foi possível salvar arquivo raw de MARCAS: {e}")
@@ -396,7 +328,7 @@ def processar_relatorio():
                 st.success(f"✅ {len(marcas_df)} registros obtidos para MARCAS")
                 final_df, final_df_small_bruto = limpar_marcas(marcas_df)
 
-            final_df.to_excel(arq_api_original, index=False)
+            salvar_etapa(final_df, arq_api_original)
             
             # 3. Avaliação de RELEVÂNCIA
             status_text.text("Processando avaliação de relevância...")
@@ -422,8 +354,8 @@ def processar_relatorio():
             st.info(f"📊 final_df_small tem {len(final_df_small)} registros")
             st.info(f"📊 final_df_small_irrelevantes tem {len(final_df_small_irrelevantes)} registros")
 
-            final_df_small.to_excel(arq_api, index=False)
-            final_df_small_irrelevantes.to_excel(arq_api_irrelevantes, index=False)
+            salvar_etapa(final_df_small, arq_api)
+            salvar_etapa(final_df_small_irrelevantes, arq_api_irrelevantes)
 
             # 4.A Agrupa MARCAS por SIMILARIDADE e gera RESUMOS pelo DeepSeek - Notícias Relevantes
             status_text.text("Agrupando notícias relevantes por similaridade...")
@@ -439,7 +371,7 @@ def processar_relatorio():
                 df_resumos_marcas = agrupar_noticias_por_similaridade(final_df_small)
 
             st.info(f"📊 df_resumos_marcas resultante tem {len(df_resumos_marcas)} registros")
-            df_resumos_marcas.to_excel(arq_results, index=False)
+            salvar_etapa(df_resumos_marcas, arq_results)
 
             # 4.B Agrupa MARCAS por SIMILARIDADE e gera RESUMOS pelo DeepSeek - Notícias Irrelevantes
             status_text.text("Agrupando notícias irrelevantes por similaridade...")
@@ -455,11 +387,11 @@ def processar_relatorio():
                 df_resumos_marcas_irrelevantes = agrupar_noticias_por_similaridade(final_df_small_irrelevantes)
 
             if df_resumos_marcas_irrelevantes is not None and not df_resumos_marcas_irrelevantes.empty:
-                df_resumos_marcas_irrelevantes.to_excel(arq_results_irrelevantes, index=False)
+                salvar_etapa(df_resumos_marcas_irrelevantes, arq_results_irrelevantes)
             else:
                 st.warning("⚠️ Nenhuma notícia irrelevante encontrada. Gerando arquivo vazio com cabeçalho.")
                 colunas = ["Marca", "GrupoID", "QtdNoticias", "Ids", "Resumo"]
-                pd.DataFrame(columns=colunas).to_excel(arq_results_irrelevantes, index=False)
+                salvar_etapa(pd.DataFrame(columns=colunas), arq_results_irrelevantes)
         else:
             # Criar DataFrames vazios para MARCAS quando não processadas
             st.info("📋 Pulando processamento de MARCAS conforme opção selecionada")
@@ -474,11 +406,11 @@ def processar_relatorio():
             df_resumos_marcas_irrelevantes = pd.DataFrame(columns=colunas_resumos)
             
             # Salvar DataFrames vazios
-            final_df.to_excel(arq_api_original, index=False)
-            final_df_small.to_excel(arq_api, index=False)
-            final_df_small_irrelevantes.to_excel(arq_api_irrelevantes, index=False)
-            df_resumos_marcas.to_excel(arq_results, index=False)
-            df_resumos_marcas_irrelevantes.to_excel(arq_results_irrelevantes, index=False)
+            salvar_etapa(final_df, arq_api_original)
+            salvar_etapa(final_df_small, arq_api)
+            salvar_etapa(final_df_small_irrelevantes, arq_api_irrelevantes)
+            salvar_etapa(df_resumos_marcas, arq_results)
+            salvar_etapa(df_resumos_marcas_irrelevantes, arq_results_irrelevantes)
 
         # ===== PROCESSAMENTO DE SETOR =====
         if executar_setor:
@@ -487,28 +419,7 @@ def processar_relatorio():
             current_step += 1
             progress_bar.progress(int((current_step / total_steps) * 90))
             
-            # Determinar o arquivo de configuração baseado na opção selecionada
-            if codigo_veiculo:
-                # Para opções específicas de veículos, usar arquivo dedicado
-                caminho_json = f"dados/config/api_setor_{codigo_veiculo}_configs.json"
-                st.info(f"🎯 Usando configuração específica para veículo {codigo_veiculo}: {caminho_json}")
-            else:
-                # Para "Somente Setor" ou "Relatório Completo", usar arquivo geral
-                caminho_json = "dados/config/api_setor_configs.json"
-                st.info(f"📁 Usando configuração geral de setor: {caminho_json}")
-            
-            # Carregar configurações do arquivo apropriado
-            try:
-                configs = carregar_configs(caminho_json)
-                st.success(f"✅ Carregadas {len(configs)} configurações de {caminho_json}")
-            except FileNotFoundError:
-                st.error(f"❌ Arquivo de configuração não encontrado: {caminho_json}")
-                configs = []
-            except Exception as e:
-                st.error(f"❌ Erro ao carregar configurações de {caminho_json}: {str(e)}")
-                configs = []
-            
-            setor_df = consultar_apis(configs)
+            setor_df = dfs_api['SETOR']  # já consultado em paralelo acima
 
             # Salvar arquivo raw de SETOR antes da limpeza
             from config import arq_api_original_setor_raw
@@ -533,7 +444,7 @@ def processar_relatorio():
                     if setor_df_safe[col].dtype == object:
                         setor_df_safe[col] = setor_df_safe[col].apply(_sanitize_value_for_excel)
 
-                setor_df_safe.to_excel(arq_api_original_setor_raw, index=False)
+                salvar_etapa(setor_df_safe, arq_api_original_setor_raw)
                 st.info(f"\ud83d\udcbe Favoritos (raw) de SETOR salvos: {arq_api_original_setor_raw} ({len(setor_df)} registros)")
             except Exception as e:
                 st.warning(f"\u26a0\ufe0f N\u00e3o foi poss\u00edvel salvar arquivo raw de SETOR: {e}")
@@ -551,8 +462,8 @@ def processar_relatorio():
             else:
                 st.success(f"\u2705 {len(setor_df)} registros obtidos para SETOR")
                 final_df_setor, final_df_small_setor = limpar_setor(setor_df)
-            final_df_setor.to_excel(arq_api_original_setor, index=False)
-            final_df_small_setor.to_excel(arq_api_setor, index=False)
+            salvar_etapa(final_df_setor, arq_api_original_setor)
+            salvar_etapa(final_df_small_setor, arq_api_setor)
 
             # 6. Agrupa notícias de SETOR por SIMILARIDADE e gera PROMPTS para resumos
             status_text.text("Gerando prompts para resumos de SETOR...")
@@ -563,7 +474,7 @@ def processar_relatorio():
                 df_prompts_setor = pd.DataFrame(columns=['Id', 'Tipo', 'Prompt', 'Tema', 'RelevanceScore', 'IdVeiculo'])
             else:
                 df_prompts_setor = gerar_prompts_setor(final_df_small_setor)
-            df_prompts_setor.to_excel(arq_prompts_setor, index=False)
+            salvar_etapa(df_prompts_setor, arq_prompts_setor)
 
             # 7. Processa RESUMOS de notícias de SETOR
             status_text.text("Processando resumos de SETOR...")
@@ -574,7 +485,7 @@ def processar_relatorio():
                 df_resumos_setor = pd.DataFrame(columns=['Tema', 'Id', 'Resumo'])
             else:
                 df_resumos_setor = gerar_resumos_setor(df_prompts_setor)
-            df_resumos_setor.to_excel(arq_results_setor, index=False)
+            salvar_etapa(df_resumos_setor, arq_results_setor)
         else:
             # Criar DataFrames vazios para SETOR quando não processado
             st.info("📋 Pulando processamento de SETOR conforme opção selecionada")
@@ -588,10 +499,10 @@ def processar_relatorio():
             df_resumos_setor = pd.DataFrame(columns=colunas_resumos_setor)
             
             # Salvar DataFrames vazios
-            final_df_setor.to_excel(arq_api_original_setor, index=False)
-            final_df_small_setor.to_excel(arq_api_setor, index=False)
-            df_prompts_setor.to_excel(arq_prompts_setor, index=False)
-            df_resumos_setor.to_excel(arq_results_setor, index=False)
+            salvar_etapa(final_df_setor, arq_api_original_setor)
+            salvar_etapa(final_df_small_setor, arq_api_setor)
+            salvar_etapa(df_prompts_setor, arq_prompts_setor)
+            salvar_etapa(df_resumos_setor, arq_results_setor)
 
         # ===== PROCESSAMENTO DE EDITORIAIS (SEMPRE EXECUTADO) =====
         # 8. Chamada de API de EDITORIAIS
@@ -599,9 +510,7 @@ def processar_relatorio():
         current_step += 1
         progress_bar.progress(int((current_step / total_steps) * 90))
         
-        caminho_json = "dados/config/api_editorial_configs.json"
-        configs = carregar_configs(caminho_json)
-        editoriais_df = consultar_apis(configs)
+        editoriais_df = dfs_api['EDITORIAIS']  # já consultado em paralelo acima
 
         if editoriais_df.empty:
             st.warning("⚠️ ATENÇÃO: Nenhum registro retornado pelas APIs de EDITORIAIS!")
@@ -617,8 +526,8 @@ def processar_relatorio():
             st.success(f"✅ {len(editoriais_df)} registros obtidos para EDITORIAIS")
             final_df_editoriais, final_df_small_editoriais = limpar_editoriais(editoriais_df)
 
-        final_df_editoriais.to_excel(arq_api_original_editorial, index=False)
-        final_df_small_editoriais.to_excel(arq_api_editorial, index=False)
+        salvar_etapa(final_df_editoriais, arq_api_original_editorial)
+        salvar_etapa(final_df_small_editoriais, arq_api_editorial)
 
         # ===== PROCESSAMENTO DE SPECIALS (SEMPRE EXECUTADO) =====
         # 9. Chamada de API de SPECIALS
@@ -626,9 +535,7 @@ def processar_relatorio():
         current_step += 1
         progress_bar.progress(int((current_step / total_steps) * 90))
         
-        caminho_json = "dados/config/api_SPECIALS_configs.json"
-        configs = carregar_configs(caminho_json)
-        specials_df = consultar_apis(configs)
+        specials_df = dfs_api['SPECIALS']  # já consultado em paralelo acima
 
         if specials_df.empty:
             st.warning("⚠️ ATENÇÃO: Nenhum registro retornado pelas APIs de SPECIALS!")
@@ -644,8 +551,8 @@ def processar_relatorio():
             st.success(f"✅ {len(specials_df)} registros obtidos para SPECIALS")
             final_df_specials, final_df_small_specials = limpar_specials(specials_df)
 
-        final_df_specials.to_excel(arq_api_original_SPECIALS, index=False)
-        final_df_small_specials.to_excel(arq_api_SPECIALS, index=False)
+        salvar_etapa(final_df_specials, arq_api_original_SPECIALS)
+        salvar_etapa(final_df_small_specials, arq_api_SPECIALS)
 
         # ===== GERAÇÃO DOS RELATÓRIOS (SEMPRE EXECUTADO) =====
         # 10. Geração do RELATÓRIO DE DESTAQUES
@@ -656,7 +563,7 @@ def processar_relatorio():
         # Preparar dados para merge se necessário
         if not final_df_small.empty:
             try:
-                df_short = pd.read_excel('dados/api/shorturls_por_id.xlsx')
+                df_short = carregar_etapa(arq_shorturls)
                 final_df_small['Id'] = final_df_small['Id'].astype(int)
                 df_short['Id'] = df_short['Id'].astype(int)
                 final_df_small = final_df_small.merge(df_short, on=['Id', 'Canais'], how='left')
@@ -0,0 +1,97 @@
+# ============================================================================
+# CONTAGEM DE TERMOS POR TEMA EM UMA ÚNICA PASSADA
+# ============================================================================
+# Arquivo: matcher_termos.py
+# Descrição: Substitui o re.findall de uma regex r'\b(?:t1|t2|...)\b' por tema
+#            por uma árvore de prefixos (trie) com todos os termos de todos os
+#            temas, montada uma vez. O texto é percorrido uma única vez: só nas
+#            posições com fronteira de palavra (\b) a trie é consultada, e a
+#            contagem de cada tema segue exatamente a semântica do findall
+#            (casamento mais à esquerda, primeira alternativa da lista, sem
+#            sobreposição dentro do mesmo tema).
+# ============================================================================
+
+import numpy as np
+
+
+def _palavra(caractere):
+    """Mesma definição de \\w do módulo re para str (Unicode)"""
+    return caractere.isalnum() or caractere == "_"
+
+
+class ContadorTermos:
+    """
+    Uso:
+        contador = ContadorTermos(temas_termos)   # {tema: [termos]}
+        contagens = contador.contar(texto)        # {tema: n}, na ordem de temas_termos
+        matriz = contador.matriz(textos)          # array (textos x temas) para a coluna inteira
+    """
+
+    def __init__(self, temas_termos):
+        self.temas = list(temas_termos)
+        # Cada nó: (filhos {caractere: nó}, {índice do tema: posição do termo na lista do tema})
+        self._raiz = ({}, {})
+        for indice_tema, (tema, termos) in enumerate(temas_termos.items()):
+            for ordem, termo in enumerate(termos):
+                if not termo:
+                    continue
+                no = self._raiz
+                for caractere in termo:
+                    no = no[0].setdefault(caractere, ({}, {}))
+                # Termo repetido no mesmo tema: vale a primeira ocorrência (como na alternância da regex)
+                no[1].setdefault(indice_tema, ordem)
+
+    def contar(self, texto):
+        """Quantidade de casamentos de cada tema, igual a len(re.findall(padrão_do_tema, texto))"""
+        return dict(zip(self.temas, self._contagens(texto)))
+
+    def matriz(self, textos):
+        """Matriz (textos x temas) de contagens, na ordem de self.temas"""
+        textos = list(textos)
+        matriz = np.zeros((len(textos), len(self.temas)), dtype=np.int64)
+        for i, texto in enumerate(textos):
+            matriz[i] = self._contagens(texto)
+        return matriz
+
+    def _contagens(self, texto):
+        contagens = [0] * len(self.temas)
+        # Próxima posição livre por tema (o findall não sobrepõe casamentos)
+        livre = [0] * len(self.temas)
+        filhos_raiz = self._raiz[0]
+        n = len(texto)
+        anterior_palavra = False
+
+        for inicio in range(n):
+            caractere = texto[inicio]
+            atual_palavra = _palavra(caractere)
+            # \b inicial: o primeiro caractere do termo é texto[inicio]
+            fronteira = atual_palavra != anterior_palavra
+            anterior_palavra = atual_palavra
+            if not fronteira or caractere not in filhos_raiz:
+                continue
+
+            # Para cada tema, o termo que casa em `inicio` com menor posição na lista do tema
+            melhores = {}
+            no = filhos_raiz[caractere]
+            fim = inicio + 1
+            while True:
+                if no[1]:
+                    # \b final: entre o último caractere do termo e o seguinte (fim do texto conta como não-palavra)
+                    proximo_palavra = fim < n and _palavra(texto[fim])
+                    if _palavra(texto[fim - 1]) != proximo_palavra:
+                        for indice_tema, ordem in no[1].items():
+                            if livre[indice_tema] <= inicio and (
+                                    indice_tema not in melhores or ordem < melhores[indice_tema][0]):
+                                melhores[indice_tema] = (ordem, fim)
+                if fim >= n:
+                    break
+                no = no[0].get(texto[fim])
+                if no is None:
+                    break
+                fim += 1
+
+            for indice_tema, (_, fim_termo) in melhores.items():
+                contagens[indice_tema] += 1
+                livre[indice_tema] = fim_termo
+
+        return contagens
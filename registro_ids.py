@@ -0,0 +1,163 @@
+# ============================================================================
+# REGISTRO PERSISTENTE DE IDs JÁ PROCESSADOS (INGESTÃO INCREMENTAL)
+# ============================================================================
+# Arquivo: registro_ids.py
+# Descrição: Guarda em disco, por (Id, Canais), o hash do conteúdo da notícia
+#            e os resultados já obtidos (relevância e resumo de 60 palavras).
+#            Em reexecuções no mesmo dia, só as notícias novas ou alteradas
+#            voltam a passar pelo DeepSeek.
+# ============================================================================
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from config import arq_ids_processados, dias_retencao_ids_processados, ingestao_incremental
+
+NOVO = "novo"
+ALTERADO = "alterado"
+INALTERADO = "inalterado"
+
+
+def hash_conteudo(titulo, conteudo):
+    """Hash do texto da notícia (Titulo + Conteudo)"""
+    titulo = "" if pd.isna(titulo) else str(titulo)
+    conteudo = "" if pd.isna(conteudo) else str(conteudo)
+    return hashlib.sha1(f"{titulo}\n{conteudo}".encode("utf-8", "ignore")).hexdigest()
+
+
+def _chave(id_noticia, canal):
+    return f"{id_noticia}|{canal}"
+
+
+class RegistroIdsProcessados:
+    """
+    Armazena {"Id|Canais": {"hash", "visto_em", <resultados>}} em um arquivo JSON,
+    além dos resultados por lote ("lote|..."), como os resumos consolidados de uma marca.
+    Entradas mais antigas que a janela de retenção são descartadas ao carregar.
+    """
+
+    def __init__(self, arquivo=arq_ids_processados, dias_retencao=dias_retencao_ids_processados):
+        self.arquivo = arquivo
+        self.dias_retencao = dias_retencao
+        self._lock = threading.Lock()
+        self.registros = self._carregar()
+
+    def _carregar(self):
+        if not os.path.exists(self.arquivo):
+            return {}
+        try:
+            with open(self.arquivo, 'r', encoding='utf-8') as f:
+                registros = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Erro ao carregar registro de IDs ({self.arquivo}): {e}. Iniciando vazio.")
+            return {}
+
+        limite = (datetime.now() - timedelta(days=self.dias_retencao)).isoformat()
+        validos = {k: v for k, v in registros.items() if v.get("visto_em", "") >= limite}
+        if len(validos) < len(registros):
+            print(f"🧹 Registro de IDs: {len(registros) - len(validos)} entrada(s) expirada(s) removida(s)")
+        return validos
+
+    def salvar(self):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.arquivo) or ".", exist_ok=True)
+            temporario = self.arquivo + ".tmp"
+            with open(temporario, 'w', encoding='utf-8') as f:
+                json.dump(self.registros, f, ensure_ascii=False)
+            os.replace(temporario, self.arquivo)
+
+    def classificar(self, df):
+        """
+        Classifica cada linha (Id, Canais) como novo, alterado ou inalterado.
+
+        Returns:
+            (Series com o status por linha, Series com o hash por linha)
+        """
+        hashes = pd.Series(
+            [hash_conteudo(t, c) for t, c in zip(df['Titulo'], df['Conteudo'])],
+            index=df.index, dtype=object
+        )
+        status = []
+        for id_noticia, canal, h in zip(df['Id'], df['Canais'], hashes):
+            registro = self.registros.get(_chave(id_noticia, canal))
+            if registro is None:
+                status.append(NOVO)
+            elif registro.get("hash") != h:
+                status.append(ALTERADO)
+            else:
+                status.append(INALTERADO)
+        status = pd.Series(status, index=df.index, dtype=object)
+
+        contagem = status.value_counts()
+        print(f"🗂️ Ingestão incremental: {contagem.get(NOVO, 0)} nova(s), "
+              f"{contagem.get(ALTERADO, 0)} alterada(s), {contagem.get(INALTERADO, 0)} inalterada(s)")
+        return status, hashes
+
+    def obter(self, df, campo):
+        """
+        Resultados já salvos de `campo` para as linhas inalteradas.
+        Linhas novas, alteradas ou sem o campo ficam como None.
+        """
+        status, _ = self.classificar(df)
+        valores = []
+        for id_noticia, canal, st in zip(df['Id'], df['Canais'], status):
+            valor = None
+            if st == INALTERADO:
+                valor = self.registros[_chave(id_noticia, canal)].get(campo)
+            valores.append(valor)
+        return pd.Series(valores, index=df.index, dtype=object)
+
+    def registrar(self, df, campo):
+        """Grava `campo` de cada linha, junto do hash atual do conteúdo, e salva em disco"""
+        agora = datetime.now().isoformat()
+        with self._lock:
+            for id_noticia, canal, titulo, conteudo, valor in zip(
+                df['Id'], df['Canais'], df['Titulo'], df['Conteudo'], df[campo]
+            ):
+                if valor is None or (not isinstance(valor, str) and pd.isna(valor)):
+                    continue
+                chave = _chave(id_noticia, canal)
+                h = hash_conteudo(titulo, conteudo)
+                registro = self.registros.get(chave)
+                if registro is None or registro.get("hash") != h:
+                    registro = {"hash": h}
+                    self.registros[chave] = registro
+                registro["visto_em"] = agora
+                registro[campo] = valor.item() if hasattr(valor, "item") else valor
+        self.salvar()
+
+    def assinatura_lote(self, df, prefixo=""):
+        """Assinatura de um conjunto de notícias: muda se qualquer (Id, Canais) ou conteúdo mudar"""
+        itens = sorted(
+            f"{_chave(i, c)}|{hash_conteudo(t, x)}"
+            for i, c, t, x in zip(df['Id'], df['Canais'], df['Titulo'], df['Conteudo'])
+        )
+        return f"lote|{prefixo}|" + hashlib.sha1("\n".join(itens).encode("utf-8")).hexdigest()
+
+    def obter_lote(self, assinatura):
+        """Resultado salvo para um conjunto de notícias idêntico, ou None"""
+        registro = self.registros.get(assinatura)
+        return registro.get("resultado") if registro else None
+
+    def registrar_lote(self, assinatura, resultado):
+        with self._lock:
+            self.registros[assinatura] = {"visto_em": datetime.now().isoformat(), "resultado": resultado}
+        self.salvar()
+
+
+_registro_padrao = None
+
+
+def obter_registro():
+    """Instância compartilhada do registro, ou None se a ingestão incremental estiver desligada"""
+    global _registro_padrao
+    if not ingestao_incremental:
+        return None
+    if _registro_padrao is None:
+        _registro_padrao = RegistroIdsProcessados()
+    return _registro_padrao
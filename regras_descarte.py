@@ -0,0 +1,188 @@
+# ============================================================================
+# REGRAS DE DESCARTE POR VEÍCULO (NOTÍCIAS DE SETOR)
+# ============================================================================
+# Arquivo: regras_descarte.py
+# Descrição: As regras de descarte de cada IdVeiculo ficam numa tabela de
+#            dados (REGRAS_DESCARTE). Cada veículo tem um avaliador compilado:
+#            as primeiras linhas do conteúdo são percorridas uma única vez
+#            (igualdade por dicionário, prefixos por uma regex), e listas de
+#            nomes (ex.: colunistas do Valor) viram uma única regex. Para cada
+#            notícia descartada é registrada a regra responsável (a primeira da
+#            tabela que casar), para auditoria.
+# ============================================================================
+
+import re
+import time
+
+import pandas as pd
+
+# Colunistas do Valor (IdVeiculo 10459): descarta se qualquer nome aparecer no texto
+COLUNISTAS_VALOR = {
+    'alex ribeiro', 'amir labaki', 'ana inoue', 'ana maria diniz', 'andrea jubé',
+    'armando castelar pinheiro', 'assis moreira', 'betania tanure', 'bruno carazza',
+    'catherine vieira', 'césar felício', 'claudia safatle', 'claudio garcia',
+    'daniela cachich', 'daniela chiaretti', 'edvaldo santana', 'fernando exman',
+    'fernando torres', 'gustavo loyola', 'humberto saccomandi', 'isabel clemente',
+    'isis borge', 'jairo saddi', 'joaquim levy', 'jorge arbache', 'jorge lucki',
+    'josé de souza martins', 'josé eli da veiga', 'josé júlio senna', 'luiz gonzaga belluzzo',
+    'luiz schymura', 'marcelo cardoso', 'marcelo d’agosto', 'márcio garcia',
+    'maria clara r. m. do prado', 'maria cristina fernandes', 'mariana clark',
+    'mario mesquita', 'marli olmos', 'michel laub', 'naercio menezes filho',
+    'nilson teixeira', 'pedro butcher', 'pedro cafardo', 'pedro cavalcanti e renato fragelli',
+    'rafael souto', 'renato bernhoeft', 'robinson borges', 'sergio chaia',
+    'sergio lamucci', 'stela campos', 'tatiana salem levy', 'tiago cavalcanti',
+    'vicky bloch', 'viviane martins'
+}
+
+# Tipos de regra (comparações em minúsculas, linhas sem espaços nas pontas):
+#   ("titulo_igual", texto)         título igual ao texto
+#   ("linha_igual", texto, n)       alguma das n primeiras linhas do conteúdo igual ao texto
+#   ("linha_comeca", texto, n)      alguma das n primeiras linhas começa com o texto
+#   ("contem", texto)               título + conteúdo contém o texto
+#   ("contem_algum", nome, lista)   título + conteúdo contém algum item da lista
+REGRAS_DESCARTE = {
+    331: [
+        ("linha_igual", "análise", 10),
+        ("linha_igual", "opinião", 10),
+        ("linha_igual", "erramos", 10),
+        ("linha_igual", "painel do leitor", 10),
+        ("linha_igual", "mortes", 10),
+        ("linha_igual", "tendências/debates", 10),
+        ("linha_igual", "tendências / debates", 10),
+        ("linha_igual", "réplica", 10),
+        ("titulo_igual", "expediente"),
+        ("linha_igual", "expediente", 5),
+    ],
+    10459: [
+        ("linha_igual", "análise", 10),
+        ("linha_igual", "opinião jurídica", 10),
+        ("linha_igual", "opinião", 10),
+        ("titulo_igual", "expediente"),
+        ("linha_igual", "expediente", 5),
+        ("contem_algum", "colunista do valor", COLUNISTAS_VALOR),
+    ],
+    682: [
+        ("titulo_igual", "expediente"),
+        ("linha_igual", "expediente", 5),
+        ("linha_igual", "análise", 15),
+        ("linha_igual", "opinião", 15),
+        ("linha_igual", "mensagens cartas@oglobo.com.br", 10),
+        ("linha_igual", "*artigo", 10),
+        ("linha_igual", "artigo", 10),
+        ("contem", "oglobo.globo.com/opinião"),
+        ("titulo_igual", "falecimentos"),
+    ],
+    675: [
+        ("linha_igual", "espaço aberto", 10),
+        ("linha_comeca", "notas e informações", 10),
+        ("titulo_igual", "expediente"),
+        ("titulo_igual", "obituário"),
+        ("titulo_igual", "falecimentos"),
+        ("linha_comeca", "artigo", 10),
+    ],
+}
+
+# Mesmas quebras de linha de str.splitlines()
+_QUEBRA_LINHA = re.compile(r'\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
+
+def _nome_regra(id_veiculo, regra):
+    tipo, valor = regra[0], regra[1]
+    return f"{id_veiculo} {tipo} '{valor}'" + (f" ({regra[2]} linhas)" if tipo.startswith("linha_") else "")
+
+
+class RegrasVeiculo:
+    """Avaliador compilado das regras de um veículo"""
+
+    def __init__(self, id_veiculo, regras):
+        self.nomes = [_nome_regra(id_veiculo, r) for r in regras]
+        self.titulos = {}           # título -> índice da regra
+        self.linhas_iguais = {}     # linha -> [(índice da regra, n linhas)]
+        self.prefixos = []          # (prefixo, índice da regra, n linhas)
+        self.contem = []            # (regex compilada, índice da regra)
+        for indice, regra in enumerate(regras):
+            tipo = regra[0]
+            if tipo == "titulo_igual":
+                self.titulos.setdefault(regra[1], indice)
+            elif tipo == "linha_igual":
+                self.linhas_iguais.setdefault(regra[1], []).append((indice, regra[2]))
+            elif tipo == "linha_comeca":
+                self.prefixos.append((regra[1], indice, regra[2]))
+            elif tipo == "contem":
+                self.contem.append((re.compile(re.escape(regra[1])), indice))
+            elif tipo == "contem_algum":
+                if regra[2]:
+                    padrao = '|'.join(re.escape(item) for item in sorted(regra[2], key=len, reverse=True))
+                    self.contem.append((re.compile(padrao), indice))
+            else:
+                raise ValueError(f"Tipo de regra desconhecido: {tipo}")
+        limites = [n for regras_linha in self.linhas_iguais.values() for _, n in regras_linha]
+        limites += [n for _, _, n in self.prefixos]
+        self.max_linhas = max(limites, default=0)
+        self.regex_prefixos = re.compile('|'.join(re.escape(p) for p, _, _ in self.prefixos)) if self.prefixos else None
+
+    def avaliar(self, titulo, conteudo):
+        """Índice da primeira regra (na ordem da tabela) que casa, ou None"""
+        primeira = self.titulos.get(titulo)
+
+        if self.max_linhas:
+            linhas = _QUEBRA_LINHA.split(conteudo, maxsplit=self.max_linhas) if conteudo else []
+            for posicao, linha in enumerate(linhas[:self.max_linhas]):
+                linha = linha.strip()
+                for indice, n in self.linhas_iguais.get(linha, ()):
+                    if posicao < n and (primeira is None or indice < primeira):
+                        primeira = indice
+                if self.regex_prefixos is not None and self.regex_prefixos.match(linha):
+                    for prefixo, indice, n in self.prefixos:
+                        if posicao < n and (primeira is None or indice < primeira) and linha.startswith(prefixo):
+                            primeira = indice
+
+        if self.contem:
+            texto_completo = (titulo + ' ' + conteudo).strip()
+            for regex, indice in self.contem:
+                if (primeira is None or indice < primeira) and regex.search(texto_completo):
+                    primeira = indice
+        return primeira
+
+
+def _texto_normalizado(serie):
+    return serie.where(serie.notna(), '').astype(str).str.strip().str.lower()
+
+
+def aplicar_regras_descarte(df, regras=REGRAS_DESCARTE):
+    """
+    Avalia as regras de descarte de cada veículo.
+
+    Returns:
+        Series (alinhada a df) com o nome da regra que descartou a notícia, ou None
+    """
+    motivos = pd.Series(None, index=df.index, dtype=object)
+    for id_veiculo, regras_veiculo in regras.items():
+        do_veiculo = (df['IdVeiculo'] == id_veiculo).fillna(False).astype(bool)
+        if not do_veiculo.any():
+            continue
+        avaliador = RegrasVeiculo(id_veiculo, regras_veiculo)
+        titulos = _texto_normalizado(df.loc[do_veiculo, 'Titulo']) if 'Titulo' in df.columns \
+            else pd.Series('', index=df.index[do_veiculo])
+        conteudos = _texto_normalizado(df.loc[do_veiculo, 'Conteudo'])
+        motivos.loc[do_veiculo] = [
+            None if indice is None else avaliador.nomes[indice]
+            for indice in map(avaliador.avaliar, titulos, conteudos)
+        ]
+    return motivos
+
+
+def descartar_por_veiculo(df, regras=REGRAS_DESCARTE):
+    """Remove as notícias que casam com alguma regra do seu veículo e imprime o resumo por veículo e por regra"""
+    inicio = time.perf_counter()
+    motivos = aplicar_regras_descarte(df, regras)
+    descartar = motivos.notna()
+    num_descartadas = int(descartar.sum())
+    if num_descartadas > 0:
+        print(f"🧹 Pré-processamento: descartando {num_descartadas} notícias por regras de veículo (de {len(df)}) "
+              f"em {time.perf_counter() - inicio:.2f}s")
+        print(f"   ↳ Descartes por IdVeiculo: {df.loc[descartar, 'IdVeiculo'].value_counts().to_dict()}")
+        print("   ↳ Descartes por regra:")
+        for regra, quantidade in motivos[descartar].value_counts().items():
+            print(f"      {quantidade:>4}  {regra}")
+    return df[~descartar].copy(), motivos
@@ -368,16 +368,21 @@ def gerar_versao_preliminar(final_df_small_marca, final_df_small_marca_irrelevan
         if 'Id' not in row_setor or pd.isna(row_setor['Id']):
             continue
 
-        try:
-            news_id = int(str(row_setor['Id']).strip())
-        except ValueError:
+        # Id pode trazer as cópias da mesma matéria em outros veículos ("id1,id2,...");
+        # o primeiro é o representante, que dá o título e o resumo
+        noticias_setor = []
+        for news_id_str in str(row_setor['Id']).split(','):
+            try:
+                news_id = int(news_id_str.strip())
+            except ValueError:
+                continue
+            news_info = final_df_setor[final_df_setor['Id'] == news_id]
+            if not news_info.empty:
+                noticias_setor.append(news_info.iloc[0])
+        if not noticias_setor:
             continue
 
-        news_info_setor = final_df_setor[final_df_setor['Id'] == news_id]
-        if news_info_setor.empty:
-            continue
-            
-        news_info_setor = news_info_setor.iloc[0]
+        news_info_setor = noticias_setor[0]
 
         w_veiculo_setor = news_info_setor['Veiculo']
         # Apenas para apresentação no relatório: remover a parte após a barra
@@ -397,6 +402,13 @@ def gerar_versao_preliminar(final_df_small_marca, final_df_small_marca_irrelevan
         short_url_setor = gerenciador_urls.obter_url_curta(w_url_setor)
 
         document.add_paragraph(short_url_setor)
+
+        # Demais veículos que publicaram a mesma matéria
+        if len(noticias_setor) > 1:
+            copias_string = ", ".join(
+                f"{sanitizar_veiculo(copia['Veiculo'])} ({gerenciador_urls.obter_url_curta(copia['UrlVisualizacao'])})"
+                for copia in noticias_setor[1:])
+            document.add_paragraph(f"Também em: {copias_string}")
         document.add_paragraph("*")
 
     # ========================================================================
@@ -497,17 +497,23 @@ def gerar_versao_preliminar(final_df_small_marca, final_df_small_marca_irrelevan
                         print(f"Aviso: Linha {index} no df_resumo_setor não tem Id válido. Pulando.")
                         continue
 
-                    try:
-                        news_id = int(str(row_setor['Id']).strip())
-                    except ValueError:
-                        print(f"Aviso: Não foi possível converter ID '{row_setor['Id']}' para inteiro na linha {index} de df_resumo_setor. Pulando.")
+                    # Id pode trazer as cópias da mesma matéria em outros veículos ("id1,id2,...");
+                    # o primeiro é o representante, que dá o título e o resumo
+                    noticias_setor = []
+                    for news_id_str in str(row_setor['Id']).split(','):
+                        try:
+                            news_id = int(news_id_str.strip())
+                        except ValueError:
+                            print(f"Aviso: Não foi possível converter ID '{news_id_str}' para inteiro na linha {index} de df_resumo_setor. Pulando.")
+                            continue
+                        news_info = final_df_setor[final_df_setor['Id'] == news_id]
+                        if news_info.empty:
+                            print(f"Aviso: ID {news_id} não encontrado em final_df_setor para resumo de Setor. Pulando.")
+                            continue
+                        noticias_setor.append(news_info.iloc[0])
+                    if not noticias_setor:
                         continue
-
-                    news_info_setor = final_df_setor[final_df_setor['Id'] == news_id]
-                    if news_info_setor.empty:
-                        print(f"Aviso: ID {news_id} não encontrado em final_df_setor para resumo de Setor. Pulando.")
-                        continue
-                    news_info_setor = news_info_setor.iloc[0]
+                    news_info_setor = noticias_setor[0]
 
                     w_veiculo_setor = news_info_setor['Veiculo'].title()
                     # Apenas para apresentação no relatório: remover a parte após a barra
@@ -527,6 +533,14 @@ def gerar_versao_preliminar(final_df_small_marca, final_df_small_marca_irrelevan
                     short_url_setor = encurtar_url_seguro(w_url_setor, gerenciador_urls, max_tentativas=3, delay=1)
                     document.add_paragraph(short_url_setor)
 
+                    # Demais veículos que publicaram a mesma matéria
+                    if len(noticias_setor) > 1:
+                        copias_string = ", ".join(
+                            f"{sanitizar_veiculo(copia['Veiculo'].title())} "
+                            f"({encurtar_url_seguro(copia['UrlVisualizacao'], gerenciador_urls, max_tentativas=3, delay=1)})"
+                            for copia in noticias_setor[1:])
+                        document.add_paragraph(f"Também em: {copias_string}")
+
                     document.add_paragraph("*")
 
     # 3. SEÇÃO DE EDITORIAIS (CONDICIONAL)
@@ -1,4 +1,4 @@
-import requests
+import json
 import pandas as pd
 import os
 import configparser
@@ -39,7 +39,10 @@ def obter_chave_deepseek():
     
     return chave
 
-from config import DEEPSEEK_API_URL
+from config import relevancia_em_lote, max_itens_lote_relevancia
+from registro_ids import obter_registro
+from cliente_deepseek import obter_cliente_deepseek
+from duplicatas import chave_materia
 
 def avaliar_relevancia(df):
     PROMPT_CHARACTER_LIMIT = 30000
@@ -50,10 +53,8 @@ def avaliar_relevancia(df):
 
     api_key = obter_chave_deepseek()
 
-    HEADERS = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
+    # Cliente compartilhado: conexões persistentes, limite de concorrência e de taxa
+    cliente = obter_cliente_deepseek(api_key)
 
     # Carregamento inicial
     #df = pd.read_excel(arq_api)
@@ -81,151 +82,175 @@ def avaliar_relevancia(df):
 
         try:
             print(f"Enviando requisição ao DeepSeek para avaliar a marca '{marca}'...")
-            response = requests.post(DEEPSEEK_API_URL, headers=HEADERS, json=data)
-            response.raise_for_status()
-            resposta = response.json()["choices"][0]["message"]["content"].strip()
+            resposta = cliente.conteudo(data)
             print(f"Resposta do DeepSeek: {resposta}")
             return resposta.lower().startswith("true")
         except Exception as e:
             print(f"Erro ao avaliar relevância: {e}")
             return True  # Em caso de erro, assume como relevante para não perder
 
-    # Avalia relevância se ainda não tiver sido feito
-    if 'RelevanciaMarca' not in df.columns or df['RelevanciaMarca'].isnull().all():
-        print("Avaliando relevância da marca nas notícias...")
-        df['RelevanciaMarca'] = df.apply(lambda row: avaliar_relevancia_marca(row['Canais'], row['TextoCompleto']), axis=1)
-
-        # --- Início do ajuste para remover duplicatas relevantes ---
-        # Define a ordem de prioridade das marcas
-        # Removed duplicate 'Eldorado' from the list
-        marca_order = ['JBS', 'J&F', 'PicPay', 'Eldorado', 'Joesley Batista', 'Wesley Batista', 'Banco Original']
-
-        # Cria uma coluna temporária para ordenação personalizada
-        df['Marca_Order'] = pd.Categorical(df['Canais'], categories=marca_order, ordered=True)
-
-        # Filtra apenas as notícias relevantes (RelevanciaMarca == True) para aplicar a lógica de desduplicação
-        df_relevantes = df[df['RelevanciaMarca'] == True].copy()
-
-        # Ordena por Id e pela ordem de prioridade das marcas
-        # Para IDs duplicados, a linha com a marca de maior prioridade (menor valor na categoria) virá primeiro
-        df_relevantes_sorted = df_relevantes.sort_values(by=['Id', 'Marca_Order'], ascending=[True, True])
-
-        # Remove duplicatas de Id, mantendo a primeira ocorrência (que será a de maior prioridade devido à ordenação)
-        df_relevantes_deduplicadas = df_relevantes_sorted.drop_duplicates(subset='Id', keep='first')
-
-        # Remove a coluna temporária de ordenação
-        df_relevantes_deduplicadas = df_relevantes_deduplicadas.drop(columns=['Marca_Order'])
-
-        # Separa as notícias irrelevantes do DataFrame original
-        df_irrelevantes = df[df['RelevanciaMarca'] == False].copy()
-
-        # Remove a coluna temporária de ordenação das irrelevantes também
-        df_irrelevantes = df_irrelevantes.drop(columns=['Marca_Order'])
-
-
-        # Concatena as notícias relevantes deduplicadas com as irrelevantes
-        # A ordem das linhas não é garantida após a concatenação, mas as linhas corretas foram mantidas.
-        # Se a ordem original for importante, pode ser necessário um passo adicional para reordenar.
-        df_final_relevancia = pd.concat([df_relevantes_deduplicadas, df_irrelevantes], ignore_index=True)
-
-        # --- NOVO PASSO: Remover notícias irrelevantes de df_final_relevancia ---
-        print("Removendo notícias irrelevantes de df_final_relevancia...")
-        df_final_relevancia = df_final_relevancia[df_final_relevancia['RelevanciaMarca'] == True].copy()
-        print(f"df_final_relevancia agora contém {len(df_final_relevancia)} notícias relevantes.")
-        # --- FIM NOVO PASSO ---
-
-
-        # Salva o DataFrame final (agora apenas relevantes) no arquivo de relevância
-        #df_final_relevancia.to_excel("api/Favoritos_Marcas_Relevancia.xlsx", index=False)
-        #print("Arquivo api/Favoritos_Marcas_Relevancia.xlsx salvo (contém apenas notícias relevantes).")
-
-        # --- Novo: Remover registros de final_df_small_marca que não estão em df_final_relevancia (Id e Canais) ---
-        # Carregar final_df_small_marca para processamento
-        #final_df_small_marca = pd.read_excel(arq_api)
-        final_df_small_marca = df
-
-        # Criar um conjunto de tuplas (Id, Canais) das notícias que devem ser MANTIDAS (usando o df_final_relevancia já filtrado)
-        ids_canais_to_keep = set(zip(df_final_relevancia['Id'], df_final_relevancia['Canais']))
-
-        # Filtrar final_df_small_marca para manter apenas as linhas cujos (Id, Canais) estão no conjunto
-        # Ensure 'Canais' is treated as string in both DFs for consistent comparison
-        final_df_small_marca['Canais'] = final_df_small_marca['Canais'].astype(str)
-        df_final_relevancia['Canais'] = df_final_relevancia['Canais'].astype(str)
-
-        ids_canais_to_keep = set(zip(df_final_relevancia['Id'], df_final_relevancia['Canais']))
-
-        # Apply the filter
-        final_df_small_marca_processed = final_df_small_marca[
-            final_df_small_marca.apply(lambda row: (row['Id'], row['Canais']) in ids_canais_to_keep, axis=1)
-        ].copy()
-
-        return final_df_small_marca_processed, df_irrelevantes
-
-        # Sobrescrever o arquivo Favoritos_Marcas_small.xlsx
-        #final_df_small_marca_processed.to_excel(arq_api, index=False)
-        #print(f"Arquivo {arq_api} sobrescrito após remoção de registros que não foram considerados relevantes/prioritários.")
-
-        # --- Fim do novo ajuste ---
-
-
+    # ===== Modo em lote: várias notícias em um único prompt =====
+    # Cada item é uma notícia (Id) com TODAS as suas marcas pendentes: o texto vai uma única vez
+    # e a relevância de cada marca volta junto, em vez de uma chamada por linha (Id, marca).
+    CABECALHO_LOTE = (
+        "Para cada item abaixo, avalie a relevância de cada marca indicada na notícia do item.\n\n"
+        "A marca deve ser considerada relevante quando influencia ou é influenciada pelos fatos descritos no texto, mesmo que de forma indireta ou moderada. "
+        "Caso contrário, se a marca for apenas citada superficialmente, sem vínculo com os eventos principais, considere irrelevante.\n\n"
+        "Responda APENAS com um array JSON contendo, para cada item e na mesma ordem dos itens, "
+        "um array de booleanos com uma posição por marca, na ordem em que as marcas foram listadas "
+        "(ex.: [[true], [false, true]]). Não inclua nenhum outro texto.\n\n"
+    )
+
+    def _bloco_item(i, marcas, texto):
+        lista_marcas = ", ".join(f'"{m}"' for m in marcas)
+        return f"### Item {i}\nMarcas: {lista_marcas}\nTexto:\n{texto}\n\n"
+
+    def montar_lotes(itens):
+        """Agrupa os itens (marcas, texto) em lotes cujo prompt fica abaixo de PROMPT_CHARACTER_LIMIT"""
+        max_itens = max_itens_lote_relevancia if relevancia_em_lote else 1
+        lotes = []
+        atual = []
+        tamanho = len(CABECALHO_LOTE)
+        for item in itens:
+            tamanho_item = len(_bloco_item(len(atual) + 1, *item))
+            if atual and (tamanho + tamanho_item > PROMPT_CHARACTER_LIMIT or len(atual) >= max_itens):
+                lotes.append(atual)
+                atual = []
+                tamanho = len(CABECALHO_LOTE)
+            atual.append(item)
+            tamanho += tamanho_item
+        if atual:
+            lotes.append(atual)
+        return lotes
+
+    def _booleano(v):
+        if isinstance(v, bool):
+            return v
+        if isinstance(v, str) and v.strip().lower() in ("true", "false"):
+            return v.strip().lower() == "true"
+        return None
+
+    def _interpretar_lote(resposta, lote):
+        """Lista (um item por notícia) de listas de booleanos (uma por marca), ou None se fora do formato"""
+        inicio, fim = resposta.find('['), resposta.rfind(']')
+        if inicio == -1 or fim <= inicio:
+            return None
+        try:
+            valores = json.loads(resposta[inicio:fim + 1])
+        except ValueError:
+            return None
+        # Lote de um único item pode vir sem o array externo: [true, false]
+        if len(lote) == 1 and isinstance(valores, list) and valores and not isinstance(valores[0], list):
+            valores = [valores]
+        if not isinstance(valores, list) or len(valores) != len(lote):
+            return None
+        resultado = []
+        for (marcas, _), item in zip(lote, valores):
+            if not isinstance(item, list) or len(item) != len(marcas):
+                return None
+            booleanos = [_booleano(v) for v in item]
+            if None in booleanos:
+                return None
+            resultado.append(booleanos)
+        return resultado
+
+    def avaliar_relevancia_lote(lote):
+        """
+        Avalia um lote de notícias (cada uma com suas marcas) em uma só chamada.
+        Se a resposta não vier no formato, avalia cada (marca, notícia) individualmente.
+        """
+        if len(lote) == 1 and len(lote[0][0]) == 1:
+            marcas, texto = lote[0]
+            return [[avaliar_relevancia_marca(marcas[0], texto)]]
+
+        prompt = CABECALHO_LOTE + "".join(_bloco_item(i, m, t) for i, (m, t) in enumerate(lote, 1))
+        total_marcas = sum(len(marcas) for marcas, _ in lote)
+        data = {
+            "model": "deepseek-chat",
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0,
+            "max_tokens": 10 + 4 * len(lote) + 6 * total_marcas
+        }
+        try:
+            print(f"Enviando lote de {len(lote)} notícia(s) / {total_marcas} marca(s) ao DeepSeek...")
+            resultado = _interpretar_lote(cliente.conteudo(data), lote)
+            if resultado is not None:
+                return resultado
+            print(f"⚠️ Resposta do lote fora do formato esperado. Avaliando {total_marcas} marca(s) individualmente.")
+        except Exception as e:
+            print(f"Erro ao avaliar lote de relevância: {e}. Avaliando item a item.")
+        return [[avaliar_relevancia_marca(marca, texto) for marca in marcas] for marcas, texto in lote]
+
+    # Avalia relevância apenas das linhas ainda sem resultado.
+    # Com a ingestão incremental, notícias inalteradas reaproveitam a avaliação salva.
+    registro = obter_registro()
+    if 'RelevanciaMarca' not in df.columns:
+        df['RelevanciaMarca'] = None
+    if registro is not None:
+        salvos = registro.obter(df, 'RelevanciaMarca')
+        df['RelevanciaMarca'] = df['RelevanciaMarca'].where(df['RelevanciaMarca'].notna(), salvos)
+
+    pendentes = df['RelevanciaMarca'].isna()
+    if pendentes.any():
+        # Uma entrada por matéria (cópias quase idênticas em outros veículos contam uma vez só),
+        # com todas as suas marcas pendentes (na ordem das linhas)
+        df_pendentes = pd.DataFrame({
+            'Materia': chave_materia(df)[pendentes], 'Canais': df.loc[pendentes, 'Canais'],
+            'TextoCompleto': df.loc[pendentes, 'TextoCompleto']
+        })
+        itens_por_id = {}
+        for id_noticia, marca, texto in df_pendentes.itertuples(index=False):
+            marcas, _ = itens_por_id.setdefault(id_noticia, ([], texto))
+            if marca not in marcas:
+                marcas.append(marca)
+        ids = list(itens_por_id)
+        itens = [itens_por_id[i] for i in ids]
+
+        lotes = montar_lotes(itens)
+        print(f"Avaliando relevância de {len(df_pendentes)} par(es) (Id, marca) de {len(ids)} matéria(s) "
+              f"em {len(lotes)} chamada(s) (até {cliente.max_concorrencia} em paralelo)...")
+        # Lotes e itens voltam na mesma ordem de entrada
+        resultados = [r for resultado_lote in cliente.mapear(avaliar_relevancia_lote, lotes) for r in resultado_lote]
+
+        relevancia_por_par = {}
+        for id_noticia, (marcas, _), booleanos in zip(ids, itens, resultados):
+            for marca, relevante in zip(marcas, booleanos):
+                relevancia_por_par[(id_noticia, marca)] = relevante
+        df.loc[pendentes, 'RelevanciaMarca'] = [
+            relevancia_por_par[(i, m)] for i, m in zip(df_pendentes['Materia'], df_pendentes['Canais'])
+        ]
+        if registro is not None:
+            registro.registrar(df[pendentes], 'RelevanciaMarca')
     else:
         print("Coluna RelevanciaMarca já presente.")
-        # Se a coluna já existe, mas o usuário quer aplicar a desduplicação,
-        # você pode adicionar a lógica de desduplicação aqui também,
-        # lendo o arquivo existente e re-salvando após a desduplicação.
-        # Por simplicidade nesta resposta, apenas imprimimos a mensagem.
-        # Para um comportamento mais robusto, a lógica de desduplicação
-        # poderia ser aplicada sempre, ou ter uma flag para controlá-la.
-        # Como a coluna RelevanciaMarca já existe, vamos carregar o df
-        # e aplicar a lógica de desduplicação para garantir que o arquivo
-        # de relevância esteja correto para as próximas etapas.
-
-        print("Aplicando desduplicação em notícias relevantes do arquivo existente...")
-        # Removed duplicate 'Eldorado' from the list
-        marca_order = ['JBS', 'J&F', 'PicPay', 'Eldorado', 'Joesley Batista', 'Wesley Batista', 'Banco Original']
-        df['Marca_Order'] = pd.Categorical(df['Canais'], categories=marca_order, ordered=True)
-        df_relevantes = df[df['RelevanciaMarca'] == True].copy()
-        df_relevantes_sorted = df_relevantes.sort_values(by=['Id', 'Marca_Order'], ascending=[True, True])
-        df_relevantes_deduplicadas = df_relevantes_sorted.drop_duplicates(subset='Id', keep='first')
-        df_relevantes_deduplicadas = df_relevantes_deduplicadas.drop(columns=['Marca_Order'])
-
-        df_irrelevantes = df[df['RelevanciaMarca'] == False].copy()
-        df_irrelevantes = df_irrelevantes.drop(columns=['Marca_Order']) # Remove se existia antes ou foi criada
-
-        df_final_relevancia = pd.concat([df_relevantes_deduplicadas, df_irrelevantes], ignore_index=True)
-
-        # --- NOVO PASSO: Remover notícias irrelevantes de df_final_relevancia (no bloco else) ---
-        print("Removendo notícias irrelevantes de df_final_relevancia (no bloco else)...")
-        df_final_relevancia = df_final_relevancia[df_final_relevancia['RelevanciaMarca'] == True].copy()
-        print(f"df_final_relevancia agora contém {len(df_final_relevancia)} notícias relevantes (no bloco else).")
-        # --- FIM NOVO PASSO ---
-
-        df_final_relevancia.to_excel("api/Favoritos_Marcas_Relevancia.xlsx", index=False)
-        print("Arquivo api/Favoritos_Marcas_Relevancia.xlsx re-salvo após desduplicação (contém apenas notícias relevantes).")
-
-        # --- Novo: Remover registros de final_df_small_marca que não estão em df_final_relevancia (Id e Canais) (caso a coluna já existisse) ---
-        # Carregar final_df_small_marca para processamento
-        #final_df_small_marca = pd.read_excel(arq_api)
-        final_df_small_marca = df
-
-        # Criar um conjunto de tuplas (Id, Canais) das notícias que devem ser MANTIDAS (usando o df_final_relevancia já filtrado)
-        # Ensure 'Canais' is treated as string in both DFs for consistent comparison
-        final_df_small_marca['Canais'] = final_df_small_marca['Canais'].astype(str)
-        df_final_relevancia['Canais'] = df_final_relevancia['Canais'].astype(str)
-
-        ids_canais_to_keep = set(zip(df_final_relevancia['Id'], df_final_relevancia['Canais']))
-
-        # Apply the filter
-        final_df_small_marca_processed = final_df_small_marca[
-            final_df_small_marca.apply(lambda row: (row['Id'], row['Canais']) in ids_canais_to_keep, axis=1)
-        ].copy()
-
-        # Sobrescrever o arquivo Favoritos_Marcas_small.xlsx
-        #final_df_small_marca_processed.to_excel(arq_api, index=False)
-        print(f"Arquivo {arq_api} sobrescrito após remoção de registros que não foram considerados relevantes/prioritários (coluna RelevanciaMarca já existia).")
-        
-        return final_df_small_marca_processed, df_irrelevantes
-        # --- Fim do novo ajuste (caso a coluna já existisse) ---
-
-
-    # --- Fim do ajuste para remover duplicatas relevantes ---
+
+    # --- Desduplicação das notícias relevantes por prioridade de marca ---
+    # Para cada Id, apenas a marca relevante de maior prioridade é mantida.
+    marca_order = ['JBS', 'J&F', 'PicPay', 'Eldorado', 'Joesley Batista', 'Wesley Batista', 'Banco Original']
+
+    # Prioridade como código do categórico ordenado; marcas fora da lista vão para o fim (como NaN no sort)
+    codigos = pd.Categorical(df['Canais'], categories=marca_order, ordered=True).codes
+    prioridade = pd.Series(codigos, index=df.index).where(codigos >= 0, len(marca_order))
+
+    relevantes = df['RelevanciaMarca'] == True
+    df_irrelevantes = df[df['RelevanciaMarca'] == False].copy()
+
+    # Ordenação estável por (Id, prioridade) e primeira linha de cada Id
+    df_relevantes_deduplicadas = (
+        pd.DataFrame({'Id': df['Id'][relevantes], 'Prioridade': prioridade[relevantes], 'Canais': df['Canais'][relevantes]})
+        .sort_values(by=['Id', 'Prioridade'], kind='stable')
+        .drop_duplicates(subset='Id', keep='first')
+    )
+    print(f"df_final_relevancia agora contém {len(df_relevantes_deduplicadas)} notícias relevantes.")
+
+    # Semi-join em (Id, Canais): mantém as linhas de df cujo par está entre os escolhidos
+    df['Canais'] = df['Canais'].astype(str)
+    pares_mantidos = pd.MultiIndex.from_arrays(
+        [df_relevantes_deduplicadas['Id'], df_relevantes_deduplicadas['Canais'].astype(str)]
+    )
+    manter = pd.MultiIndex.from_arrays([df['Id'], df['Canais']]).isin(pares_mantidos)
+    final_df_small_marca_processed = df[manter].copy()
+
+    return final_df_small_marca_processed, df_irrelevantes
@@ -4,7 +4,7 @@
 
 import pandas as pd
 import os
-import requests
+from requests.exceptions import Timeout
 import re
 import configparser
 import traceback
@@ -35,7 +35,15 @@ def obter_chave_deepseek():
     return chave
 
 
-from config import DEEPSEEK_API_URL, w_marcas
+from config import w_marcas, arq_shorturls, agrupamento_embeddings_ativo, deepseek_timeout, \
+    max_resumos_prompt_agrupamento
+from armazenamento_etapas import salvar_etapa
+from registro_ids import obter_registro
+from cliente_deepseek import obter_cliente_deepseek
+from agendador_tarefas import AgendadorTarefas
+from duplicatas import chave_materia
+from sanitizador_datas import remover_datas_passadas, remover_datas_nao_presentes_no_original, \
+    corrigir_datas_inventadas
 
 
 def carregar_verbos_iniciais():
@@ -294,237 +302,6 @@ def limpar_frases_introdutorias(texto_resumo):
     return texto_limpo.strip()
 
 
-def remover_datas_passadas(texto_resumo):
-    """
-    Nova função: Remove menções explícitas a datas que se referem a eventos no passado.
-    Mantém datas futuras (com verbos no futuro ou expressões como "previsto para", "deve ocorrer em").
-    
-    Esta função identifica padrões de datas associadas a verbos no passado e as remove,
-    mantendo apenas datas associadas a eventos futuros.
-    
-    Exemplos:
-    - Remove: "anunciou em 29/01/2026", "afirmou em 29 de janeiro", "em 29 de janeiro, a empresa lançou"
-    - Mantém: "previsto para 10 de fevereiro", "deve ocorrer em 11 de fevereiro"
-    
-    Args:
-        texto_resumo: texto do resumo a ser processado
-        
-    Returns:
-        texto sem datas passadas
-    """
-    if not texto_resumo:
-        return texto_resumo
-    
-    print(f"\n🔍 [REMOVER_DATAS_PASSADAS] Texto original: {texto_resumo[:100]}...")
-    
-    # ========== PADRÃO 1: Datas com formato DD/MM/YYYY ==========
-    # Remove: "em 29/01/2026", "dia 29/01/2026", "na data 29/01/2026"
-    # Padrão: palavra + "em" ou "dia" + data DD/MM/YYYY
-    padrao_data_barra = r'\b(em|dia|na data|no dia)\s+\d{1,2}/\d{1,2}/\d{4}\b'
-    texto_modificado = re.sub(padrao_data_barra, '', texto_resumo, flags=re.IGNORECASE)
-    
-    # ========== PADRÃO 2: Datas com formato "DD de MÊS" ou "DD de MÊS de YYYY" ==========
-    # Remove: "em 29 de janeiro", "dia 29 de janeiro de 2026", "na quinta-feira (29)"
-    meses = r'(?:janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro)'
-    dias_semana = r'(?:segunda|terça|quarta|quinta|sexta|sábado|domingo)(?:-feira)?'
-    
-    # Padrão 2a: Proteger datas futuras marcando-as temporariamente
-    # Proteção 1: Expressões futuras explícitas
-    texto_modificado = re.sub(
-        r'\b(previsto para|prevista para|programado para|deve ocorrer em|ocorrerá em|acontecerá em|será em|será no dia|marcado para|agendado para)\s+(\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?)',
-        r'__PROTEGER_DATA__\1 \2__FIM_PROTECAO__',
-        texto_modificado,
-        flags=re.IGNORECASE
-    )
-    
-    # Proteção 2: "próximo/próxima" + dia/data (NOVO)
-    # Exemplos: "no próximo dia 5", "na próxima segunda-feira", "próximo dia 10 de fevereiro"
-    texto_modificado = re.sub(
-        r'\b(no próximo|na próxima|próximo|próxima)\s+(dia|' + dias_semana + r')?\s*(\d{1,2}(?:\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?)?)',
-        r'__PROTEGER_DATA__\1 \2 \3__FIM_PROTECAO__',
-        texto_modificado,
-        flags=re.IGNORECASE
-    )
-    
-    # Padrão 2b: Remover datas após verbos no passado
-    # Lista de verbos comuns no passado (ATUALIZADA - incluindo "condenou", "pautaram", etc.)
-    verbos_passado = r'(?:anunciou|informou|divulgou|publicou|comunicou|reportou|declarou|afirmou|revelou|confirmou|lançou|apresentou|mostrou|indicou|condenou|condenaram|pautou|pautaram|pautaram|decidiu|decidiram|aprovou|aprovaram|realizou|realizaram|registrou|registraram|assinou|assinaram|entregou|entregaram|enviou|enviaram|recebeu|receberam|aceitou|aceitaram|rejeitou|rejeitaram|negou|negaram|admitiu|admitiram|reconheceu|reconheceram|criticou|criticaram|acusou|acusaram|denunciou|denunciaram|investigou|investigaram|descobriu|descobriram|encontrou|encontraram|identificou|identificaram|descartou|descartaram)'
-    
-    # CORREÇÃO CRÍTICA: Capturar vírgula opcional APÓS o verbo e removê-la junto com a data
-    # Exemplos: "condenou, em 17 de setembro" → "condenou"
-    # Padrão: verbo + vírgula opcional + espaços + "em" opcional + data
-    padrao_verbo_data = r'\b(' + verbos_passado + r')\s*,?\s*(?:em\s+|no\s+|na\s+|dia\s+|nesta\s+|desta\s+|naquele\s+|daquele\s+|nessa\s+|desse\s+|naquela\s+|daquela\s+)?\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\s*,?'
-    texto_modificado = re.sub(padrao_verbo_data, r'\1', texto_modificado, flags=re.IGNORECASE)
-    
-    # Padrão 2b2: Remover datas após verbos no passado com "para"
-    # Exemplos: "pautaram para 18 de setembro" → "pautaram"
-    # Nota: Mesmo que "para" indique futuro, o verbo está no passado, então a ação já ocorreu
-    padrao_verbo_para_data = r'\b(' + verbos_passado + r')\s+para\s+(?:o\s+dia\s+|esta\s+\w+-feira\s+\(\d{1,2}\)|)?\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\b'
-    texto_modificado = re.sub(padrao_verbo_para_data, r'\1', texto_modificado, flags=re.IGNORECASE)
-    
-    # Padrão 2c: Remover datas com preposições explícitas (padrão original)
-    padrao_data_extenso = r'\b(?:em|dia|no dia|na data|nesta|nesta data|neste dia)\s+\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\b'
-    texto_modificado = re.sub(padrao_data_extenso, '', texto_modificado, flags=re.IGNORECASE)
-    
-    # ========== PADRÃO 3: Datas com dia da semana e número ==========
-    # Remove: "nesta quinta-feira (29)", "na última quinta-feira (29)"
-    dias_semana = r'(?:segunda|terça|quarta|quinta|sexta|sábado|domingo)(?:-feira)?'
-    padrao_dia_semana = r'\b(?:nesta|neste|na|no|desta|deste|da|do|última|último)\s+' + dias_semana + r'\s*\(\d{1,2}\)'
-    texto_modificado = re.sub(padrao_dia_semana, '', texto_modificado, flags=re.IGNORECASE)
-    
-    # ========== PADRÃO 4: Limpeza de resíduos ==========
-    # Remove espaços duplos, vírgulas órfãs e outros resíduos
-    texto_modificado = re.sub(r'^\s*,\s*', '', texto_modificado)  # Remove vírgula no início
-    texto_modificado = re.sub(r'\s+,', ',', texto_modificado)  # Remove espaços antes de vírgulas
-    texto_modificado = re.sub(r',\s*,', ',', texto_modificado)  # Remove vírgulas duplas
-    texto_modificado = re.sub(r'\s{2,}', ' ', texto_modificado)  # Remove espaços múltiplos
-    texto_modificado = re.sub(r'\b(na|no|da|do)\s+(na|no|da|do|após|antes)\b', r'\2', texto_modificado, flags=re.IGNORECASE)  # Remove preposições duplicadas
-    
-    # ========== RESTAURAR DATAS PROTEGIDAS ==========
-    texto_modificado = re.sub(r'__PROTEGER_DATA__', '', texto_modificado)
-    texto_modificado = re.sub(r'__FIM_PROTECAO__', '', texto_modificado)
-    
-    # Limpar espaços no início e fim
-    texto_final = texto_modificado.strip()
-    
-    # Log das alterações
-    if texto_final != texto_resumo:
-        print(f"✅ [REMOVER_DATAS_PASSADAS] Datas passadas removidas")
-        print(f"   Original: {texto_resumo[:100]}...")
-        print(f"   Modificado: {texto_final[:100]}...")
-    else:
-        print(f"ℹ️  [REMOVER_DATAS_PASSADAS] Nenhuma data passada encontrada para remover")
-    
-    return texto_final
-
-
-def remover_datas_nao_presentes_no_original(texto_resumo, texto_original):
-    """
-    Remove datas mencionadas no resumo que NÃO estão presentes no texto original.
-    Isso previne alucinações do modelo que inventa datas.
-    
-    Args:
-        texto_resumo: resumo gerado
-        texto_original: texto da notícia original
-        
-    Returns:
-        resumo com datas inventadas removidas
-    """
-    if not texto_resumo or not texto_original:
-        return texto_resumo
-    
-    # Extrair todas as datas do texto original
-    meses = r'(?:janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro)'
-    
-    # Padrões de datas no original
-    padroes_original = [
-        r'\b\d{1,2}/\d{1,2}/\d{4}\b',  # DD/MM/YYYY
-        r'\b\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\b',  # DD de mês [de YYYY]
-        r'\b(?:nesta|desta|na|no)\s+(?:segunda|terça|quarta|quinta|sexta|sábado|domingo)(?:-feira)?\s*\(\d{1,2}\)\b',  # nesta quinta (23)
-        r'\bamanhã\s*,?\s*\d{1,2}\b',  # amanhã, 28
-    ]
-    
-    datas_no_original = set()
-    for padrao in padroes_original:
-        matches = re.findall(padrao, texto_original, re.IGNORECASE)
-        datas_no_original.update(matches)
-    
-    print(f"🔍 [REMOVER_DATAS_NAO_PRESENTES] Datas encontradas no original: {list(datas_no_original)}")
-    
-    # Agora, procurar datas no resumo que NÃO estão no original
-    texto_modificado = texto_resumo
-    
-    # Padrões de datas no resumo a serem verificados
-    padroes_resumo = [
-        (r'\b\d{1,2}/\d{1,2}/\d{4}\b', lambda m: m.group(0)),  # DD/MM/YYYY
-        (r'\b\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\b', lambda m: m.group(0)),  # DD de mês
-        (r'\b(?:em|dia|no dia|na data|nesta|neste)\s+\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\b', lambda m: m.group(0).replace(re.match(r'\b(?:em|dia|no dia|na data|nesta|neste)\s+', m.group(0)).group(0), '')),  # em DD de mês
-    ]
-    
-    for padrao, extrator in padroes_resumo:
-        for match in re.finditer(padrao, texto_modificado, re.IGNORECASE):
-            data_resumo = extrator(match)
-            if data_resumo not in datas_no_original:
-                print(f"⚠️ [REMOVER_DATAS_NAO_PRESENTES] Data '{data_resumo}' não está no original - removendo")
-                # Remover a data e preposições associadas (ex: "em 17 de setembro", "em 17 de setembro,")
-                padrão_com_preposicao = r'(?:\b(?:em|no|na|no dia|na data|dia)\b\s*)?' + re.escape(match.group(0)) + r'(?:,)?'
-                texto_modificado = re.sub(padrão_com_preposicao, '', texto_modificado, flags=re.IGNORECASE)
-    
-    # Limpeza final
-    texto_modificado = re.sub(r'\s{2,}', ' ', texto_modificado)
-    texto_modificado = re.sub(r'^\s*,\s*', '', texto_modificado)
-    texto_modificado = re.sub(r'\s+,\s*', ', ', texto_modificado)
-    texto_modificado = texto_modificado.strip()
-    
-    if texto_modificado != texto_resumo:
-        print(f"✅ [REMOVER_DATAS_NAO_PRESENTES] Datas não presentes removidas")
-        print(f"   Original: {texto_resumo}")
-        print(f"   Modificado: {texto_modificado}")
-    
-    return texto_modificado
-
-
-def corrigir_datas_inventadas(texto_resumo, texto_original):
-    """Corrige ou remove datas inventadas no resumo, preservando referências de mês sem dia."""
-    if not texto_resumo:
-        return texto_resumo
-
-    meses = r'(?:janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro)'
-
-    # Extrair datas explícitas do texto original
-    datas_originais = set(re.findall(r'\b\d{1,2}/\d{1,2}/\d{4}\b', texto_original))
-    datas_originais.update(re.findall(r'\b\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\b', texto_original, flags=re.IGNORECASE))
-
-    # Extrair possíveis dias de mês referenciados como dia da semana (nesta quinta-feira (23))
-    dias_semana_orig = set(re.findall(r'\b(?:nesta|desta|na|no)\s+(?:segunda(?:-feira)?|terça(?:-feira)?|quarta(?:-feira)?|quinta(?:-feira)?|sexta(?:-feira)?|sábado(?:-feira)?|domingo(?:-feira)?)\s*\((\d{1,2})\)', texto_original, flags=re.IGNORECASE))
-
-    texto_corrigido = texto_resumo
-
-    # Substituir data inventada com dia/mês (sem ano) por mês apenas quando não estiver presente no original
-    def _substituir_dia_mes(match):
-        data = match.group(0)
-        dia = match.group(1)
-        mes = match.group(2)
-        data_normalizada = f"{dia} de {mes}".lower()
-
-        if data_normalizada in (d.lower() for d in datas_originais):
-            return data  # manter se presente no original
-
-        if dia in dias_semana_orig:
-            # Se original tinha dia da semana com mesmo dia, manter formato de dia da semana preferido
-            return f"{mes}"
-
-        # Remover dia, mantendo referência mensal para conservar "em setembro"
-        return f"{mes}"
-
-    texto_corrigido = re.sub(r'\b(\d{1,2})\s+de\s+(' + meses + r')(?:\s+de\s+\d{4})?\b', _substituir_dia_mes, texto_corrigido, flags=re.IGNORECASE)
-
-    # Remover datas completas DD/MM/YYYY não presentes no original
-    def _remover_data_completa(match):
-        data = match.group(0)
-        if data in datas_originais:
-            return data
-        print(f"⚠️ [CORRIGIR_DATAS_INVENTADAS] Removendo data completa inventada: {data}")
-        return ''
-
-    texto_corrigido = re.sub(r'\b\d{1,2}/\d{1,2}/\d{4}\b', _remover_data_completa, texto_corrigido)
-
-    # Remover referências de dia da semana com dia sequencial desconhecido (ex: 'sexta-feira, 23 de setembro')
-    texto_corrigido = re.sub(r'\b(?:segunda(?:-feira)?|terça(?:-feira)?|quarta(?:-feira)?|quinta(?:-feira)?|sexta(?:-feira)?|sábado(?:-feira)?|domingo(?:-feira)?)\s*,?\s*\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\b', '', texto_corrigido, flags=re.IGNORECASE)
-
-    # Limpeza de resíduos resultantes
-    texto_corrigido = re.sub(r'\s{2,}', ' ', texto_corrigido)
-    texto_corrigido = re.sub(r'^\s*,\s*', '', texto_corrigido)
-    texto_corrigido = re.sub(r'\s+,\s*', ', ', texto_corrigido)
-    texto_corrigido = texto_corrigido.strip()
-
-    if texto_corrigido != texto_resumo:
-        print(f"✅ [CORRIGIR_DATAS_INVENTADAS] Correções aplicadas")
-        print(f"   Original: {texto_resumo}")
-        print(f"   Modificado: {texto_corrigido}")
-
-    return texto_corrigido
-
 def processar_marcas_v2(arq_textos):
     """
     Processa textos de notícias e gera resumos consolidados por marca.
@@ -538,10 +315,8 @@ def processar_marcas_v2(arq_textos):
     
     # ========== Configuração da API DeepSeek ==========
     api_key = obter_chave_deepseek()
-    HEADERS = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
+    # Cliente compartilhado (pool de conexões, limite de taxa e cache de respostas)
+    cliente = obter_cliente_deepseek(api_key)
     
     LIMITE_CARACTERES_GRUPO = 12000  # Limite seguro para evitar overflow
     
@@ -628,16 +403,14 @@ Texto:
                     "max_tokens": 200
                 }
                 
-                response = requests.post(DEEPSEEK_API_URL, headers=HEADERS, json=data, timeout=30)
-                response.raise_for_status()
-                resumo = response.json()["choices"][0]["message"]["content"].strip()
+                resumo = cliente.conteudo(data, timeout=30)
                 
                 # Limpar frases introdutórias
                 resumo = limpar_frases_introdutorias(resumo)
                 
                 return resumo
                 
-            except requests.exceptions.Timeout:
+            except Timeout:
                 print(f"⏱️ Timeout na tentativa {attempt + 1} para ID {id_noticia}")
                 if attempt < max_retries - 1:
                     time.sleep(2 ** attempt)  # Backoff exponencial
@@ -653,6 +426,50 @@ Texto:
         return ""
 
     def agrupar_por_similaridade(resumos):
+        """
+        Agrupa resumos por similaridade temática.
+        Com o modelo de embeddings disponível, os grupos candidatos são montados localmente
+        e só os ambíguos vão ao DeepSeek, para confirmar ou dividir, em prompts de tamanho
+        limitado. Sem o modelo, todos os resumos vão num único prompt.
+        Retorna lista de IDs de grupo para cada resumo.
+        """
+        N = len(resumos)
+        if N == 1:
+            return [1]
+
+        # Importado aqui: o agrupamento por embeddings só é carregado quando há resumos a agrupar
+        from agrupamento import pre_agrupar_por_embeddings
+        pre = pre_agrupar_por_embeddings(resumos) if agrupamento_embeddings_ativo else None
+        if pre is None:
+            return agrupar_por_similaridade_llm(resumos)
+        rotulos, ambiguos = pre
+
+        membros = {}
+        for pos, rotulo in enumerate(rotulos):
+            membros.setdefault(rotulo, []).append(pos)
+
+        # Grupos ambíguos grandes são divididos em fatias para caber no prompt
+        fatias = []
+        for rotulo in sorted(ambiguos):
+            posicoes = membros[rotulo]
+            for i in range(0, len(posicoes), max_resumos_prompt_agrupamento):
+                fatias.append(posicoes[i:i + max_resumos_prompt_agrupamento])
+
+        print(f"🧩 Pré-agrupamento por embeddings: {len(membros)} grupo(s) candidato(s) de {N} resumos, "
+              f"{len(ambiguos)} ambíguo(s) enviados ao DeepSeek em {len(fatias)} prompt(s)")
+        subgrupos = cliente.mapear(lambda posicoes: agrupar_por_similaridade_llm([resumos[p] for p in posicoes]), fatias)
+
+        # Chave de grupo por resumo; depois renumera de 1 em diante, na ordem de aparição
+        chaves = [("embedding", rotulo) for rotulo in rotulos]
+        for n_fatia, (posicoes, grupos_fatia) in enumerate(zip(fatias, subgrupos)):
+            for pos, grupo in zip(posicoes, grupos_fatia):
+                chaves[pos] = ("deepseek", n_fatia, grupo)
+        numeros = {}
+        grupos = [numeros.setdefault(chave, len(numeros) + 1) for chave in chaves]
+        print(f"✅ Agrupamento concluído: {len(numeros)} grupos distintos de {N} resumos")
+        return grupos
+
+    def agrupar_por_similaridade_llm(resumos):
         """
         Agrupa resumos por similaridade temática usando o DeepSeek.
         Retorna lista de IDs de grupo para cada resumo.
@@ -748,9 +565,7 @@ Texto:
         }
         
         try:
-            resp = requests.post(DEEPSEEK_API_URL, headers=HEADERS, json=data, timeout=60)
-            resp.raise_for_status()
-            content = resp.json()["choices"][0]["message"]["content"].strip()
+            content = cliente.conteudo(data, timeout=60)
             
             m = re.search(r'\{.*\}', content, flags=re.DOTALL)
             if m:
@@ -816,9 +631,7 @@ Texto:
 
         data = {"model": "deepseek-chat","messages":[{"role":"user","content":prompt}],"temperature":0,"max_tokens":200}
         try:
-            resp = requests.post(DEEPSEEK_API_URL, headers=HEADERS, json=data, timeout=60)
-            resp.raise_for_status()
-            content = resp.json()["choices"][0]["message"]["content"].strip()
+            content = cliente.conteudo(data, timeout=60)
             
             m = re.search(r'\{.*\}', content, flags=re.DOTALL)
             if m:
@@ -918,9 +731,7 @@ Gere um resumo único de até 120 palavras consolidando as notícias a seguir so
             "max_tokens": 400
         }
         try:
-            response = requests.post(DEEPSEEK_API_URL, headers=HEADERS, json=data)
-            response.raise_for_status()
-            texto = response.json()["choices"][0]["message"]["content"].strip()
+            texto = cliente.conteudo(data, timeout=deepseek_timeout)
 
             # limpar cabeçalhos "** Resumo ... **"
             linhas = texto.split('\n')
@@ -1005,20 +816,50 @@ Gere um resumo único de até 120 palavras consolidando as notícias a seguir so
         todas_marcas = df['Canais'].dropna().unique().tolist()
         resultados = []
 
-        for marca in todas_marcas:
-            print(f"\n📄 Processando marca: {marca}")
-            df_marca = df[df['Canais'] == marca].copy().reset_index(drop=True)
-
-            resumos = [gerar_resumo_60(row['TextoCompleto'], row['Id']) for _, row in df_marca.iterrows()]
-            df_marca['Resumo60'] = resumos
+        # Ingestão incremental: notícias inalteradas reaproveitam o resumo de 60 palavras salvo
+        registro = obter_registro()
+
+        # ========== Pipeline por marca com agendador de dependências ==========
+        # resumo 60 (por notícia) → agrupamento (por marca) → resumo consolidado (por grupo).
+        # Cada etapa de uma marca é agendada assim que a anterior dela termina, sem esperar
+        # as outras marcas; entre as tarefas prontas, as etapas finais têm prioridade.
+        PRIORIDADE_CONSOLIDADO, PRIORIDADE_AGRUPAMENTO, PRIORIDADE_RESUMO60 = 0, 1, 2
+        agendador = AgendadorTarefas(cliente.max_concorrencia, nome="marcas")
+        dados_marcas = {}   # marca -> (df_marca, assinatura, resultado_salvo)
+        faltando_60 = {}    # marca -> resumos de 60 palavras ainda em andamento
+        grupos_marca = {}   # marca -> [(grupo_id, df_grupo), ...]
+        consolidados = {}   # (marca, grupo_id) -> resumo consolidado
+
+        def _agendar_agrupamento(marca):
+            df_marca = dados_marcas[marca][0]
+            # Cópias da mesma matéria (quase-duplicatas) herdam o resumo do representante
+            materia = chave_materia(df_marca)
+            df_marca['Resumo60'] = df_marca['Resumo60'].where(
+                df_marca['Resumo60'].notna(), df_marca.groupby(materia)['Resumo60'].transform('first'))
+            if registro is not None:
+                # Resumos com erro não são guardados, para serem refeitos na próxima execução
+                validos = ~df_marca['Resumo60'].astype(str).str.startswith('[Erro')
+                registro.registrar(df_marca[validos], 'Resumo60')
+            # Uma entrada por matéria no agrupamento; as cópias seguem o grupo do representante
+            agendador.agendar(agrupar_por_similaridade, df_marca.loc[~materia.duplicated(), 'Resumo60'].tolist(),
+                              prioridade=PRIORIDADE_AGRUPAMENTO,
+                              ao_concluir=lambda grupos, m=marca: _agrupamento_concluido(m, grupos))
+
+        def _resumo60_concluido(marca, pos, resumo):
+            dados_marcas[marca][0].at[pos, 'Resumo60'] = resumo
+            faltando_60[marca] -= 1
+            if faltando_60[marca] == 0:
+                _agendar_agrupamento(marca)
+
+        def _agrupamento_concluido(marca, grupos):
+            df_marca = dados_marcas[marca][0]
+            codigos_materia, materias = pd.factorize(chave_materia(df_marca))
 
-            grupos = agrupar_por_similaridade(resumos)
-            
             # Validar que grupos é uma lista de escalares
-            if not isinstance(grupos, list) or len(grupos) != len(resumos):
+            if not isinstance(grupos, list) or len(grupos) != len(materias):
                 print(f"⚠️ Erro nos grupos para marca {marca}. Usando grupos sequenciais.")
-                grupos = list(range(1, len(resumos) + 1))
-            
+                grupos = list(range(1, len(materias) + 1))
+
             # Verificar se algum elemento ainda é uma lista
             grupos_seguros = []
             for i, grupo in enumerate(grupos):
@@ -1027,12 +868,61 @@ Gere um resumo único de até 120 palavras consolidando as notícias a seguir so
                     grupos_seguros.append(grupo[0] if grupo else i+1)
                 else:
                     grupos_seguros.append(grupo)
-            
-            df_marca['GrupoID'] = grupos_seguros
+
+            df_marca['GrupoID'] = [grupos_seguros[c] for c in codigos_materia]
             df_marca['GrupoID'] = df_marca['GrupoID'].astype(str)
 
-            for grupo_id, df_grupo in df_marca.groupby('GrupoID'):
-                textos = df_grupo['TextoCompleto'].tolist()
+            grupos_marca[marca] = list(df_marca.groupby('GrupoID'))
+            for grupo_id, df_grupo in grupos_marca[marca]:
+                agendador.agendar(gerar_resumo_consolidado_por_chunks, df_grupo['TextoCompleto'].tolist(), marca,
+                                  prioridade=PRIORIDADE_CONSOLIDADO,
+                                  ao_concluir=lambda resumo, chave=(marca, grupo_id): consolidados.__setitem__(chave, resumo))
+
+        total_60 = 0
+        for marca in todas_marcas:
+            df_marca = df[df['Canais'] == marca].copy().reset_index(drop=True)
+
+            # Mesmo conjunto de notícias da execução anterior: reaproveita os resumos da marca inteira
+            assinatura = registro.assinatura_lote(df_marca, marca) if registro is not None else None
+            resultado_salvo = registro.obter_lote(assinatura) if registro is not None else None
+            dados_marcas[marca] = (df_marca, assinatura, resultado_salvo)
+            if resultado_salvo is not None:
+                continue
+
+            salvos = registro.obter(df_marca, 'Resumo60') if registro is not None else pd.Series([None] * len(df_marca), dtype=object)
+            df_marca['Resumo60'] = salvos.tolist()
+            # Só o primeiro registro de cada matéria gera resumo; as cópias herdam no agrupamento
+            primeira_copia = ~chave_materia(df_marca).duplicated()
+            pendentes = [pos for pos, (salvo, primeira) in enumerate(zip(salvos, primeira_copia))
+                         if salvo is None and primeira]
+            faltando_60[marca] = len(pendentes)
+            total_60 += len(pendentes)
+            if not pendentes:
+                _agendar_agrupamento(marca)
+            for pos in pendentes:
+                agendador.agendar(gerar_resumo_60, df_marca.at[pos, 'TextoCompleto'], df_marca.at[pos, 'Id'],
+                                  prioridade=PRIORIDADE_RESUMO60,
+                                  ao_concluir=lambda resumo, m=marca, p=pos: _resumo60_concluido(m, p, resumo))
+
+        print(f"📝 Pipeline de marcas: {total_60} resumo(s) de 60 palavras a gerar em "
+              f"{len(faltando_60)} marca(s) "
+              f"(até {agendador.max_workers} chamadas em paralelo)...")
+        duracao = agendador.executar()
+        print(f"⏱️ Pipeline de marcas concluído em {duracao:.1f}s ({agendador.concluidas} chamada(s))")
+        # ==========================================================================
+
+        # Montagem final sequencial, na ordem das marcas (o pool de verbos é consumido em ordem)
+        for marca in todas_marcas:
+            print(f"\n📄 Processando marca: {marca}")
+            df_marca, assinatura, resultado_salvo = dados_marcas[marca]
+
+            if resultado_salvo is not None:
+                print(f"♻️ Marca {marca} sem notícias novas ou alteradas: {len(resultado_salvo)} resumo(s) reaproveitado(s)")
+                resultados.extend(resultado_salvo)
+                continue
+            inicio_marca = len(resultados)
+
+            for grupo_id, df_grupo in grupos_marca[marca]:
                 ids = df_grupo['Id'].astype(str).tolist()
                 
                 # ========== CORREÇÃO CRÍTICA: Garantir contagem consistente ==========
@@ -1046,7 +936,7 @@ Gere um resumo único de até 120 palavras consolidando as notícias a seguir so
                 print(f"     IDs: {ids_para_salvar[:60]}{'...' if len(ids_para_salvar) > 60 else ''}")
                 # ====================================================================
                 
-                resumo_final = gerar_resumo_consolidado_por_chunks(textos, marca)
+                resumo_final = consolidados[(marca, grupo_id)]
                 
                 # ========== Adicionar prefixo com verbo (usando pool balanceado) ==========
                 resumo_final = adicionar_prefixo_resumo(
@@ -1097,6 +987,9 @@ Gere um resumo único de até 120 palavras consolidando as notícias a seguir so
                     "Resumo": resumo_final
                 })
 
+            if registro is not None:
+                registro.registrar_lote(assinatura, resultados[inicio_marca:])
+
         df_final = pd.DataFrame(resultados, columns=["Marca", "GrupoID", "QtdNoticias", "Ids", "Resumo"])
 
         # Short URLs
@@ -1119,8 +1012,8 @@ Gere um resumo único de até 120 palavras consolidando as notícias a seguir so
             if 'ShortURL' not in df.columns:
                 df['ShortURL'] = df.get('UrlVisualizacao', '')
 
-        df[['Id', 'Canais', 'ShortURL']].to_excel('dados/api/shorturls_por_id.xlsx', index=False)
-        print("✅ Arquivo shorturls_por_id.xlsx salvo com ShortURLs.")
+        arq_shorturls_gravado = salvar_etapa(df[['Id', 'Canais', 'ShortURL']], arq_shorturls)
+        print(f"✅ Arquivo {arq_shorturls_gravado} salvo com ShortURLs.")
 
         # Limpezas no texto do resumo
         if not df_final.empty and 'Resumo' in df_final.columns:
@@ -1,9 +1,11 @@
 # Rotina para gerar os resumos de Setor pelo DeepSeek
 
+import numpy as np
 import pandas as pd
 import requests
 import time
 import configparser
+import json
 import os
 import traceback
 import re
@@ -43,20 +45,41 @@ def obter_chave_deepseek():
     
     return chave
 
-from config import DEEPSEEK_API_URL, w_marcas
+from config import w_marcas, resumos_setor_concorrentes, prefiltro_bolsonaro_ativo, \
+    reclassificacao_com_resumo
+from cliente_deepseek import obter_cliente_deepseek
+from sanitizador_datas import sanitizar_datas_resumo
 
 # ================= NOVA FUNÇÃO: PRÉ-PROCESSAMENTO BOLSONARO =================
-def reclassificar_noticias_bolsonaro(df):
+# Pré-filtro local: só vai ao DeepSeek a notícia que cita o ex-presidente E algum
+# termo judicial. Sem as duas coisas, a resposta só pode ser POLÍTICA.
+PADRAO_MENCAO_BOLSONARO = re.compile(r'\b(?:bolsonaro|ex-presidente)\b', re.IGNORECASE)
+PADRAO_TERMOS_JUDICIAIS = re.compile(
+    r'\b(?:stf|tse|stj|pgr|supremo|tribunal|moraes|pris[ãa]o|pres[oa]|prender|condena[çc][ãa]o|condenad[oa]|'
+    r'julgamento|julgad[oa]|r[ée]u|pena|sentença|inqu[ée]rito|den[úu]ncia|denunciad[oa]|recurso|'
+    r'tornozeleira|domiciliar|papuda|trama golpista|golpe de estado|inelegibilidade|ineleg[íi]vel)\b',
+    re.IGNORECASE
+)
+
+
+def candidata_reclassificacao_bolsonaro(noticia_text):
+    """True se a notícia pode tratar do processo/prisão de Bolsonaro e precisa ir ao LLM"""
+    return bool(PADRAO_MENCAO_BOLSONARO.search(noticia_text)) and bool(PADRAO_TERMOS_JUDICIAIS.search(noticia_text))
+
+
+def reclassificar_noticias_bolsonaro(df, resumir=False):
     """
     Pré-processa notícias classificadas como POLÍTICA para verificar se tratam
     da condenação/prisão do ex-presidente Bolsonaro. Se sim, reclassifica para JUSTIÇA.
+
+    Com resumir=True, a mesma chamada (resposta em JSON) também devolve o resumo de
+    90 palavras, gravado bruto na coluna ResumoPrevio; gerar_resumos_setor só aplica
+    o pós-processamento a ele, sem uma segunda chamada com o texto inteiro.
     """
     api_key = obter_chave_deepseek()
     
-    HEADERS = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
+    # Cliente compartilhado (pool de conexões, limite de taxa e cache de respostas)
+    cliente = obter_cliente_deepseek(api_key)
     
     # Prompt de análise baseado no documento fornecido
     PROMPT_ANALISE = """**INSTRUÇÃO PRINCIPAL:**
@@ -95,6 +118,27 @@ Sua resposta deve ser **SOMENTE** a nova classificação. Não inclua nenhuma ex
 
 **RESPOSTA (Apenas a palavra da categoria):**"""
 
+    # Versão combinada: mesmos critérios de classificação + instruções do resumo de setor, saída em JSON
+    PROMPT_ANALISE_COM_RESUMO = PROMPT_ANALISE.split("**TEXTO DA NOTÍCIA PARA ANÁLISE:**")[0] + """**SEGUNDA TAREFA - RESUMO:**
+
+Além da classificação, atenda ao pedido de resumo abaixo seguindo estas instruções:
+
+{INSTRUCOES}
+
+**PEDIDO DE RESUMO E TEXTO DA NOTÍCIA:**
+
+---
+
+{PROMPT}
+
+---
+
+**FORMATO DE SAÍDA OBRIGATÓRIO:**
+
+Responda SOMENTE com um objeto JSON válido, sem nenhum texto fora dele:
+
+{"tema": "JUSTIÇA" ou "POLÍTICA", "resumo": "texto do resumo"}"""
+
     def extrair_noticia_do_prompt(prompt_text):
         """Extrai o texto da notícia após o primeiro ':' (dois pontos)"""
         if pd.isna(prompt_text) or not prompt_text:
@@ -122,16 +166,14 @@ Sua resposta deve ser **SOMENTE** a nova classificação. Não inclua nenhuma ex
                 {"role": "system", "content": "Você é um especialista em classificação de notícias jurídicas e políticas."},
                 {"role": "user", "content": prompt_completo}
             ],
-            "temperature": 0.3  # Temperatura baixa para respostas mais consistentes
+            "temperature": 0  # Classificação determinística (permite reaproveitar respostas do cache)
         }
         
         # Retry com backoff
         for tentativa in range(3):
             try:
                 print(f"🔍 Analisando notícia (ID: {row_id}) - Tentativa {tentativa + 1}")
-                response = requests.post(DEEPSEEK_API_URL, headers=HEADERS, json=payload, timeout=60)
-                response.raise_for_status()
-                resultado = response.json()['choices'][0]['message']['content'].strip().upper()
+                resultado = cliente.conteudo(payload, timeout=60).upper()
                 
                 # Validar resposta
                 if "JUSTIÇA" in resultado or "JUSTICA" in resultado:
@@ -158,6 +200,63 @@ Sua resposta deve ser **SOMENTE** a nova classificação. Não inclua nenhuma ex
         # Se todas as tentativas falharam, manter classificação original
         print(f"⚠️ Falha ao analisar notícia (ID: {row_id}), mantendo POLÍTICA")
         return "POLÍTICA"
+
+    def analisar_e_resumir_noticia(prompt_text, noticia_text, row_id=""):
+        """
+        Classificação e resumo numa única chamada.
+        Retorna (classificação, resumo bruto ou None); sem resumo, o resumo sai na etapa normal.
+        """
+        if not noticia_text or len(noticia_text) < 50:
+            print(f"⚠️ Notícia muito curta ou vazia (ID: {row_id}), mantendo POLÍTICA")
+            return "POLÍTICA", None
+
+        prompt_completo = (PROMPT_ANALISE_COM_RESUMO
+                           .replace("{INSTRUCOES}", INSTRUCOES_RESUMO_SETOR)
+                           .replace("{PROMPT}", prompt_text))
+
+        payload = {
+            "model": "deepseek-chat",
+            "messages": [
+                {"role": "system", "content": SISTEMA_RESUMO_SETOR},
+                {"role": "user", "content": prompt_completo}
+            ],
+            "response_format": {"type": "json_object"},
+            "temperature": 0  # Classificação determinística e cacheável, como na reclassificação isolada
+        }
+
+        for tentativa in range(3):
+            try:
+                print(f"🔍 Analisando e resumindo notícia (ID: {row_id}) - Tentativa {tentativa + 1}")
+                conteudo = cliente.conteudo(payload, timeout=60)
+                conteudo = re.sub(r'^```(?:json)?\s*|\s*```$', '', conteudo)
+                resposta = json.loads(conteudo)
+
+                tema = str(resposta.get("tema", "")).upper()
+                resumo = str(resposta.get("resumo") or "").strip() or None
+                if "JUSTIÇA" in tema or "JUSTICA" in tema:
+                    return "JUSTIÇA", resumo
+                if not ("POLÍTICA" in tema or "POLITICA" in tema):
+                    print(f"⚠️ Tema inesperado: '{tema}', assumindo POLÍTICA")
+                return "POLÍTICA", resumo
+
+            except requests.exceptions.Timeout:
+                print(f"⏰ Timeout na tentativa {tentativa + 1}")
+                time.sleep(2 * (tentativa + 1))
+            except requests.exceptions.RequestException as e:
+                print(f"🔌 Erro de conexão na tentativa {tentativa + 1}: {e}")
+                time.sleep(2 * (tentativa + 1))
+            except (ValueError, AttributeError) as e:
+                # JSON inválido ou fora do formato pedido: tenta de novo
+                print(f"🔧 Resposta fora do formato JSON na tentativa {tentativa + 1}: {e}")
+            except (KeyError, IndexError) as e:
+                print(f"🔧 Erro na estrutura da resposta: {e}")
+                break
+            except Exception as e:
+                print(f"❌ Erro inesperado na tentativa {tentativa + 1}: {e}")
+                time.sleep(1 * (tentativa + 1))
+
+        print(f"⚠️ Falha ao analisar notícia (ID: {row_id}), mantendo POLÍTICA")
+        return "POLÍTICA", None
     
     try:
         if df is None or df.empty:
@@ -177,6 +276,10 @@ Sua resposta deve ser **SOMENTE** a nova classificação. Não inclua nenhuma ex
         print(f"📊 Total de notícias POLÍTICA a analisar: {len(df_politica)}\n")
         
         reclassificadas = 0
+        chamadas_evitadas = 0
+        resumos_combinados = 0
+        if resumir and 'ResumoPrevio' not in df.columns:
+            df['ResumoPrevio'] = None
         
         for idx, row in df_politica.iterrows():
             # Extrair informações
@@ -190,13 +293,23 @@ Sua resposta deve ser **SOMENTE** a nova classificação. Não inclua nenhuma ex
                 print(f"⚠️ Não foi possível extrair notícia do prompt (ID: {row_id})")
                 continue
             
+            if prefiltro_bolsonaro_ativo and not candidata_reclassificacao_bolsonaro(noticia):
+                chamadas_evitadas += 1
+                continue
+            
             print(f"\n{'─'*60}")
             print(f"📰 Analisando notícia {reclassificadas + 1}/{len(df_politica)}")
             print(f"   ID: {row_id}")
             print(f"   Preview: {noticia[:100]}...")
             
-            # Analisar e obter nova classificação
-            nova_classificacao = analisar_noticia(noticia, row_id)
+            # Analisar e obter nova classificação (e, no modo combinado, o resumo)
+            if resumir:
+                nova_classificacao, resumo = analisar_e_resumir_noticia(str(prompt_completo).strip(), noticia, row_id)
+                if resumo:
+                    df.at[idx, 'ResumoPrevio'] = resumo
+                    resumos_combinados += 1
+            else:
+                nova_classificacao = analisar_noticia(noticia, row_id)
             
             # Se foi reclassificada para JUSTIÇA, atualizar no DataFrame original
             if nova_classificacao == "JUSTIÇA":
@@ -205,15 +318,17 @@ Sua resposta deve ser **SOMENTE** a nova classificação. Não inclua nenhuma ex
                 print(f"✅ RECLASSIFICADA: POLÍTICA → JUSTIÇA")
             else:
                 print(f"➡️ Mantida como: POLÍTICA")
-            
-            # Pausa para respeitar limites da API
-            time.sleep(2)
         
         print(f"\n{'='*60}")
         print(f"✅ PRÉ-PROCESSAMENTO CONCLUÍDO")
         print(f"{'='*60}")
         print(f"📊 Total analisadas: {len(df_politica)}")
+        if prefiltro_bolsonaro_ativo:
+            print(f"⚡ Chamadas evitadas pelo pré-filtro (sem Bolsonaro + termo judicial): "
+                  f"{chamadas_evitadas} de {len(df_politica)}")
         print(f"🔄 Reclassificadas para JUSTIÇA: {reclassificadas}")
+        if resumir:
+            print(f"📝 Resumos obtidos na mesma chamada: {resumos_combinados}")
         print(f"➡️ Mantidas como POLÍTICA: {len(df_politica) - reclassificadas}")
         print(f"{'='*60}\n")
         
@@ -227,157 +342,102 @@ Sua resposta deve ser **SOMENTE** a nova classificação. Não inclua nenhuma ex
 # ================= FIM NOVA FUNÇÃO =================
 
 
-def remover_datas_passadas(texto_resumo):
-    if not texto_resumo:
-        return texto_resumo
-
-    meses = r'(?:janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro)'
-    dias_semana = r'(?:segunda|terça|quarta|quinta|sexta|sábado|domingo)(?:-feira)?'
-
-    # proteger datas futuras
-    texto_modificado = re.sub(
-        r'\b(previsto para|prevista para|programado para|deve ocorrer em|ocorrerá em|acontecerá em|será em|será no dia|marcado para|agendado para)\s+(\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?)',
-        r'__PROTEGER_DATA__\1 \2__FIM_PROTECAO__',
-        texto_resumo,
-        flags=re.IGNORECASE
-    )
-
-    texto_modificado = re.sub(
-        r'\b(no próximo|na próxima|próximo|próxima)\s+(dia|'+dias_semana+r')?\s*(\d{1,2}(?:\s+de\s+'+meses+r'(?:\s+de\s+\d{4})?)?)',
-        r'__PROTEGER_DATA__\1 \2 \3__FIM_PROTECAO__',
-        texto_modificado,
-        flags=re.IGNORECASE
-    )
+# ================= RESUMO DE SETOR: PROMPT E PÓS-PROCESSAMENTO =================
+# Compartilhados pela chamada de resumo e pela chamada combinada (reclassificação + resumo)
+INSTRUCOES_RESUMO_SETOR = """INSTRUÇÕES IMPORTANTES:
 
-    verbos_passado = r'(?:anunciou|informou|divulgou|publicou|comunicou|reportou|declarou|afirmou|revelou|confirmou|lançou|apresentou|mostrou|indicou|condenou|condenaram|pautou|pautaram|decidiu|decidiram|aprovou|aprovaram|realizou|realizaram|registrou|registraram|assinou|assinaram|entregou|entregaram|enviou|enviaram|recebeu|receberam|aceitou|aceitaram|rejeitou|rejeitaram|negou|negaram|admitiu|admitiram|reconheceu|reconheceram|criticou|criticaram|acusou|acusaram|denunciou|denunciaram|investigou|investigaram|descobriu|descobriram|encontrou|encontraram|identificou|identificaram|descartou|descartaram)'
-
-    padrao_verbo_data = r'\b(' + verbos_passado + r')\s*,?\s*(?:em\s+|no\s+|na\s+|dia\s+|nesta\s+|desta\s+|naquele\s+|daquele\s+|nessa\s+|desse\s+|naquela\s+|daquela\s+)?\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\s*,?'
-    texto_modificado = re.sub(padrao_verbo_data, r'\1', texto_modificado, flags=re.IGNORECASE)
-
-    padrao_data_extenso = r'\b(?:em|dia|no dia|na data|nesta|nesta data|neste dia)\s+\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\b'
-    texto_modificado = re.sub(padrao_data_extenso, '', texto_modificado, flags=re.IGNORECASE)
+1. Forneça APENAS o resumo, sem frases introdutórias como "aqui está um resumo", "baseado no texto fornecido", "o resumo é", ou similares.
 
-    padrao_dia_semana = r'\b(?:nesta|neste|na|no|desta|deste|da|do|última|último)\s+' + dias_semana + r'\s*\(\d{1,2}\)'
-    texto_modificado = re.sub(padrao_dia_semana, '', texto_modificado, flags=re.IGNORECASE)
+2. NEUTRALIDADE OBRIGATÓRIA:
+   - Relate apenas FATOS objetivos e verificáveis
+   - NÃO use adjetivos elogiosos ou bajuladores (inovador, revolucionário, líder, excelente, incrível, extraordinário, etc.)
+   - NÃO faça juízos de valor sobre marcas, empresas ou entidades
+   - NÃO reproduza linguagem de marketing ou promocional presente no texto original
+   - Mantenha tom jornalístico neutro e factual
+   - Se há críticas ou problemas, relate-os objetivamente sem suavizar
 
-    texto_modificado = re.sub(r'\s{2,}', ' ', texto_modificado)
-    texto_modificado = re.sub(r'^\s*,\s*', '', texto_modificado)
-    texto_modificado = re.sub(r'\s+,', ',', texto_modificado)
-    texto_modificado = re.sub(r',\s*,', ',', texto_modificado)
-    texto_modificado = re.sub(r'__PROTEGER_DATA__', '', texto_modificado)
-    texto_modificado = re.sub(r'__FIM_PROTECAO__', '', texto_modificado)
+3. TRATAMENTO DE DATAS - REGRA CRÍTICA:
+   - Para eventos JÁ OCORRIDOS (verbos no passado): NÃO mencione datas específicas
+   - Para eventos FUTUROS (verbos no futuro): MANTENHA as datas
+   
+   Exemplos de REMOÇÃO (passado):
+   ❌ "anunciou em 29/01/2026" → ✅ "anunciou"
+   ❌ "afirmou em 29 de janeiro" → ✅ "afirmou"
+   ❌ "informou nesta quinta-feira (29)" → ✅ "informou"
+   ❌ "o banco lançou em 29 de janeiro" → ✅ "o banco lançou"
+   
+   Exemplos de MANUTENÇÃO (futuro):
+   ✅ "previsto para 10 de fevereiro" → MANTER
+   ✅ "deve ocorrer em 11 de fevereiro" → MANTER
+   ✅ "a estreia acontecerá em 11 de fevereiro" → MANTER
 
-    return texto_modificado.strip()
+4. FOCO EM FATOS:
+   - O que aconteceu (ações concretas)
+   - Quando aconteceu (datas, períodos) - MAS APENAS SE PRESENTE NO TEXTO ORIGINAL
+   - Dados numéricos e estatísticos
+   - Anúncios, eventos específicos
+   - Resultados mensuráveis"""
 
+SISTEMA_RESUMO_SETOR = "Você é um analista de notícias que produz resumos estritamente factuais e neutros. Você NÃO é um profissional de marketing ou relações públicas. Seu trabalho é relatar fatos objetivamente sobre qualquer tema ou setor, sem elogios, sem tom promocional, sem juízos de valor. Use linguagem jornalística neutra, direta e imparcial. IMPORTANTE: Para eventos passados, NÃO mencione datas específicas. Para eventos futuros, MANTENHA as datas."
 
-def remover_datas_nao_presentes_no_original(texto_resumo, texto_original):
-    if not texto_resumo or not texto_original:
-        return texto_resumo
 
-    meses = r'(?:janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro)'
-    padroes_original = [
-        r'\b\d{1,2}/\d{1,2}/\d{4}\b',
-        r'\b\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\b',
-        r'\b(?:nesta|desta|na|no)\s+(?:segunda|terça|quarta|quinta|sexta|sábado|domingo)(?:-feira)?\s*\(\d{1,2}\)\b',
-        r'\bamanhã\s*,?\s*\d{1,2}\b'
-    ]
+def montar_prompt_resumo_setor(prompt_text):
+    """Prompt de resumo enviado ao LLM (instruções + prompt da notícia)"""
+    # Adicionar instrução explícita para evitar frases introdutórias E neutralidade
+    return f"{INSTRUCOES_RESUMO_SETOR}\n\n{prompt_text}"
 
-    datas_no_original = set()
-    for padrao in padroes_original:
-        matches = re.findall(padrao, texto_original, re.IGNORECASE)
-        datas_no_original.update(matches)
 
-    texto_modificado = texto_resumo
-    padroes_resumo = [
-        (r'\b\d{1,2}/\d{1,2}/\d{4}\b', lambda m: m.group(0)),
-        (r'\b\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\b', lambda m: m.group(0)),
-        (r'\b(?:em|dia|no dia|na data|nesta|neste)\s+\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\b', lambda m: re.sub(r'^\b(?:em|dia|no dia|na data|nesta|neste)\s+', '', m.group(0), flags=re.IGNORECASE))
+def limpar_frases_introdutorias(texto):
+    """Remove frases introdutórias comuns que o LLM pode adicionar"""
+    if not texto:
+        return texto
+    
+    # Padrões de frases introdutórias a remover (case-insensitive)
+    padroes_remover = [
+        r'^aqui está um resumo.*?:\s*',
+        r'^aqui está o resumo.*?:\s*',
+        r'^segue um resumo.*?:\s*',
+        r'^baseado no texto fornecido,?\s*o resumo.*?:\s*',
+        r'^baseado no texto fornecido,?\s*',
+        r'^o resumo para a marca.*?:\s*',
+        r'^o resumo é:?\s*',
+        r'^resumo:?\s*',
+        r'^segue:?\s*',
     ]
+    
+    texto_limpo = texto.strip()
+    for padrao in padroes_remover:
+        texto_limpo = re.sub(padrao, '', texto_limpo, flags=re.IGNORECASE)
+    
+    return texto_limpo.strip()
 
-    for padrao, extrator in padroes_resumo:
-        for match in re.finditer(padrao, texto_modificado, re.IGNORECASE):
-            data_resumo = extrator(match)
-            if data_resumo not in datas_no_original:
-                texto_modificado = re.sub(r'(?:\b(?:em|no|na|no dia|na data|dia)\b\s*)?' + re.escape(match.group(0)) + r'(?:,)?', '', texto_modificado, flags=re.IGNORECASE)
-
-    texto_modificado = re.sub(r'\s{2,}', ' ', texto_modificado)
-    texto_modificado = re.sub(r'^\s*,\s*', '', texto_modificado)
-    texto_modificado = re.sub(r'\s+,\s*', ', ', texto_modificado)
-
-    return texto_modificado.strip()
-
-
-def corrigir_datas_inventadas(texto_resumo, texto_original):
-    """Corrige ou remove datas inventadas no resumo, preservando referências de mês sem dia."""
-    if not texto_resumo:
-        return texto_resumo
-
-    meses = r'(?:janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro)'
-
-    # Extrair datas explícitas do texto original
-    datas_originais = set(re.findall(r'\b\d{1,2}/\d{1,2}/\d{4}\b', texto_original))
-    datas_originais.update(re.findall(r'\b\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\b', texto_original, flags=re.IGNORECASE))
-
-    # Extrair possíveis dias de mês referenciados como dia da semana (nesta quinta-feira (23))
-    dias_semana_orig = set(re.findall(r'\b(?:nesta|desta|na|no)\s+(?:segunda(?:-feira)?|terça(?:-feira)?|quarta(?:-feira)?|quinta(?:-feira)?|sexta(?:-feira)?|sábado(?:-feira)?|domingo(?:-feira)?)\s*\((\d{1,2})\)', texto_original, flags=re.IGNORECASE))
-
-    texto_corrigido = texto_resumo
-
-    # Substituir data inventada com dia/mês (sem ano) por mês apenas quando não estiver presente no original
-    def _substituir_dia_mes(match):
-        data = match.group(0)
-        dia = match.group(1)
-        mes = match.group(2)
-        data_normalizada = f"{dia} de {mes}".lower()
-
-        if data_normalizada in (d.lower() for d in datas_originais):
-            return data  # manter se presente no original
-
-        if dia in dias_semana_orig:
-            # Se original tinha dia da semana com mesmo dia, manter formato de dia da semana preferido
-            return f"{mes}"
-
-        # Remover dia, mantendo referência mensal para conservar "em setembro"
-        return f"{mes}"
-
-    texto_corrigido = re.sub(r'\b(\d{1,2})\s+de\s+(' + meses + r')(?:\s+de\s+\d{4})?\b', _substituir_dia_mes, texto_corrigido, flags=re.IGNORECASE)
-
-    # Remover datas completas DD/MM/YYYY não presentes no original
-    def _remover_data_completa(match):
-        data = match.group(0)
-        if data in datas_originais:
-            return data
-        print(f"⚠️ [CORRIGIR_DATAS_INVENTADAS] Removendo data completa inventada: {data}")
-        return ''
 
-    texto_corrigido = re.sub(r'\b\d{1,2}/\d{1,2}/\d{4}\b', _remover_data_completa, texto_corrigido)
+def pos_processar_resumo_setor(resultado, prompt_completo):
+    """Limpeza de frases introdutórias e correções de datas de um resumo bruto do LLM"""
+    # Aplicar limpeza de frases introdutórias antes de seguir
+    texto = limpar_frases_introdutorias(resultado)
 
-    # Remover referências de dia da semana com dia sequencial desconhecido (ex: 'sexta-feira, 23 de setembro')
-    texto_corrigido = re.sub(r'\b(?:segunda(?:-feira)?|terça(?:-feira)?|quarta(?:-feira)?|quinta(?:-feira)?|sexta(?:-feira)?|sábado(?:-feira)?|domingo(?:-feira)?)\s*,?\s*\d{1,2}\s+de\s+' + meses + r'(?:\s+de\s+\d{4})?\b', '', texto_corrigido, flags=re.IGNORECASE)
+    # Aplicar correções de datas: remover inventadas, remover passadas, validar original
+    texto = sanitizar_datas_resumo(texto, prompt_completo)
 
-    # Limpeza de resíduos resultantes
-    texto_corrigido = re.sub(r'\s{2,}', ' ', texto_corrigido)
-    texto_corrigido = re.sub(r'^\s*,\s*', '', texto_corrigido)
-    texto_corrigido = re.sub(r'\s+,\s*', ', ', texto_corrigido)
-    texto_corrigido = texto_corrigido.strip()
+    return texto.strip()
 
-    if texto_corrigido != texto_resumo:
-        print(f"✅ [CORRIGIR_DATAS_INVENTADAS] Correções aplicadas")
-        print(f"   Original: {texto_resumo}")
-        print(f"   Modificado: {texto_corrigido}")
 
-    return texto_corrigido
+def imprimir_latencias_resumos(latencias, duracao_total):
+    """Percentis da latência por prompt (inclui repetições e esperas de taxa) e tempo total da etapa"""
+    if not latencias:
+        return
+    p50, p90, p95, p99 = np.percentile(latencias, [50, 90, 95, 99])
+    print(f"⏱️ Resumos de setor: {len(latencias)} prompts em {duracao_total:.1f}s | latência por prompt "
+          f"p50 {p50:.1f}s, p90 {p90:.1f}s, p95 {p95:.1f}s, p99 {p99:.1f}s, máx {max(latencias):.1f}s")
 
 
 # Função gerar_resumos_setor com proteções adicionais
-
 def gerar_resumos_setor(df):
     api_key = obter_chave_deepseek()
 
-    HEADERS = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }    
+    # Cliente compartilhado (pool de conexões, limite de taxa e cache de respostas)
+    cliente = obter_cliente_deepseek(api_key)
     
     # ================= NORMALIZAÇÃO PREVENTIVA (NOVO) =================
     def _normalize_setor_df(df_in):
@@ -411,49 +471,14 @@ def gerar_resumos_setor(df):
     # ===============================================================
 
     def resumir_prompt(prompt_text, tema="", row_id=""):
-        # Adicionar instrução explícita para evitar frases introdutórias E neutralidade
-        prompt_completo = f"""INSTRUÇÕES IMPORTANTES:
-
-1. Forneça APENAS o resumo, sem frases introdutórias como "aqui está um resumo", "baseado no texto fornecido", "o resumo é", ou similares.
-
-2. NEUTRALIDADE OBRIGATÓRIA:
-   - Relate apenas FATOS objetivos e verificáveis
-   - NÃO use adjetivos elogiosos ou bajuladores (inovador, revolucionário, líder, excelente, incrível, extraordinário, etc.)
-   - NÃO faça juízos de valor sobre marcas, empresas ou entidades
-   - NÃO reproduza linguagem de marketing ou promocional presente no texto original
-   - Mantenha tom jornalístico neutro e factual
-   - Se há críticas ou problemas, relate-os objetivamente sem suavizar
-
-3. TRATAMENTO DE DATAS - REGRA CRÍTICA:
-   - Para eventos JÁ OCORRIDOS (verbos no passado): NÃO mencione datas específicas
-   - Para eventos FUTUROS (verbos no futuro): MANTENHA as datas
-   
-   Exemplos de REMOÇÃO (passado):
-   ❌ "anunciou em 29/01/2026" → ✅ "anunciou"
-   ❌ "afirmou em 29 de janeiro" → ✅ "afirmou"
-   ❌ "informou nesta quinta-feira (29)" → ✅ "informou"
-   ❌ "o banco lançou em 29 de janeiro" → ✅ "o banco lançou"
-   
-   Exemplos de MANUTENÇÃO (futuro):
-   ✅ "previsto para 10 de fevereiro" → MANTER
-   ✅ "deve ocorrer em 11 de fevereiro" → MANTER
-   ✅ "a estreia acontecerá em 11 de fevereiro" → MANTER
-
-4. FOCO EM FATOS:
-   - O que aconteceu (ações concretas)
-   - Quando aconteceu (datas, períodos) - MAS APENAS SE PRESENTE NO TEXTO ORIGINAL
-   - Dados numéricos e estatísticos
-   - Anúncios, eventos específicos
-   - Resultados mensuráveis
-
-{prompt_text}"""
+        prompt_completo = montar_prompt_resumo_setor(prompt_text)
         
         payload = {
             "model": "deepseek-chat",
             "messages": [
                 {
                     "role": "system", 
-                    "content": "Você é um analista de notícias que produz resumos estritamente factuais e neutros. Você NÃO é um profissional de marketing ou relações públicas. Seu trabalho é relatar fatos objetivamente sobre qualquer tema ou setor, sem elogios, sem tom promocional, sem juízos de valor. Use linguagem jornalística neutra, direta e imparcial. IMPORTANTE: Para eventos passados, NÃO mencione datas específicas. Para eventos futuros, MANTENHA as datas."
+                    "content": SISTEMA_RESUMO_SETOR
                 },
                 {
                     "role": "user", 
@@ -463,49 +488,15 @@ def gerar_resumos_setor(df):
             "temperature": 0.7
         }
         
-        def limpar_frases_introdutorias(texto):
-            """Remove frases introdutórias comuns que o LLM pode adicionar"""
-            if not texto:
-                return texto
-            
-            # Padrões de frases introdutórias a remover (case-insensitive)
-            padroes_remover = [
-                r'^aqui está um resumo.*?:\s*',
-                r'^aqui está o resumo.*?:\s*',
-                r'^segue um resumo.*?:\s*',
-                r'^baseado no texto fornecido,?\s*o resumo.*?:\s*',
-                r'^baseado no texto fornecido,?\s*',
-                r'^o resumo para a marca.*?:\s*',
-                r'^o resumo é:?\s*',
-                r'^resumo:?\s*',
-                r'^segue:?\s*',
-            ]
-            
-            texto_limpo = texto.strip()
-            for padrao in padroes_remover:
-                texto_limpo = re.sub(padrao, '', texto_limpo, flags=re.IGNORECASE)
-            
-            return texto_limpo.strip()
-
         # Implementar retry com backoff
         for tentativa in range(3):
             try:
                 print(f"🔄 Tentativa {tentativa + 1} para tema: {tema} (ID: {row_id})")
-                response = requests.post(DEEPSEEK_API_URL, headers=HEADERS, json=payload, timeout=60)
-                response.raise_for_status()
-                resultado = response.json()['choices'][0]['message']['content']
+                resultado = cliente.chat(payload, timeout=60)['choices'][0]['message']['content']
                 
                 # Verificar se o resultado não está vazio
                 if resultado and resultado.strip():
-                    # Aplicar limpeza de frases introdutórias antes de seguir
-                    texto = limpar_frases_introdutorias(resultado)
-
-                    # Aplicar correções de datas: remover inventadas, remover passadas, validar original
-                    texto = corrigir_datas_inventadas(texto, prompt_completo)
-                    texto = remover_datas_passadas(texto)
-                    texto = remover_datas_nao_presentes_no_original(texto, prompt_completo)
-
-                    return texto.strip()
+                    return pos_processar_resumo_setor(resultado, prompt_completo)
                 else:
                     print(f"⚠️ Resposta vazia na tentativa {tentativa + 1}")
                     
@@ -528,7 +519,7 @@ def gerar_resumos_setor(df):
     try:
         # ================= CHAMAR PRÉ-PROCESSAMENTO AQUI =================
         print("\n🚀 Iniciando processamento completo...")
-        df = reclassificar_noticias_bolsonaro(df)
+        df = reclassificar_noticias_bolsonaro(df, resumir=reclassificacao_com_resumo)
         print("\n📝 Iniciando geração de resumos...\n")
         # ===============================================================
         
@@ -548,8 +539,9 @@ def gerar_resumos_setor(df):
             print(f"❌ Colunas faltantes: {colunas_faltantes}")
             return pd.DataFrame(columns=["Tema", "Id", "Resumo"])
         
-        resumos = []
-        for idx, row in df.iterrows():
+        # Tarefas na ordem de entrada; prompts vazios são descartados antes de disparar
+        tarefas = []
+        for posicao, (idx, row) in enumerate(df.iterrows()):
             tema = str(row.get('Tema', f'tema_{idx}')).strip()
             prompt = str(row.get('Prompt', '')).strip()
             
@@ -559,18 +551,44 @@ def gerar_resumos_setor(df):
             if not prompt:
                 print(f"⚠️ Prompt vazio para tema '{tema}', pulando...")
                 continue
-                
-            print(f"🔄 Processando grupo {idx+1}/{len(df)} do tema '{tema}'...")
+            resumo_previo = row.get('ResumoPrevio')
+            resumo_previo = resumo_previo if isinstance(resumo_previo, str) and resumo_previo.strip() else None
+            tarefas.append((posicao, tema, prompt, row_id, row.get('RelevanceScore'), resumo_previo))
+
+        def _resumir_tarefa(tarefa):
+            """Resumo de um prompt com sua latência; uma falha não interrompe os demais"""
+            posicao, tema, prompt, row_id, _, resumo_previo = tarefa
+            print(f"🔄 Processando grupo {posicao + 1}/{len(df)} do tema '{tema}'...")
+            inicio = time.perf_counter()
+            try:
+                resumo = None
+                if resumo_previo:
+                    # Já veio da reclassificação: só o pós-processamento (mesmas correções de datas)
+                    resumo = pos_processar_resumo_setor(resumo_previo, montar_prompt_resumo_setor(prompt)) or None
+                if resumo is None:
+                    resumo = resumir_prompt(prompt, tema, row_id)
+            except Exception as e:
+                print(f"❌ Falha no resumo do tema '{tema}' (ID: {row_id}): {e}")
+                resumo = f"Erro: Não foi possível gerar resumo para o tema '{tema}' após 3 tentativas."
+            return resumo, time.perf_counter() - inicio
 
-            resumo = resumir_prompt(prompt, tema, row_id)
+        inicio_resumos = time.perf_counter()
+        if resumos_setor_concorrentes:
+            resultados = cliente.mapear(_resumir_tarefa, tarefas)
+        else:
+            resultados = [_resumir_tarefa(tarefa) for tarefa in tarefas]
+        duracao_resumos = time.perf_counter() - inicio_resumos
 
+        resumos = []
+        for (_, tema, _, row_id, relevancia, _), (resumo, _) in zip(tarefas, resultados):
             resumos.append({
                 "Tema": tema,
                 "Id": row_id,
-                "Resumo": resumo
+                "Resumo": resumo,
+                "RelevanceScore": relevancia
             })
 
-            time.sleep(2)  # pausa para respeitar limites da API
+        imprimir_latencias_resumos([latencia for _, latencia in resultados], duracao_resumos)
 
         # Criar DataFrame de resultados
         if not resumos:
@@ -578,6 +596,16 @@ def gerar_resumos_setor(df):
             return pd.DataFrame(columns=["Tema", "Id", "Resumo"])
             
         df_resumo_setor = pd.DataFrame(resumos)
+        # Saída por Tema e, dentro do tema, por RelevanceScore decrescente (empates na ordem de entrada),
+        # independente da ordem em que as chamadas terminaram
+        if df_resumo_setor['RelevanceScore'].isna().all():
+            df_resumo_setor = df_resumo_setor.drop(columns='RelevanceScore')
+            df_resumo_setor = df_resumo_setor.sort_values(by='Tema', kind='stable')
+        else:
+            df_resumo_setor['RelevanceScore'] = pd.to_numeric(df_resumo_setor['RelevanceScore'], errors='coerce')
+            df_resumo_setor = df_resumo_setor.sort_values(by=['Tema', 'RelevanceScore'], ascending=[True, False],
+                                                          kind='stable', na_position='last')
+        df_resumo_setor = df_resumo_setor.reset_index(drop=True)
         print(f"✅ {len(df_resumo_setor)} resumos gerados com sucesso")
 
         # Limpezas no texto do resumo
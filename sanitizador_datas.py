@@ -0,0 +1,281 @@
+# ============================================================================
+# SANITIZAÇÃO DE DATAS NOS RESUMOS (MARCAS E SETOR)
+# ============================================================================
+# Arquivo: sanitizador_datas.py
+# Descrição: Remove dos resumos as datas de eventos passados e as datas que o
+#            modelo inventou (ausentes do texto original). Todas as regex são
+#            compiladas uma única vez, na importação. sanitizar_datas_resumo
+#            faz uma única passada pelo resumo (encontrar_datas) em busca de
+#            trechos de data (DD/MM/AAAA, "DD de mês", "quinta-feira (23)",
+#            "próximo dia 5") e repassa o resultado às etapas: resumo sem
+#            nenhum trecho de data só passa pela limpeza de resíduos, sem nova
+#            varredura, e o texto original da notícia só é varrido quando o
+#            resumo tem datas (uma vez por texto: as datas do original ficam
+#            em cache).
+#            Os logs só aparecem com log_sanitizacao_datas = True (config.py).
+#            Micro-benchmark: python sanitizador_datas.py
+# ============================================================================
+
+import re
+import time
+from functools import lru_cache
+
+from config import log_sanitizacao_datas
+
+MESES = r'(?:janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro)'
+DIAS_SEMANA = r'(?:segunda|terça|quarta|quinta|sexta|sábado|domingo)(?:-feira)?'
+VERBOS_PASSADO = (
+    r'(?:anunciou|informou|divulgou|publicou|comunicou|reportou|declarou|afirmou|revelou|confirmou|lançou|'
+    r'apresentou|mostrou|indicou|condenou|condenaram|pautou|pautaram|decidiu|decidiram|aprovou|aprovaram|'
+    r'realizou|realizaram|registrou|registraram|assinou|assinaram|entregou|entregaram|enviou|enviaram|recebeu|'
+    r'receberam|aceitou|aceitaram|rejeitou|rejeitaram|negou|negaram|admitiu|admitiram|reconheceu|reconheceram|'
+    r'criticou|criticaram|acusou|acusaram|denunciou|denunciaram|investigou|investigaram|descobriu|descobriram|'
+    r'encontrou|encontraram|identificou|identificaram|descartou|descartaram)'
+)
+
+_DATA_BARRA = r'\b\d{1,2}/\d{1,2}/\d{4}\b'
+_DATA_EXTENSO = r'\b\d{1,2}\s+de\s+' + MESES + r'(?:\s+de\s+\d{4})?\b'
+_I = re.IGNORECASE
+
+# Trechos de data: toda regra abaixo que altera datas exige pelo menos um destes trechos
+PADRAO_TRECHOS_DATA = re.compile(
+    r'\d{1,2}/\d{1,2}/\d{4}'
+    r'|\d{1,2}\s+de\s+' + MESES +
+    r'|' + DIAS_SEMANA + r'\s*\(\d{1,2}\)'
+    r'|próxim[oa]\s+(?:dia|' + DIAS_SEMANA + r')?\s*\d',
+    _I
+)
+
+# Datas do texto original que um resumo pode repetir (DD/MM/AAAA e DD de mês [de AAAA])
+_DATAS_ORIGINAL = re.compile(_DATA_BARRA + '|' + _DATA_EXTENSO, _I)
+_RE_DATA_BARRA = re.compile(_DATA_BARRA)
+_RE_DATA_BARRA_I = re.compile(_DATA_BARRA, _I)
+_RE_DATA_EXTENSO = re.compile(_DATA_EXTENSO, _I)
+
+# remover_datas_passadas
+_PASSADAS_BARRA = re.compile(r'\b(em|dia|na data|no dia)\s+\d{1,2}/\d{1,2}/\d{4}\b', _I)
+_PROTEGER_FUTURO = re.compile(
+    r'\b(previsto para|prevista para|programado para|deve ocorrer em|ocorrerá em|acontecerá em|será em|'
+    r'será no dia|marcado para|agendado para)\s+(\d{1,2}\s+de\s+' + MESES + r'(?:\s+de\s+\d{4})?)',
+    _I
+)
+_PROTEGER_PROXIMO = re.compile(
+    r'\b(no próximo|na próxima|próximo|próxima)\s+(dia|' + DIAS_SEMANA + r')?\s*(\d{1,2}(?:\s+de\s+' + MESES +
+    r'(?:\s+de\s+\d{4})?)?)',
+    _I
+)
+_VERBO_DATA = re.compile(
+    r'\b(' + VERBOS_PASSADO + r')\s*,?\s*(?:em\s+|no\s+|na\s+|dia\s+|nesta\s+|desta\s+|naquele\s+|daquele\s+|'
+    r'nessa\s+|desse\s+|naquela\s+|daquela\s+)?\d{1,2}\s+de\s+' + MESES + r'(?:\s+de\s+\d{4})?\s*,?',
+    _I
+)
+_VERBO_PARA_DATA = re.compile(
+    r'\b(' + VERBOS_PASSADO + r')\s+para\s+(?:o\s+dia\s+|esta\s+\w+-feira\s+\(\d{1,2}\)|)?\d{1,2}\s+de\s+' +
+    MESES + r'(?:\s+de\s+\d{4})?\b',
+    _I
+)
+_PREPOSICAO_DATA = re.compile(
+    r'\b(?:em|dia|no dia|na data|nesta|nesta data|neste dia)\s+\d{1,2}\s+de\s+' + MESES + r'(?:\s+de\s+\d{4})?\b',
+    _I
+)
+_DIA_SEMANA_NUMERO = re.compile(
+    r'\b(?:nesta|neste|na|no|desta|deste|da|do|última|último)\s+' + DIAS_SEMANA + r'\s*\(\d{1,2}\)', _I
+)
+_PREPOSICAO_DUPLICADA = re.compile(r'\b(na|no|da|do)\s+(na|no|da|do|após|antes)\b', _I)
+
+# remover_datas_nao_presentes_no_original
+_PREFIXO_DATA = r'\b(?:em|dia|no dia|na data|nesta|neste)\s+'
+_RE_DATA_COM_PREFIXO = re.compile(_PREFIXO_DATA + r'\d{1,2}\s+de\s+' + MESES + r'(?:\s+de\s+\d{4})?\b', _I)
+_RE_PREFIXO_DATA = re.compile('^' + _PREFIXO_DATA, _I)
+_PREPOSICAO_OPCIONAL = r'(?:\b(?:em|no|na|no dia|na data|dia)\b\s*)?'
+
+# corrigir_datas_inventadas
+_DIA_MES = re.compile(r'\b(\d{1,2})\s+de\s+(' + MESES + r')(?:\s+de\s+\d{4})?\b', _I)
+_DIA_SEMANA_DATA = re.compile(
+    r'\b(?:segunda(?:-feira)?|terça(?:-feira)?|quarta(?:-feira)?|quinta(?:-feira)?|sexta(?:-feira)?|'
+    r'sábado(?:-feira)?|domingo(?:-feira)?)\s*,?\s*\d{1,2}\s+de\s+' + MESES + r'(?:\s+de\s+\d{4})?\b',
+    _I
+)
+
+# Limpeza de resíduos
+_VIRGULA_INICIAL = re.compile(r'^\s*,\s*')
+_ESPACO_ANTES_VIRGULA = re.compile(r'\s+,')
+_VIRGULA_DUPLA = re.compile(r',\s*,')
+_ESPACOS_MULTIPLOS = re.compile(r'\s{2,}')
+_ESPACOS_VIRGULA = re.compile(r'\s+,\s*')
+
+
+def encontrar_datas(texto):
+    """Trechos de data do texto, numa única passada: lista de (início, fim)"""
+    if not texto:
+        return []
+    return [m.span() for m in PADRAO_TRECHOS_DATA.finditer(texto)]
+
+
+@lru_cache(maxsize=256)
+def _datas_do_original(texto_original):
+    """Datas DD/MM/AAAA e DD de mês [de AAAA] do original (varrido uma vez por texto, entre etapas e resumos)"""
+    return frozenset(_DATAS_ORIGINAL.findall(texto_original))
+
+
+def _tem_datas(texto, trechos_data=None):
+    """Usa os trechos já encontrados (encontrar_datas) quando informados; senão procura no texto"""
+    if trechos_data is not None:
+        return bool(trechos_data)
+    return PADRAO_TRECHOS_DATA.search(texto) is not None
+
+
+def _registrar(etapa, original, modificado):
+    if log_sanitizacao_datas and modificado != original:
+        print(f"✅ [{etapa}] Datas ajustadas")
+        print(f"   Original: {original}")
+        print(f"   Modificado: {modificado}")
+
+
+def _limpar_residuos(texto):
+    """Espaços e vírgulas que sobram depois de remover uma data"""
+    texto = _ESPACOS_MULTIPLOS.sub(' ', texto)
+    texto = _VIRGULA_INICIAL.sub('', texto)
+    texto = _ESPACOS_VIRGULA.sub(', ', texto)
+    return texto.strip()
+
+
+def remover_datas_passadas(texto_resumo, trechos_data=None):
+    """
+    Remove menções explícitas a datas de eventos no passado e mantém datas futuras
+    (verbos no futuro ou expressões como "previsto para", "deve ocorrer em").
+
+    Exemplos:
+    - Remove: "anunciou em 29/01/2026", "afirmou em 29 de janeiro", "em 29 de janeiro, a empresa lançou"
+    - Mantém: "previsto para 10 de fevereiro", "deve ocorrer em 11 de fevereiro"
+
+    trechos_data: resultado de encontrar_datas(texto_resumo), se já calculado
+    """
+    if not texto_resumo:
+        return texto_resumo
+
+    texto = texto_resumo
+    if _tem_datas(texto, trechos_data):
+        texto = _PASSADAS_BARRA.sub('', texto)
+        # Datas futuras ficam entre marcadores para não serem removidas pelas regras seguintes
+        texto = _PROTEGER_FUTURO.sub(r'__PROTEGER_DATA__\1 \2__FIM_PROTECAO__', texto)
+        texto = _PROTEGER_PROXIMO.sub(r'__PROTEGER_DATA__\1 \2 \3__FIM_PROTECAO__', texto)
+        # Verbo no passado + data (com vírgula opcional): "condenou, em 17 de setembro," -> "condenou"
+        texto = _VERBO_DATA.sub(r'\1', texto)
+        # Verbo no passado + "para" + data: a ação já ocorreu ("pautaram para 18 de setembro" -> "pautaram")
+        texto = _VERBO_PARA_DATA.sub(r'\1', texto)
+        texto = _PREPOSICAO_DATA.sub('', texto)
+        # "nesta quinta-feira (29)", "na última quinta-feira (29)"
+        texto = _DIA_SEMANA_NUMERO.sub('', texto)
+
+    texto = _VIRGULA_INICIAL.sub('', texto)
+    texto = _ESPACO_ANTES_VIRGULA.sub(',', texto)
+    texto = _VIRGULA_DUPLA.sub(',', texto)
+    texto = _ESPACOS_MULTIPLOS.sub(' ', texto)
+    texto = _PREPOSICAO_DUPLICADA.sub(r'\2', texto)
+    texto = texto.replace('__PROTEGER_DATA__', '').replace('__FIM_PROTECAO__', '').strip()
+
+    _registrar("REMOVER_DATAS_PASSADAS", texto_resumo, texto)
+    return texto
+
+
+def remover_datas_nao_presentes_no_original(texto_resumo, texto_original, trechos_data=None):
+    """
+    Remove datas mencionadas no resumo que NÃO estão presentes no texto original
+    (alucinações do modelo que inventa datas).
+    trechos_data: resultado de encontrar_datas(texto_resumo), se já calculado
+    """
+    if not texto_resumo or not texto_original:
+        return texto_resumo
+
+    texto = texto_resumo
+    if _tem_datas(texto, trechos_data):
+        datas_no_original = _datas_do_original(texto_original)
+        if log_sanitizacao_datas:
+            print(f"🔍 [REMOVER_DATAS_NAO_PRESENTES] Datas encontradas no original: {sorted(datas_no_original)}")
+
+        verificacoes = [
+            (_RE_DATA_BARRA_I, lambda m: m.group(0)),
+            (_RE_DATA_EXTENSO, lambda m: m.group(0)),
+            (_RE_DATA_COM_PREFIXO, lambda m: _RE_PREFIXO_DATA.sub('', m.group(0))),
+        ]
+        for padrao, extrator in verificacoes:
+            removidas = set()
+            for match in padrao.finditer(texto):
+                trecho = match.group(0)
+                if trecho in removidas or extrator(match) in datas_no_original:
+                    continue
+                removidas.add(trecho)
+                # Remove a data e a preposição associada (ex: "em 17 de setembro", "em 17 de setembro,")
+                texto = re.sub(_PREPOSICAO_OPCIONAL + re.escape(trecho) + r'(?:,)?', '', texto, flags=_I)
+
+    texto = _limpar_residuos(texto)
+    _registrar("REMOVER_DATAS_NAO_PRESENTES", texto_resumo, texto)
+    return texto
+
+
+def corrigir_datas_inventadas(texto_resumo, texto_original, trechos_data=None):
+    """
+    Corrige ou remove datas inventadas no resumo, preservando referências de mês sem dia.
+    trechos_data: resultado de encontrar_datas(texto_resumo), se já calculado
+    """
+    if not texto_resumo:
+        return texto_resumo
+
+    texto = texto_resumo
+    if _tem_datas(texto, trechos_data):
+        datas_originais = _datas_do_original(texto_original)
+        datas_originais_minusculas = {d.lower() for d in datas_originais}
+
+        def _substituir_dia_mes(match):
+            # Mantém se presente no original; senão tira o dia e conserva a referência ao mês ("em setembro")
+            if f"{match.group(1)} de {match.group(2)}".lower() in datas_originais_minusculas:
+                return match.group(0)
+            return match.group(2)
+
+        def _remover_data_completa(match):
+            # DD/MM/AAAA não presente no original
+            return match.group(0) if match.group(0) in datas_originais else ''
+
+        texto = _DIA_MES.sub(_substituir_dia_mes, texto)
+        texto = _RE_DATA_BARRA.sub(_remover_data_completa, texto)
+        # Dia da semana com dia do mês desconhecido (ex: 'sexta-feira, 23 de setembro')
+        texto = _DIA_SEMANA_DATA.sub('', texto)
+
+    texto = _limpar_residuos(texto)
+    _registrar("CORRIGIR_DATAS_INVENTADAS", texto_resumo, texto)
+    return texto
+
+
+def sanitizar_datas_resumo(texto_resumo, texto_original):
+    """Sequência aplicada aos resumos: datas inventadas, datas passadas, datas ausentes do original"""
+    trechos_data = encontrar_datas(texto_resumo)
+    texto = corrigir_datas_inventadas(texto_resumo, texto_original, trechos_data)
+    # As etapas seguintes recebem o texto já alterado: se o resumo não tinha datas, continua sem
+    # (só a limpeza de resíduos mexeu nele); se tinha, cada etapa procura de novo no texto atual
+    trechos_seguintes = [] if not trechos_data else None
+    texto = remover_datas_passadas(texto, trechos_seguintes)
+    return remover_datas_nao_presentes_no_original(texto, texto_original, trechos_seguintes)
+
+
+if __name__ == "__main__":
+    original = (
+        "A empresa anunciou nesta quinta-feira (29) um investimento de R$ 2 bilhões. Segundo o comunicado "
+        "publicado em 29 de janeiro de 2026, as obras começam no próximo dia 10 de fevereiro e a inauguração "
+        "está prevista para 11 de fevereiro. " * 20
+    )
+    resumos = {
+        "sem datas": "A empresa anunciou investimento de R$ 2 bilhões em nova fábrica, com 1.500 empregos diretos.",
+        "com datas": "A empresa anunciou, em 29 de janeiro, investimento de R$ 2 bilhões. As obras começam no "
+                     "próximo dia 10 de fevereiro; a reunião de 03/02/2026 aprovou o plano e a inauguração está "
+                     "prevista para 11 de fevereiro. O conselho decidiu nesta quinta-feira (29) manter a meta.",
+    }
+    repeticoes = 2000
+    for nome, resumo in resumos.items():
+        sanitizar_datas_resumo(resumo, original)
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            resultado = sanitizar_datas_resumo(resumo, original)
+        decorrido = time.perf_counter() - inicio
+        print(f"⏱️ {nome:10} {decorrido / repeticoes * 1e6:8.1f} µs por resumo ({repeticoes} repetições)")
+        print(f"   {resultado}")
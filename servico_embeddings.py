@@ -0,0 +1,177 @@
+# ============================================================================
+# SERVIÇO COMPARTILHADO DE EMBEDDINGS
+# ============================================================================
+# Arquivo: servico_embeddings.py
+# Descrição: Carrega o modelo sentence-transformers uma única vez por processo,
+#            no primeiro uso, opcionalmente em ONNX (com ou sem quantização
+#            int8) para inferência em CPU. encode() trabalha em lotes e guarda
+#            os vetores num cache SQLite indexado pelo hash do texto, de modo
+#            que textos repetidos entre execuções não são recalculados.
+#            As dependências são opcionais (requirements-ml.txt) e só são
+#            importadas na carga do modelo, não na importação deste módulo.
+# ============================================================================
+
+import hashlib
+import importlib.util
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+from config import modelo_embeddings, backend_embeddings, tamanho_lote_embeddings, \
+    cache_embeddings_ativo, arq_cache_embeddings
+
+# Só verifica se o pacote está instalado: importar sentence-transformers carrega o torch,
+# o que fica para a primeira carga do modelo (_obter_modelo)
+EMBEDDINGS_DISPONIVEIS = importlib.util.find_spec("sentence_transformers") is not None
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+
+
+def chave_texto(modelo, texto):
+    """Hash do texto junto do nome do modelo (vetores de modelos diferentes não se misturam)"""
+    return hashlib.sha1(f"{modelo}\n{texto}".encode("utf-8", "ignore")).hexdigest()
+
+
+class CacheEmbeddings:
+    """Cache SQLite thread-safe de vetores (float32) por hash de texto"""
+
+    def __init__(self, arquivo=arq_cache_embeddings):
+        self.arquivo = arquivo
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(os.path.dirname(arquivo) or ".", exist_ok=True)
+        self._conexao = sqlite3.connect(arquivo, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("CREATE TABLE IF NOT EXISTS vetores (chave TEXT PRIMARY KEY, vetor BLOB NOT NULL)")
+        self._conexao.commit()
+
+    def obter(self, chaves):
+        """{chave: vetor} das chaves encontradas"""
+        encontrados = {}
+        with self._lock:
+            for inicio in range(0, len(chaves), 500):
+                bloco = chaves[inicio:inicio + 500]
+                marcadores = ",".join("?" * len(bloco))
+                for chave, vetor in self._conexao.execute(
+                        f"SELECT chave, vetor FROM vetores WHERE chave IN ({marcadores})", bloco):
+                    encontrados[chave] = np.frombuffer(vetor, dtype=np.float32)
+            self.hits += len(encontrados)
+            self.misses += len(set(chaves)) - len(encontrados)
+        return encontrados
+
+    def gravar(self, chaves, vetores):
+        with self._lock:
+            self._conexao.executemany(
+                "INSERT OR REPLACE INTO vetores (chave, vetor) VALUES (?, ?)",
+                [(c, np.asarray(v, dtype=np.float32).tobytes()) for c, v in zip(chaves, vetores)]
+            )
+            self._conexao.commit()
+
+
+class ServicoEmbeddings:
+    """
+    Args:
+        modelo: nome do modelo sentence-transformers
+        backend: "torch", "onnx" ou "onnx-int8" (ONNX quantizado dinamicamente para CPU)
+        tamanho_lote: textos por chamada ao modelo
+        cache: CacheEmbeddings (None desliga o cache em disco)
+    """
+
+    def __init__(self, modelo=modelo_embeddings, backend=backend_embeddings,
+                 tamanho_lote=tamanho_lote_embeddings, cache=None):
+        if backend not in BACKENDS:
+            raise ValueError(f"backend_embeddings inválido: {backend} (use um de {BACKENDS})")
+        self.modelo = modelo
+        self.backend = backend
+        self.tamanho_lote = tamanho_lote
+        self.cache = cache
+        self._modelo = None
+        self._lock = threading.Lock()
+
+    def _carregar_onnx(self, quantizar):
+        """Exporta o modelo para ONNX (e, se pedido, quantiza em int8) na primeira carga"""
+        from sentence_transformers import SentenceTransformer
+        modelo = SentenceTransformer(self.modelo, device="cpu", backend="onnx")
+        if not quantizar:
+            return modelo
+
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+        pasta = os.path.join("dados", "modelos", self.modelo.replace("/", "__"))
+        arquivo_int8 = os.path.join("onnx", "model_qint8_avx2.onnx")
+        if not os.path.exists(os.path.join(pasta, arquivo_int8)):
+            modelo.save_pretrained(pasta)
+            export_dynamic_quantized_onnx_model(modelo, "avx2", pasta)
+        return SentenceTransformer(pasta, device="cpu", backend="onnx", model_kwargs={"file_name": arquivo_int8})
+
+    def _obter_modelo(self):
+        """Modelo carregado uma única vez (None se sentence-transformers não estiver instalado ou não importar)"""
+        if not EMBEDDINGS_DISPONIVEIS:
+            return None
+        with self._lock:
+            if self._modelo is None:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                except ImportError as e:
+                    print(f"⚠️ sentence-transformers instalado mas não importável ({e}). Agrupamento sem embeddings.")
+                    return None
+                print(f"🧠 Carregando modelo de embeddings '{self.modelo}' (backend {self.backend})...")
+                if self.backend == "torch":
+                    self._modelo = SentenceTransformer(self.modelo, device="cpu")
+                else:
+                    try:
+                        self._modelo = self._carregar_onnx(quantizar=self.backend == "onnx-int8")
+                    except Exception as e:
+                        # optimum/onnxruntime ausentes ou exportação falhou: segue em PyTorch
+                        print(f"⚠️ Backend {self.backend} indisponível ({e}). Usando PyTorch.")
+                        self._modelo = SentenceTransformer(self.modelo, device="cpu")
+            return self._modelo
+
+    def encode(self, textos):
+        """
+        Embeddings normalizados (norma 1), um por texto, em matriz float32.
+        Retorna None se o modelo não estiver disponível.
+        """
+        textos = ["" if t is None else str(t) for t in textos]
+        if not EMBEDDINGS_DISPONIVEIS:
+            return None
+
+        chaves = [chave_texto(self.modelo, t) for t in textos]
+        salvos = self.cache.obter(list(set(chaves))) if self.cache is not None and chaves else {}
+
+        # Textos faltantes, sem repetição, calculados em lotes
+        faltantes = {}
+        for chave, texto in zip(chaves, textos):
+            if chave not in salvos:
+                faltantes.setdefault(chave, texto)
+        if faltantes:
+            modelo = self._obter_modelo()
+            if modelo is None:
+                return None
+            novos = modelo.encode(list(faltantes.values()), batch_size=self.tamanho_lote,
+                                  normalize_embeddings=True, convert_to_numpy=True)
+            novos = np.asarray(novos, dtype=np.float32)
+            salvos.update(zip(faltantes.keys(), novos))
+            if self.cache is not None:
+                self.cache.gravar(list(faltantes.keys()), novos)
+
+        if not chaves:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.vstack([salvos[c] for c in chaves])
+
+
+_servico = None
+_lock_servico = threading.Lock()
+
+
+def obter_servico_embeddings():
+    """Serviço compartilhado pelo processo (o modelo só é carregado no primeiro encode)"""
+    global _servico
+    with _lock_servico:
+        if _servico is None:
+            cache = CacheEmbeddings() if cache_embeddings_ativo else None
+            _servico = ServicoEmbeddings(cache=cache)
+        return _servico
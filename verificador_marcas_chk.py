@@ -13,6 +13,8 @@ from docx.shared import Pt, RGBColor
 from docx.oxml.shared import OxmlElement
 from docx.oxml.ns import qn
 
+from cliente_deepseek import obter_cliente_deepseek
+
 # ==============================================================================
 # CONFIGURAÇÕES
 # ==============================================================================
@@ -110,10 +112,6 @@ def _chamar_deepseek(prompt, chave_api, url_api, temperatura=0.3, max_tokens=900
     Faz uma chamada à API DeepSeek e retorna o texto da resposta.
     Lança exceção em caso de falha.
     """
-    headers = {
-        "Authorization": f"Bearer {chave_api}",
-        "Content-Type": "application/json"
-    }
     payload = {
         "model": "deepseek-chat",
         "messages": [{"role": "user", "content": prompt}],
@@ -121,9 +119,8 @@ def _chamar_deepseek(prompt, chave_api, url_api, temperatura=0.3, max_tokens=900
         "max_tokens": max_tokens
     }
 
-    resp = requests.post(url_api, headers=headers, json=payload, timeout=90)
-    resp.raise_for_status()
-    return resp.json()["choices"][0]["message"]["content"].strip()
+    # Cliente compartilhado: conexões persistentes, limite de taxa e cache (se temperatura 0)
+    return obter_cliente_deepseek(chave_api, url_api).conteudo(payload, timeout=90)
 
 
 # ==============================================================================
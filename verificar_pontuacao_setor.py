@@ -0,0 +1,178 @@
+# ============================================================================
+# VERIFICAÇÃO DE REGRESSÃO DA PONTUAÇÃO DE SETOR
+# ============================================================================
+# Arquivo: verificar_pontuacao_setor.py
+# Descrição: Compara, num corpus fixo, a pontuação vetorizada de
+#            prompts_setor.pontuar_relevancia (RelevanceScore,
+#            TemaPreponderante, TemBonusTitulo) com a pontuação antiga linha a
+#            linha (calculate_relevance_score / verificar_bonus_titulo,
+#            reproduzidas abaixo como referência), e as contagens do
+#            ContadorTermos (matcher_termos.py) com re.findall por tema. Confere
+#            também o bônus de veículo prioritário dado por uma cópia da matéria.
+#            Uso: python verificar_pontuacao_setor.py   (código de saída 1 se divergir)
+# ============================================================================
+
+import contextlib
+import io
+import random
+import re
+import sys
+from collections import Counter
+
+import pandas as pd
+
+from matcher_termos import ContadorTermos
+from prompts_setor import TEMAS_TERMOS, TERMOS_BONUS_TITULO, VEICULOS_PRIORITARIOS, PONTUACAO_EXTRA_VEICULO, \
+    pontuar_relevancia
+
+# Notícias com os casos delicados: termos com prefixo comum, termos de várias palavras,
+# acentos, pontuação nas fronteiras, título vazio/nulo e IdVeiculo em formatos diferentes
+CORPUS_FIXO = [
+    {"Titulo": "Suzano e Klabin ampliam exportação de celulose", "Conteudo": "A Suzano anunciou nova fábrica de celulose de eucalipto.", "IdVeiculo": 331},
+    {"Titulo": "Inflação e juros", "Conteudo": "O Banco Central manteve os juros; a inflação de serviços segue alta.", "IdVeiculo": 10459},
+    {"Titulo": "Lula e Tarcísio", "Conteudo": "O presidente Lula e o governador Tarcísio discutiram a reforma tributária.", "IdVeiculo": "675"},
+    {"Titulo": None, "Conteudo": "Flamengo vence o Palmeiras e segue líder; Corinthians empata.", "IdVeiculo": 682.0},
+    {"Titulo": "", "Conteudo": "", "IdVeiculo": None},
+    {"Titulo": "Carne bovina e frango", "Conteudo": "Exportações de carne bovina, carnes suínas e frango crescem; ABPA comemora.", "IdVeiculo": "abc"},
+    {"Titulo": "Sem termos", "Conteudo": "Texto neutro sem nenhum termo dos temas, apenas palavras comuns.", "IdVeiculo": 1},
+    {"Titulo": "PT e Drex", "Conteudo": "pt-br: o Drex, real digital, e o PT. Papel-moeda; papelaria; papel.", "IdVeiculo": 675},
+    {"Titulo": "COP30 na Amazônia", "Conteudo": "A COP30 discutirá política climática, efeito estufa e gases poluentes na Amazônia.", "IdVeiculo": 10459.0},
+    {"Titulo": "Ex-presidente no STF", "Conteudo": "O ex-presidente foi julgado pelo Supremo; o judiciário decidiu pela condenação.", "IdVeiculo": 331},
+]
+
+
+def _corpus_sintetico(quantidade=300, semente=42):
+    """Textos montados com termos reais dos temas (colados, repetidos e com pontuação), sempre os mesmos"""
+    gerador = random.Random(semente)
+    termos = [t for lista in TEMAS_TERMOS.values() for t in lista] + TERMOS_BONUS_TITULO
+    separadores = [" ", " ", ", ", ". ", "-", "", "/", " e ", "\n"]
+    noticias = []
+    for i in range(quantidade):
+        partes = [gerador.choice(termos) for _ in range(gerador.randint(0, 25))]
+        conteudo = "".join(p + gerador.choice(separadores) for p in partes)
+        titulo = " ".join(gerador.choice(termos) for _ in range(gerador.randint(0, 4)))
+        noticias.append({"Titulo": titulo.title() if i % 3 == 0 else titulo, "Conteudo": conteudo,
+                         "IdVeiculo": gerador.choice([331, 675, "10459", 682.0, None, "x"])})
+    return noticias
+
+
+def _pontuacao_referencia(texto, id_veiculo):
+    """Pontuação antiga por linha (calculate_relevance_score, sem o bônus de página que nunca foi aplicado)"""
+    texto_lower = texto.lower()
+    contagens = Counter()
+    total = 0
+    for tema, termos in TEMAS_TERMOS.items():
+        padrao = r'\b(?:' + '|'.join(re.escape(termo) for termo in termos) + r')\b'
+        contagens[tema] = len(re.findall(padrao, texto_lower))
+        total += contagens[tema]
+    com_termos = {tema: n for tema, n in contagens.items() if n > 0}
+    tema = max(com_termos, key=com_termos.get) if com_termos else None
+
+    if id_veiculo is not None:
+        try:
+            vid = int(id_veiculo)
+        except Exception:
+            vid = id_veiculo
+        if vid in VEICULOS_PRIORITARIOS:
+            total += PONTUACAO_EXTRA_VEICULO
+    return total, tema
+
+
+def _bonus_titulo_referencia(titulo):
+    """verificar_bonus_titulo antiga: uma regex por termo"""
+    if pd.isna(titulo):
+        return False
+    titulo_lower = titulo.lower()
+    return any(re.search(r'\b' + re.escape(termo.lower()) + r'\b', titulo_lower) for termo in TERMOS_BONUS_TITULO)
+
+
+def verificar_pontuacao(noticias):
+    """Lista de divergências entre pontuar_relevancia e a pontuação de referência"""
+    df = pd.DataFrame(noticias)
+    df['TextoCompleto'] = df['Titulo'].fillna('') + '. ' + df['Conteudo'].fillna('')
+    with contextlib.redirect_stdout(io.StringIO()):
+        novo = pontuar_relevancia(df.copy())
+
+    divergencias = []
+    for i, row in df.iterrows():
+        score, tema = _pontuacao_referencia(row['TextoCompleto'], row['IdVeiculo'])
+        bonus = _bonus_titulo_referencia(row['Titulo'])
+        score += 100 if bonus else 0
+        obtido = (int(novo.at[i, 'RelevanceScore']), novo.at[i, 'TemaPreponderante'], bool(novo.at[i, 'TemBonusTitulo']))
+        if obtido != (score, tema, bonus):
+            divergencias.append((i, obtido, (score, tema, bonus)))
+    return divergencias
+
+
+def verificar_contador_termos(textos, temas_termos=TEMAS_TERMOS):
+    """Lista de divergências entre ContadorTermos.contar e len(re.findall) por tema"""
+    contador = ContadorTermos(temas_termos)
+    padroes = {tema: re.compile(r'\b(?:' + '|'.join(re.escape(t) for t in termos) + r')\b')
+               for tema, termos in temas_termos.items()}
+    divergencias = []
+    for texto in textos:
+        esperado = {tema: len(padrao.findall(texto)) for tema, padrao in padroes.items()}
+        obtido = contador.contar(texto)
+        if obtido != esperado:
+            divergencias.append((texto[:80], obtido, esperado))
+    return divergencias
+
+
+# Temas pequenos com sobreposições que a alternância da regex resolve de forma particular
+TEMAS_SOBREPOSTOS = {
+    "A": ["papel", "papel moeda", "papelaria", "pa"],
+    "B": ["moeda", "papel moeda", "real digital", "real"],
+    "C": ["c++", "c", "a.b", "-x-"],
+    "D": ["ação", "ações", "são paulo", "são"],
+}
+TEXTOS_SOBREPOSTOS = [
+    "papel moeda e papelaria; papel-moeda, papa, pa.",
+    "real digital, realidade, real, reais e moeda moedas",
+    "c++ c c+ a.b a-b -x- x-x--x-",
+    "ações da ação em são paulo; são-paulinos; sãopaulo",
+    "", "   ", "papel", "pa pa pa", "_papel_ papel_ _papel",
+]
+
+
+def verificar_bonus_copias():
+    """Bônus de veículo prioritário quando só uma cópia da matéria (IdsVeiculosCopias) é de veículo prioritário"""
+    casos = [  # (IdVeiculo do representante, IdsVeiculosCopias, recebe o bônus)
+        (331, "331,675", True),
+        (331, "331,10459.0", True),
+        (675, "675", True),
+        (331, "331,682", False),
+        (None, "nan", False),
+    ]
+    df = pd.DataFrame({"Titulo": "Sem termos", "Conteudo": "", "TextoCompleto": "",
+                       "IdVeiculo": [c[0] for c in casos], "IdsVeiculosCopias": [c[1] for c in casos]})
+    with contextlib.redirect_stdout(io.StringIO()):
+        novo = pontuar_relevancia(df)
+    return [(ids, int(obtido)) for (_, ids, bonus), obtido in zip(casos, novo['RelevanceScore'])
+            if obtido != (PONTUACAO_EXTRA_VEICULO if bonus else 0)]
+
+
+if __name__ == "__main__":
+    noticias = CORPUS_FIXO + _corpus_sintetico()
+    textos = [(n["Titulo"] or "") + ". " + n["Conteudo"] for n in noticias]
+
+    falhas = 0
+    resultado = verificar_contador_termos([t.lower() for t in textos])
+    resultado += verificar_contador_termos(TEXTOS_SOBREPOSTOS, TEMAS_SOBREPOSTOS)
+    print(f"{'✅' if not resultado else '❌'} ContadorTermos x re.findall: "
+          f"{len(textos) + len(TEXTOS_SOBREPOSTOS)} textos, {len(resultado)} divergência(s)")
+    for divergencia in resultado[:5]:
+        print(f"   {divergencia}")
+    falhas += len(resultado)
+
+    resultado = verificar_pontuacao(noticias)
+    print(f"{'✅' if not resultado else '❌'} pontuar_relevancia x pontuação linha a linha: "
+          f"{len(noticias)} notícias, {len(resultado)} divergência(s)")
+    for divergencia in resultado[:5]:
+        print(f"   {divergencia}")
+    falhas += len(resultado)
+
+    resultado = verificar_bonus_copias()
+    print(f"{'✅' if not resultado else '❌'} Bônus de veículo prioritário pelas cópias: {len(resultado)} divergência(s)")
+    falhas += len(resultado)
+
+    sys.exit(1 if falhas else 0)